@@ -0,0 +1,60 @@
+"""
+Lazy attribute loading for the analyst packages.
+
+The packages re-export functions from their submodules, but importing every
+submodule up front pulls in strands, boto3, PyMuPDF and the HTML libraries
+even for `sitemeta --help`. lazy_exports() makes a package import a submodule
+only when one of its names is first accessed (PEP 562).
+"""
+
+import importlib
+import sys
+import types
+from typing import Dict, Tuple
+
+
+class _LazyPackage(types.ModuleType):
+    """Package module that loads its exported names on first access."""
+
+    def __getattr__(self, name: str):
+        exports = self.__dict__.get('_lazy_exports', {})
+        if name not in exports:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+        submodule, attribute = exports[name]
+        module = importlib.import_module(submodule, self.__name__)
+        if isinstance(module, _LazyPackage):
+            # Re-exported from another lazy package: load only this name
+            self.__dict__[name] = getattr(module, attribute)
+        else:
+            # The module is loaded now, so bind everything it provides
+            for export, (source, source_attribute) in exports.items():
+                if source == submodule:
+                    self.__dict__[export] = getattr(module, source_attribute)
+        return self.__dict__[name]
+
+    def __setattr__(self, name: str, value) -> None:
+        # Importing a submodule binds it on the package. Where a function has
+        # the same name as its module (tools.fetch_url_metadata,
+        # agents.sitemeta), keep the function, like the eager imports did.
+        exports = self.__dict__.get('_lazy_exports', {})
+        if (name in exports and isinstance(value, types.ModuleType)
+                and value.__name__ == self.__name__ + exports[name][0]):
+            value = getattr(value, exports[name][1])
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__dict__.get('_lazy_exports', {})))
+
+
+def lazy_exports(package_name: str, exports: Dict[str, Tuple[str, str]]) -> None:
+    """
+    Make a package load its exported names on first access.
+
+    Args:
+        package_name: __name__ of the package
+        exports: Exported name -> (relative submodule, attribute in the submodule)
+    """
+    module = sys.modules[package_name]
+    module.__class__ = _LazyPackage
+    module.__dict__['_lazy_exports'] = dict(exports)
@@ -1,28 +1,41 @@
 """
 Agents module - Contains various AI agents for different analysis tasks.
+
+Agents are imported on first access, so each entry point only loads the agent
+it runs.
 """
 
-from .sitemeta import create_sitemeta_agent, sitemeta, print_result_metrics
-from .news import create_news_agent, news
-from .news import print_result_metrics as news_print_result_metrics
-from .get_article import create_get_article_agent, get_article
-from .get_article import print_result_metrics as get_article_print_result_metrics
-from .html_to_markdown import create_html_to_markdown_agent, html_to_markdown
-from .html_to_markdown import print_result_metrics as html_to_markdown_print_result_metrics
-from .chat import (
-    create_chat_agent, 
-    chat_with_agent, 
-    get_session_info,
-    get_model_warmup_status,
-    update_model_configuration,
-    analyze_message_complexity
-)
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "create_sitemeta_agent": (".sitemeta", "create_sitemeta_agent"),
+    "sitemeta": (".sitemeta", "sitemeta"),
+    "sitemeta_async": (".sitemeta", "sitemeta_async"),
+    "print_result_metrics": (".sitemeta", "print_result_metrics"),
+    "create_news_agent": (".news", "create_news_agent"),
+    "news": (".news", "news"),
+    "news_async": (".news", "news_async"),
+    "news_print_result_metrics": (".news", "print_result_metrics"),
+    "create_get_article_agent": (".get_article", "create_get_article_agent"),
+    "get_article": (".get_article", "get_article"),
+    "get_article_async": (".get_article", "get_article_async"),
+    "summarize_article": (".get_article", "summarize_article"),
+    "get_article_print_result_metrics": (".get_article", "print_result_metrics"),
+    "create_html_to_markdown_agent": (".html_to_markdown", "create_html_to_markdown_agent"),
+    "html_to_markdown": (".html_to_markdown", "html_to_markdown"),
+    "html_to_markdown_async": (".html_to_markdown", "html_to_markdown_async"),
+    "html_to_markdown_print_result_metrics": (".html_to_markdown", "print_result_metrics"),
+    "create_chat_agent": (".chat", "create_chat_agent"),
+    "chat_with_agent": (".chat", "chat_with_agent"),
+    "chat_with_agent_async": (".chat", "chat_with_agent_async"),
+    "agent_with_model": (".chat", "agent_with_model"),
+    "stream_chat_with_agent": (".chat", "stream_chat_with_agent"),
+    "get_session_info": (".chat", "get_session_info"),
+    "get_model_warmup_status": (".chat", "get_model_warmup_status"),
+    "update_model_configuration": (".chat", "update_model_configuration"),
+    "analyze_message_complexity": (".chat", "analyze_message_complexity"),
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    "create_sitemeta_agent", "sitemeta", "print_result_metrics",
-    "create_news_agent", "news", "news_print_result_metrics",
-    "create_get_article_agent", "get_article", "get_article_print_result_metrics",
-    "create_html_to_markdown_agent", "html_to_markdown", "html_to_markdown_print_result_metrics",
-    "create_chat_agent", "chat_with_agent", "get_session_info",
-    "get_model_warmup_status", "update_model_configuration", "analyze_message_complexity"
-]
\ No newline at end of file
+lazy_exports(__name__, _EXPORTS)
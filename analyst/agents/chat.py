@@ -1,36 +1,48 @@
+import asyncio
+import contextlib
+import copy
+import threading
 import uuid
 import os
-import importlib
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from strands import Agent
 from strands.models.bedrock import BedrockModel
 from strands.session.file_session_manager import FileSessionManager
 
-# Import shell wrapper to suppress multi-threading warnings
-try:
-    from ..utils.shell_wrapper import setup_shell_environment
-    setup_shell_environment()
-except ImportError:
-    pass
 from ..tools import (
     fetch_url_metadata,
+    fetch_url_metadata_async,
     fetch_rss_content, 
+    fetch_rss_content_async,
     download_article_content,
+    download_article_content_async,
     convert_html_to_markdown,
     pdf_to_markdown,
     download_pdf_to_markdown,
+    summarize_document,
     speak_custom,
     save_file,
     save_file_smart,
     http_request_custom,
+    http_request_custom_async,
     python_repl_custom
 )
-from ..config import get_config, get_bedrock_config_for_agent, get_community_tools_for_agent
+from ..config import get_config, get_bedrock_config_for_agent, get_bedrock_cache_options, get_community_tools_for_agent
 from ..utils import configure_logging, print_metrics
-from ..utils.dynamic_model_config import get_dynamic_model_manager, create_optimized_model
+from ..utils.shell_wrapper import setup_shell_environment
+from ..utils.community_tools import load_community_tools
+from ..utils.dynamic_model_config import get_dynamic_model_manager
+from ..utils.bedrock_client import get_bedrock_client_options
+from ..utils.rate_limiter import rate_limited
+from ..utils.usage_ledger import usage_hooks
+from ..utils.tracing import trace_hooks, trace_model
+from ..utils.metrics_endpoint import metrics_hooks, metrics_model, track_session
 from ..utils.tool_output_display import wrap_tools_with_enhanced_output, get_tool_output_config
-from ..utils.enhanced_callback_handler import enhanced_callback_handler
-from ..utils.model_provider_factory import get_model_factory, get_active_provider, get_provider_display_info
+from ..utils.enhanced_callback_handler import create_callback_handler
+from ..utils.conversation_manager import TokenAwareConversationManager
+from ..utils.model_provider_factory import (
+    get_model_factory, get_active_provider, get_provider_display_info, apply_execution_policy
+)
 
 
 def _load_community_tools(agent_name: str = "chat") -> List:
@@ -41,7 +53,7 @@ def _load_community_tools(agent_name: str = "chat") -> List:
         agent_name: Name of the agent to get tools for
         
     Returns:
-        List of enabled community tool functions
+        List of enabled community tools (lazy proxies)
     """
     tools = []
     tools_config = get_community_tools_for_agent(agent_name)
@@ -66,111 +78,8 @@ def _load_community_tools(agent_name: str = "chat") -> List:
         # Use the direct list of enabled tools if specified
         tools_config["tools"] = enabled_tools_list
     
-    # Tool module mapping - maps tool names to their strands_tools modules
-    tool_module_mapping = {
-        # RAG & Memory
-        "retrieve": "strands_tools.retrieve",
-        "memory": "strands_tools.memory",
-        "agent_core_memory": "strands_tools.agent_core_memory",
-        "mem0_memory": "strands_tools.mem0_memory",
-        
-        # File Operations
-        "editor": "strands_tools.editor",
-        "file_read": "strands_tools.file_read",
-        
-        # Shell & System
-        "environment": "strands_tools.environment",
-        "shell": "strands_tools.shell",
-        "cron": "strands_tools.cron",
-        "use_computer": "strands_tools.use_computer",
-        
-        # Code Interpretation
-        "code_interpreter": "strands_tools.code_interpreter",
-        
-        # Web & Network
-        "slack": "strands_tools.slack",
-        "browser": "strands_tools.browser",
-        "rss": "strands_tools.rss",
-        
-        # Multi-modal
-        "generate_image_stability": "strands_tools.generate_image_stability",
-        "image_reader": "strands_tools.image_reader",
-        "generate_image": "strands_tools.generate_image",
-        "nova_reels": "strands_tools.nova_reels",
-        "diagram": "strands_tools.diagram",
-        
-        # AWS Services
-        "use_aws": "strands_tools.use_aws",
-        
-        # Utilities
-        "calculator": "strands_tools.calculator",
-        "current_time": "strands_tools.current_time",
-        "load_tool": "strands_tools.load_tool",
-        "sleep": "strands_tools.sleep",
-        
-        # Agents & Workflows
-        "graph": "strands_tools.graph",
-        "agent_graph": "strands_tools.agent_graph",
-        "journal": "strands_tools.journal",
-        "swarm": "strands_tools.swarm",
-        "stop": "strands_tools.stop",
-        "handoff_to_user": "strands_tools.handoff_to_user",
-        "use_agent": "strands_tools.use_agent",
-        "think": "strands_tools.think",
-        "use_llm": "strands_tools.use_llm",
-        "workflow": "strands_tools.workflow",
-        "batch": "strands_tools.batch",
-        "a2a_client": "strands_tools.a2a_client"
-    }
-    
-    # Priority tools that should be loaded first (to ensure they get registered)
-    priority_tools = ["diagram", "nova_reels", "generate_image", "use_computer", "browser"]
-    
-    # Load priority tools first
-    tools_to_load = []
-    remaining_tools = []
-    
-    for tool_name in tools_config["tools"]:
-        if tool_name in priority_tools:
-            tools_to_load.append(tool_name)
-        else:
-            remaining_tools.append(tool_name)
-    
-    # Add remaining tools after priority ones
-    tools_to_load.extend(remaining_tools)
-    
-    # Load each enabled tool in priority order
-    for tool_name in tools_to_load:
-        if tool_name in tool_module_mapping:
-            try:
-                module_path = tool_module_mapping[tool_name]
-                module = importlib.import_module(module_path)
-                
-                # Try to get the tool function from the module
-                if hasattr(module, tool_name):
-                    tool_func = getattr(module, tool_name)
-                    tools.append(tool_func)
-                else:
-                    # Some tools might have different function names
-                    # Look for common patterns
-                    for attr_name in dir(module):
-                        if not attr_name.startswith('_') and callable(getattr(module, attr_name)):
-                            # Check if it has a docstring (likely a tool function)
-                            attr = getattr(module, attr_name)
-                            if hasattr(attr, '__doc__') and attr.__doc__:
-                                tools.append(attr)
-                                break
-                
-            except ImportError as e:
-                # Silently skip tools that aren't installed - they may require extras
-                continue
-            except Exception as e:
-                # Only log unexpected errors
-                if "module" not in str(e).lower():
-                    print(f"Warning: Error loading community tool '{tool_name}': {e}")
-                continue
-    
-    return tools
+    # Register the tools as proxies; each tool is imported on its first call
+    return load_community_tools(tools_config["tools"])
 
 
 def _generate_system_prompt_with_tools(available_tools: List, community_tools: List) -> str:
@@ -191,6 +100,7 @@ Built-in Analysis Capabilities:
 - RSS feed analysis: Fetch and analyze RSS feeds and news content  
 - Article downloading: Download full articles with images and convert to various formats
 - HTML to Markdown conversion: Convert HTML content to well-formatted Markdown
+- Long document summarization: Summarize long articles, reports and PDFs saved locally with summarize_document (faster than reading the whole document)
 - Text-to-speech: Convert text to speech using macOS say command or Amazon Polly
 - File saving: Save content to files using save_file or save_file_smart tools (smart tool auto-organizes by type)
 - HTTP requests: Make API calls with http_request_custom tool (supports auth, headers, JSON)
@@ -240,8 +150,10 @@ Always be helpful, clear, and suggest the best tools for the user's needs. If a
     for tool in community_tools:
         tool_name = None
         
-        # Try to get tool name from __name__ attribute first
-        if hasattr(tool, '__name__'):
+        # Community tool proxies carry their configured name
+        if hasattr(tool, 'module_path'):
+            tool_name = tool.name
+        elif hasattr(tool, '__name__'):
             tool_name = tool.__name__
         elif hasattr(tool, '__module__'):
             module_parts = tool.__module__.split('.')
@@ -285,10 +197,13 @@ Some tools (like shell, file_write, editor) may require user consent before exec
 def create_chat_agent(
     session_id: Optional[str] = None,
     session_dir: str = "refer/chat-sessions",
-    window_size: int = 20,
+    window_size: Optional[int] = None,
     enable_logging: bool = None,
     dynamic_model_selection: bool = True,
-    use_model_factory: bool = True
+    use_model_factory: bool = True,
+    max_context_tokens: Optional[int] = None,
+    summarize_evicted: Optional[bool] = None,
+    async_tools: bool = False
 ) -> Agent:
     """
     Create and return a chat agent configured for multi-turn conversations.
@@ -296,24 +211,36 @@ def create_chat_agent(
     Args:
         session_id: Optional session ID. If None, generates a new UUID.
         session_dir: Directory to store chat sessions (default: refer/chat-sessions)
-        window_size: Size of the conversation window (default: 20 messages)
+        window_size: Maximum number of messages kept in context. Uses config default if None.
         enable_logging: Enable logging. Uses config default if None.
         dynamic_model_selection: Enable dynamic model selection based on task complexity (default: True)
         use_model_factory: Enable multi-provider model factory (default: True)
+        max_context_tokens: Token budget for conversation history (0 = no limit). Uses config default if None.
+        summarize_evicted: Summarize turns evicted from the window in the background. Uses config default if None.
+        async_tools: Use the async network tools, for agents driven by chat_with_agent_async
     
     Returns:
         Configured Agent instance with session management and dynamic model capabilities
     """
     # Respect user security preferences - DO NOT automatically bypass consent
     
+    # Suppress multi-threading shell warnings before any tool runs
+    setup_shell_environment()
+    
     # Generate session ID if not provided
     if session_id is None:
         session_id = str(uuid.uuid4())
     
-    # Configure logging if specified
+    # Configure logging and conversation window defaults if not specified
+    config = get_config()
     if enable_logging is None:
-        config = get_config()
         enable_logging = config.get_logging_enabled()
+    if window_size is None:
+        window_size = config.get_chat_window_size()
+    if max_context_tokens is None:
+        max_context_tokens = config.get_chat_max_context_tokens()
+    if summarize_evicted is None:
+        summarize_evicted = config.get_chat_summarize_evicted()
     
     if enable_logging:
         configure_logging(verbose=False)
@@ -346,12 +273,14 @@ def create_chat_agent(
                 max_tokens=bedrock_config['max_tokens'],
                 stop_sequences=bedrock_config['stop_sequences'],
                 streaming=bedrock_config['streaming'],
-                region_name=bedrock_config['region_name']
+                **get_bedrock_client_options(bedrock_config['region_name'], session_id=session_id),
+                **get_bedrock_cache_options(bedrock_config['model_id'])
             )
             
             # Add optional features if configured
             if bedrock_config['guardrail_id']:
                 model.guardrail_id = bedrock_config['guardrail_id']
+            model = apply_execution_policy(model, 'chat', model_id=bedrock_config['model_id'])
     
     # Set up session management for conversation persistence
     session_manager = FileSessionManager(
@@ -364,16 +293,17 @@ def create_chat_agent(
     
     # Combine built-in tools with community tools
     built_in_tools = [
-        fetch_url_metadata,
-        fetch_rss_content,
-        download_article_content,
+        fetch_url_metadata_async if async_tools else fetch_url_metadata,
+        fetch_rss_content_async if async_tools else fetch_rss_content,
+        download_article_content_async if async_tools else download_article_content,
         convert_html_to_markdown,
         pdf_to_markdown,  # Convert local PDF files to markdown
         download_pdf_to_markdown,  # Download and convert PDF URLs to markdown
+        summarize_document,  # Parallel map-reduce summarization of long documents
         speak_custom,
         save_file,
         save_file_smart,  # Enhanced file saving with smart directory selection
-        http_request_custom,
+        http_request_custom_async if async_tools else http_request_custom,
         python_repl_custom
     ]
     
@@ -401,22 +331,34 @@ def create_chat_agent(
                 max_tokens=bedrock_config['max_tokens'],
                 stop_sequences=bedrock_config['stop_sequences'],
                 streaming=bedrock_config['streaming'],
-                region_name=bedrock_config['region_name']
+                **get_bedrock_client_options(bedrock_config['region_name'], session_id=session_id),
+                **get_bedrock_cache_options(bedrock_config['model_id'])
             )
+            model = apply_execution_policy(model, 'chat', model_id=bedrock_config['model_id'])
     
     # Set up callback handler for enhanced tool output if enabled
     callback_handler = None
     tool_config = get_tool_output_config()
     if tool_config.get('enabled', True):
-        callback_handler = enhanced_callback_handler
+        callback_handler = create_callback_handler('chat')
+    
+    # Bound the history resent each turn by message count and token budget
+    conversation_manager = TokenAwareConversationManager(
+        window_size=window_size,
+        max_tokens=max_context_tokens,
+        summarize_evicted=summarize_evicted
+    )
     
     # Create agent with model, all available tools and session management
     agent = Agent(
-        model=model,
+        model=trace_model(metrics_model(rate_limited(model), 'chat')),
         tools=all_tools,
         session_manager=session_manager,
+        conversation_manager=conversation_manager,
         system_prompt=system_prompt,
-        callback_handler=callback_handler
+        callback_handler=callback_handler,
+        hooks=(usage_hooks('chat') + trace_hooks('chat') + metrics_hooks('chat')
+               + ([callback_handler] if callback_handler is not None else []))
     )
     
     # Store configuration flags on agent for later use
@@ -428,9 +370,112 @@ def create_chat_agent(
     agent._session_manager = session_manager
     agent._session_dir = session_dir
     
+    # One request at a time per conversation (see agent_with_model)
+    agent._request_lock = threading.Lock()
+    
+    # Count the session in the metrics endpoint while the agent is alive
+    track_session(agent)
+    
     return agent
 
 
+def agent_with_model(agent: Agent, model) -> Agent:
+    """
+    Return a per-request view of an agent that runs on a different model.
+    
+    The view is a shallow copy: it shares the tool registry, conversation history,
+    session manager, conversation manager, hooks, state and event loop metrics with
+    the agent, and only carries its own model, direct tool caller and per-request
+    attributes. The agent itself is never modified, so the next request is free to
+    pick another model.
+    
+    Because the history is shared, requests on one conversation must not overlap:
+    chat_with_agent, chat_with_agent_async and stream_chat_with_agent run them one
+    at a time per agent. A view is not a separate session: concurrent conversations
+    need separate agents, and each of them registers its own tools.
+    
+    Args:
+        agent: The agent to view
+        model: Model to use for requests made through the view
+    
+    Returns:
+        Agent view using the given model
+    """
+    view = copy.copy(agent)
+    view.model = trace_model(metrics_model(model, 'chat'))
+    view.tool_caller = Agent.ToolCaller(view)
+    return view
+
+
+_request_lock_guard = threading.Lock()
+
+
+def _request_lock(agent: Agent) -> threading.Lock:
+    """Get the lock that serializes the requests of an agent's conversation."""
+    with _request_lock_guard:
+        lock = getattr(agent, '_request_lock', None)
+        if lock is None:
+            lock = agent._request_lock = threading.Lock()
+        return lock
+
+
+@contextlib.asynccontextmanager
+async def _serialized_async(agent: Agent):
+    """Wait for the agent's previous request on a worker thread, without blocking the event loop."""
+    lock = _request_lock(agent)
+    if not lock.acquire(blocking=False):
+        acquiring = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The worker thread still takes the lock; hand it back as soon as it does
+            acquiring.add_done_callback(lambda _: lock.release())
+            raise
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def _agent_for_message(agent: Agent, message: str, verbose: bool = False) -> Agent:
+    """
+    Get the agent to run a message on, with dynamic model selection applied.
+    
+    Returns:
+        A per-request view of the agent using the optimized model, or the agent
+        itself when it uses static model selection
+    """
+    if not getattr(agent, '_dynamic_model_selection', False):
+        return agent
+    
+    # Classify the message once and reuse the decision for the model and the verbose output
+    manager = get_dynamic_model_manager()
+    decision = manager.route(message, 'chat')
+    optimized_model = manager.create_model_for_decision(decision)
+    
+    if verbose:
+        print(f"🧠 Task Complexity: {decision.complexity.value}")
+        print(f"🤖 Selected Model: {decision.model_key} ({optimized_model.config.get('model_id')})")
+        if decision.reason:
+            print(f"⏱️ Latency Routing: {decision.reason}")
+    
+    view = agent_with_model(agent, optimized_model)
+    
+    # Measure the request so latency-aware routing learns from it
+    view._request_timer = manager.start_request_timer(view, decision)
+    if view._request_timer is not None:
+        view.callback_handler = view._request_timer
+    
+    return view
+
+
+def _finish_request(request_agent: Agent, result: Any) -> None:
+    """Record a finished request for latency-aware routing (result is None if it failed)."""
+    timer = getattr(request_agent, '_request_timer', None)
+    if timer is not None:
+        get_dynamic_model_manager().finish_request(timer, error=result is None)
+
+
 def chat_with_agent(
     agent: Agent,
     message: str,
@@ -439,6 +484,8 @@ def chat_with_agent(
     """
     Send a message to the chat agent and return the response with dynamic model selection.
     
+    Messages to the same agent run one at a time, as they share its conversation.
+    
     Args:
         agent: The chat agent instance
         message: User message to send
@@ -448,34 +495,58 @@ def chat_with_agent(
         Agent response
     """
     try:
-        # Check if dynamic model selection is enabled
-        if hasattr(agent, '_dynamic_model_selection') and agent._dynamic_model_selection:
-            # Create optimized model based on message complexity
-            optimized_model = create_optimized_model(message, 'chat')
-            
-            # Temporarily replace the agent's model
-            original_model = agent.model
-            agent.model = optimized_model
-            
-            if verbose:
-                complexity_manager = get_dynamic_model_manager()
-                complexity = complexity_manager.analyze_task_complexity(message)
-                model_key, _ = complexity_manager.select_optimal_model(message, 'chat')
-                print(f"🧠 Task Complexity: {complexity.value}")
-                print(f"🤖 Selected Model: {model_key} ({optimized_model.model_id})")
-            
+        with _request_lock(agent):
+            request_agent = _agent_for_message(agent, message, verbose)
+            result = None
             try:
-                result = agent(message)
+                result = request_agent(message)
             finally:
-                # Restore original model
-                agent.model = original_model
-        else:
-            # Use static model selection
-            result = agent(message)
+                _finish_request(request_agent, result)
+        
+        # Print metrics if verbose
+        if verbose:
+            print_metrics(result, request_agent, verbose=True)
+        
+        return result
+        
+    except Exception as e:
+        print(f"Error in chat: {str(e)}")
+        return None
+
+
+async def chat_with_agent_async(
+    agent: Agent,
+    message: str,
+    verbose: bool = False
+) -> Any:
+    """
+    Send a message to the chat agent without blocking the event loop.
+    
+    Async counterpart of chat_with_agent() built on Agent.invoke_async. An agent
+    holds one conversation and handles one message at a time (later messages wait
+    for the current one); run separate agents (sessions) to serve many
+    conversations concurrently.
+    
+    Args:
+        agent: The chat agent instance
+        message: User message to send
+        verbose: Whether to show detailed metrics
+    
+    Returns:
+        Agent response
+    """
+    try:
+        async with _serialized_async(agent):
+            request_agent = _agent_for_message(agent, message, verbose)
+            result = None
+            try:
+                result = await request_agent.invoke_async(message)
+            finally:
+                _finish_request(request_agent, result)
         
         # Print metrics if verbose
         if verbose:
-            print_metrics(result, agent, verbose=True)
+            print_metrics(result, request_agent, verbose=True)
         
         return result
         
@@ -484,6 +555,32 @@ def chat_with_agent(
         return None
 
 
+async def stream_chat_with_agent(agent: Agent, message: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream the chat agent's response events for a message.
+    
+    Yields the events of Agent.stream_async (text chunks under the "data" key, tool
+    events, and a final event with the "result" key) with dynamic model selection applied.
+    
+    Args:
+        agent: The chat agent instance
+        message: User message to send
+    
+    Yields:
+        Agent stream events
+    """
+    async with _serialized_async(agent):
+        request_agent = _agent_for_message(agent, message)
+        result = None
+        try:
+            async for event in request_agent.stream_async(message):
+                if 'result' in event:
+                    result = event['result']
+                yield event
+        finally:
+            _finish_request(request_agent, result)
+
+
 def get_session_info(agent: Agent) -> Dict[str, Any]:
     """
     Get information about the current session.
@@ -522,11 +619,20 @@ def get_session_info(agent: Agent) -> Dict[str, Any]:
                 session_dir = value
                 break
     
-    return {
+    info = {
         "session_id": session_manager.session_id,
         "has_session": True,
         "session_dir": session_dir
     }
+    
+    # Report the size of the conversation window sent to the model
+    conversation_manager = getattr(agent, 'conversation_manager', None)
+    if isinstance(conversation_manager, TokenAwareConversationManager):
+        info["context_messages"] = len(agent.messages)
+        info["context_tokens"] = conversation_manager.context_tokens(agent.messages)
+        info["evicted_messages"] = conversation_manager.removed_message_count
+    
+    return info
 
 
 def get_model_warmup_status() -> Dict[str, Any]:
@@ -595,14 +701,14 @@ def analyze_message_complexity(message: str) -> Dict[str, Any]:
         Dictionary with complexity analysis results
     """
     try:
-        manager = get_dynamic_model_manager()
-        complexity = manager.analyze_task_complexity(message)
-        model_key, model_config = manager.select_optimal_model(message, 'chat')
+        decision = get_dynamic_model_manager().route(message, 'chat')
+        model_config = decision.config
         
         return {
-            "complexity": complexity.value,
-            "recommended_model": model_key,
+            "complexity": decision.complexity.value,
+            "recommended_model": decision.model_key,
             "model_id": model_config.model_id,
+            "scores": decision.scores,
             "model_settings": {
                 "temperature": model_config.temperature,
                 "top_p": model_config.top_p,
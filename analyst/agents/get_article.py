@@ -1,13 +1,25 @@
 from strands import Agent
 from strands.models.bedrock import BedrockModel
-from ..tools import download_article_content
-from ..config import get_config, get_bedrock_config_for_agent
+from ..tools import download_article_content, download_article_content_async
+from ..config import get_config, get_bedrock_config_for_agent, get_bedrock_cache_options
 from ..prompts import format_prompt_cached
 from ..utils import print_metrics
+from ..utils.bedrock_client import get_bedrock_client_options
+from ..utils.rate_limiter import rate_limited
+from ..utils.model_provider_factory import apply_execution_policy
+from ..utils.usage_ledger import usage_hooks
+from ..utils.tracing import trace_hooks, trace_model
+from ..utils.metrics_endpoint import metrics_hooks, metrics_model
+from ..utils.summarizer import summarize_text
 
 
-def create_get_article_agent():
-    """Create and return an agent configured for article downloading and analysis with Bedrock optimizations."""
+def create_get_article_agent(async_tools: bool = False):
+    """
+    Create and return an agent configured for article downloading and analysis with Bedrock optimizations.
+    
+    Args:
+        async_tools: Use the async network tools, for agents driven by get_article_async
+    """
     # Get optimized Bedrock configuration for this agent
     bedrock_config = get_bedrock_config_for_agent('article')
     
@@ -19,17 +31,22 @@ def create_get_article_agent():
         max_tokens=bedrock_config['max_tokens'],
         stop_sequences=bedrock_config['stop_sequences'],
         streaming=bedrock_config['streaming'],
-        region_name=bedrock_config['region_name']
+        **get_bedrock_client_options(bedrock_config['region_name']),
+        # No system prompt to cache - only tool definitions get a cache point
+        **get_bedrock_cache_options(bedrock_config['model_id'], cache_prompt=False)
     )
     
     # Add optional features if configured
     if bedrock_config['guardrail_id']:
         bedrock_model.guardrail_id = bedrock_config['guardrail_id']
     
+    model = rate_limited(apply_execution_policy(bedrock_model, 'article', model_id=bedrock_config['model_id']))
+    
     # Create agent with optimized model and tools
     return Agent(
-        model=bedrock_model,
-        tools=[download_article_content]
+        model=trace_model(metrics_model(model, 'article')),
+        tools=[download_article_content_async if async_tools else download_article_content],
+        hooks=usage_hooks('article') + trace_hooks('article') + metrics_hooks('article')
     )
 
 
@@ -49,6 +66,34 @@ def get_article(url: str, download_images: bool = None, output_dir: str = None,
     if agent is None:
         agent = create_get_article_agent()
     
+    return agent(_build_message(url, download_images, output_dir))
+
+
+async def get_article_async(url: str, download_images: bool = None, output_dir: str = None, agent=None):
+    """
+    Download and analyze a web article without blocking the event loop.
+    
+    Async counterpart of get_article() built on Agent.invoke_async, so an asyncio host
+    can run many analyses concurrently on one event loop.
+    
+    Args:
+        url: The article URL to download and analyze
+        download_images: Whether to download images (defaults to config setting)
+        output_dir: Output directory for files (defaults to config setting)
+        agent: Optional pre-configured agent. If None, creates one with async tools.
+               An agent handles one call at a time - use one agent per concurrent call.
+    
+    Returns:
+        Result object from the agent containing article content and analysis
+    """
+    if agent is None:
+        agent = create_get_article_agent(async_tools=True)
+    
+    return await agent.invoke_async(_build_message(url, download_images, output_dir))
+
+
+def _build_message(url: str, download_images: bool = None, output_dir: str = None) -> str:
+    """Build the article prompt with configuration defaults applied."""
     # Get configuration and set defaults if not specified
     config = get_config()
     if download_images is None:
@@ -56,12 +101,48 @@ def get_article(url: str, download_images: bool = None, output_dir: str = None,
     if output_dir is None:
         output_dir = config.get_article_output_dir()
     
-    message = format_prompt_cached("get_article", 
-                                 url=url, 
-                                 download_images=download_images,
-                                 output_dir=output_dir)
+    return format_prompt_cached("get_article", 
+                              url=url, 
+                              download_images=download_images,
+                              output_dir=output_dir)
+
+
+def summarize_article(url: str, download_images: bool = None, output_dir: str = None,
+                      focus: str = None):
+    """
+    Download an article and summarize its full content with map-reduce summarization.
+    
+    Unlike get_article, the full article is summarized in parallel chunks rather than
+    passed to the agent in a single context, so very long articles do not fail.
+    
+    Args:
+        url: The article URL to download and summarize
+        download_images: Whether to download images (defaults to config setting)
+        output_dir: Output directory for files (defaults to config setting)
+        focus: Optional topic or question the summary should focus on
+    
+    Returns:
+        Tuple of (download result dict, SummaryResult)
+    
+    Raises:
+        RuntimeError: If the article could not be downloaded
+    """
+    article = download_article_content(url, output_dir=output_dir, download_images=download_images)
+    if 'error' in article:
+        raise RuntimeError(article['error'])
+    
+    with open(article['markdown_file'], 'r', encoding='utf-8') as f:
+        markdown = f.read()
+    
+    summary = summarize_text(markdown, title=article['metadata'].get('title'), focus=focus)
+    
+    if get_config().get_summarize_save_summary():
+        summary_file = f"{article['output_folder']}/summary.md"
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            f.write(summary.summary + '\n')
+        summary.summary_file = summary_file
     
-    return agent(message)
+    return article, summary
 
 
 # Use the utility function for printing metrics
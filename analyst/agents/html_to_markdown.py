@@ -1,9 +1,15 @@
 from strands import Agent
 from strands.models.bedrock import BedrockModel
 from ..tools import convert_html_to_markdown
-from ..config import get_config, get_bedrock_config_for_agent
+from ..config import get_config, get_bedrock_config_for_agent, get_bedrock_cache_options
 from ..prompts import format_prompt_cached
 from ..utils import print_metrics
+from ..utils.bedrock_client import get_bedrock_client_options
+from ..utils.rate_limiter import rate_limited
+from ..utils.model_provider_factory import apply_execution_policy
+from ..utils.usage_ledger import usage_hooks
+from ..utils.tracing import trace_hooks, trace_model
+from ..utils.metrics_endpoint import metrics_hooks, metrics_model
 
 
 def create_html_to_markdown_agent():
@@ -19,17 +25,22 @@ def create_html_to_markdown_agent():
         max_tokens=bedrock_config['max_tokens'],
         stop_sequences=bedrock_config['stop_sequences'],
         streaming=bedrock_config['streaming'],
-        region_name=bedrock_config['region_name']
+        **get_bedrock_client_options(bedrock_config['region_name']),
+        # No system prompt to cache - only tool definitions get a cache point
+        **get_bedrock_cache_options(bedrock_config['model_id'], cache_prompt=False)
     )
     
     # Add optional features if configured
     if bedrock_config['guardrail_id']:
         bedrock_model.guardrail_id = bedrock_config['guardrail_id']
     
+    model = rate_limited(apply_execution_policy(bedrock_model, 'article', model_id=bedrock_config['model_id']))
+    
     # Create agent with optimized model and tools
     return Agent(
-        model=bedrock_model,
-        tools=[convert_html_to_markdown]
+        model=trace_model(metrics_model(model, 'htmlmd')),
+        tools=[convert_html_to_markdown],
+        hooks=usage_hooks('htmlmd') + trace_hooks('htmlmd') + metrics_hooks('htmlmd')
     )
 
 
@@ -50,6 +61,35 @@ def html_to_markdown(html_file_path: str, output_filename: str = None,
     if agent is None:
         agent = create_html_to_markdown_agent()
     
+    return agent(_build_message(html_file_path, output_filename, include_metadata))
+
+
+async def html_to_markdown_async(html_file_path: str, output_filename: str = None, 
+                                 include_metadata: bool = None, agent=None):
+    """
+    Convert a local HTML file to markdown without blocking the event loop.
+    
+    Async counterpart of html_to_markdown() built on Agent.invoke_async. The conversion
+    tool works on local files and runs on a worker thread.
+    
+    Args:
+        html_file_path: Path to the HTML file to convert
+        output_filename: Optional filename for the markdown file (defaults to config)
+        include_metadata: Whether to include frontmatter metadata (defaults to config)
+        agent: Optional pre-configured agent. If None, creates a new one.
+               An agent handles one call at a time - use one agent per concurrent call.
+    
+    Returns:
+        Result object from the agent containing conversion details and analysis
+    """
+    if agent is None:
+        agent = create_html_to_markdown_agent()
+    
+    return await agent.invoke_async(_build_message(html_file_path, output_filename, include_metadata))
+
+
+def _build_message(html_file_path: str, output_filename: str = None, include_metadata: bool = None) -> str:
+    """Build the conversion prompt with configuration defaults applied."""
     # Get configuration and set defaults if not specified
     config = get_config()
     if include_metadata is None:
@@ -57,12 +97,10 @@ def html_to_markdown(html_file_path: str, output_filename: str = None,
     if output_filename is None:
         output_filename = "article.md"
     
-    message = format_prompt_cached("html_to_markdown", 
-                                 html_file_path=html_file_path,
-                                 output_filename=output_filename,
-                                 include_metadata=include_metadata)
-    
-    return agent(message)
+    return format_prompt_cached("html_to_markdown", 
+                              html_file_path=html_file_path,
+                              output_filename=output_filename,
+                              include_metadata=include_metadata)
 
 
 # Use the utility function for printing metrics
@@ -1,17 +1,29 @@
+import asyncio
 import os
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 from strands import Agent
 from strands.models.bedrock import BedrockModel
-from ..tools import fetch_rss_content
-from ..config import get_config, get_news_output_dir, get_news_save_markdown, get_bedrock_config_for_agent
+from ..tools import fetch_rss_content, fetch_rss_content_async
+from ..config import get_config, get_news_output_dir, get_news_save_markdown, get_bedrock_config_for_agent, get_bedrock_cache_options
 from ..prompts import format_prompt_cached
 from ..utils import print_metrics
+from ..utils.bedrock_client import get_bedrock_client_options
+from ..utils.rate_limiter import rate_limited
+from ..utils.model_provider_factory import apply_execution_policy
+from ..utils.usage_ledger import usage_hooks
+from ..utils.tracing import trace_hooks, trace_model
+from ..utils.metrics_endpoint import metrics_hooks, metrics_model
 
 
-def create_news_agent():
-    """Create and return an agent configured for RSS news analysis with Bedrock optimizations."""
+def create_news_agent(async_tools: bool = False):
+    """
+    Create and return an agent configured for RSS news analysis with Bedrock optimizations.
+    
+    Args:
+        async_tools: Use the async network tools, for agents driven by news_async
+    """
     # Get optimized Bedrock configuration for this agent
     bedrock_config = get_bedrock_config_for_agent('news')
     
@@ -23,17 +35,22 @@ def create_news_agent():
         max_tokens=bedrock_config['max_tokens'],
         stop_sequences=bedrock_config['stop_sequences'],
         streaming=bedrock_config['streaming'],
-        region_name=bedrock_config['region_name']
+        **get_bedrock_client_options(bedrock_config['region_name']),
+        # No system prompt to cache - only tool definitions get a cache point
+        **get_bedrock_cache_options(bedrock_config['model_id'], cache_prompt=False)
     )
     
     # Add optional features if configured
     if bedrock_config['guardrail_id']:
         bedrock_model.guardrail_id = bedrock_config['guardrail_id']
     
+    model = rate_limited(apply_execution_policy(bedrock_model, 'news', model_id=bedrock_config['model_id']))
+    
     # Create agent with optimized model and tools
     return Agent(
-        model=bedrock_model,
-        tools=[fetch_rss_content]
+        model=trace_model(metrics_model(model, 'news')),
+        tools=[fetch_rss_content_async if async_tools else fetch_rss_content],
+        hooks=usage_hooks('news') + trace_hooks('news') + metrics_hooks('news')
     )
 
 
@@ -116,6 +133,40 @@ def news(rss_url: str, max_items: int = None, agent=None, save_markdown: bool =
     if agent is None:
         agent = create_news_agent()
     
+    result = agent(_build_message(rss_url, max_items))
+    
+    return _save_result(rss_url, result, save_markdown, output_dir)
+
+
+async def news_async(rss_url: str, max_items: int = None, agent=None, save_markdown: bool = None,
+                     output_dir: str = None):
+    """
+    Fetch and analyze an RSS feed without blocking the event loop.
+    
+    Async counterpart of news() built on Agent.invoke_async, so an asyncio host
+    can run many analyses concurrently on one event loop.
+    
+    Args:
+        rss_url: The RSS feed URL to process
+        max_items: Number of news items to fetch (defaults to config setting)
+        agent: Optional pre-configured agent. If None, creates one with async tools.
+               An agent handles one call at a time - use one agent per concurrent call.
+        save_markdown: Whether to save response as markdown. Uses config default if None.
+        output_dir: Output directory for markdown file. Uses config default if None.
+    
+    Returns:
+        Result object from the agent containing latest news items
+    """
+    if agent is None:
+        agent = create_news_agent(async_tools=True)
+    
+    result = await agent.invoke_async(_build_message(rss_url, max_items))
+    
+    return await asyncio.to_thread(_save_result, rss_url, result, save_markdown, output_dir)
+
+
+def _build_message(rss_url: str, max_items: int = None) -> str:
+    """Build the news prompt with the configured item limits applied."""
     # Get configuration and set default max_items if not specified
     config = get_config()
     if max_items is None:
@@ -125,10 +176,11 @@ def news(rss_url: str, max_items: int = None, agent=None, save_markdown: bool =
     max_allowed = config.get_rss_max_items()
     max_items = min(max_items, max_allowed)
     
-    message = format_prompt_cached("news", max_items=max_items, rss_url=rss_url)
-    
-    result = agent(message)
-    
+    return format_prompt_cached("news", max_items=max_items, rss_url=rss_url)
+
+
+def _save_result(rss_url: str, result, save_markdown: bool = None, output_dir: str = None):
+    """Save the agent result as markdown if configured and return the result."""
     # Save to markdown if configured to do so
     if save_markdown is None:
         save_markdown = get_news_save_markdown()
@@ -1,17 +1,29 @@
+import asyncio
 import os
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 from strands import Agent
 from strands.models.bedrock import BedrockModel
-from ..tools import fetch_url_metadata
+from ..tools import fetch_url_metadata, fetch_url_metadata_async
 from ..prompts import format_prompt_cached
 from ..utils import print_metrics
-from ..config import get_sitemeta_output_dir, get_sitemeta_save_markdown, get_bedrock_config_for_agent
+from ..utils.bedrock_client import get_bedrock_client_options
+from ..utils.rate_limiter import rate_limited
+from ..utils.model_provider_factory import apply_execution_policy
+from ..utils.usage_ledger import usage_hooks
+from ..utils.tracing import trace_hooks, trace_model
+from ..utils.metrics_endpoint import metrics_hooks, metrics_model
+from ..config import get_sitemeta_output_dir, get_sitemeta_save_markdown, get_bedrock_config_for_agent, get_bedrock_cache_options
 
 
-def create_sitemeta_agent():
-    """Create and return an agent configured for site metadata analysis with Bedrock optimizations."""
+def create_sitemeta_agent(async_tools: bool = False):
+    """
+    Create and return an agent configured for site metadata analysis with Bedrock optimizations.
+    
+    Args:
+        async_tools: Use the async network tools, for agents driven by sitemeta_async
+    """
     # Get optimized Bedrock configuration for this agent
     bedrock_config = get_bedrock_config_for_agent('sitemeta')
     
@@ -23,17 +35,22 @@ def create_sitemeta_agent():
         max_tokens=bedrock_config['max_tokens'],
         stop_sequences=bedrock_config['stop_sequences'],
         streaming=bedrock_config['streaming'],
-        region_name=bedrock_config['region_name']
+        **get_bedrock_client_options(bedrock_config['region_name']),
+        # No system prompt to cache - only tool definitions get a cache point
+        **get_bedrock_cache_options(bedrock_config['model_id'], cache_prompt=False)
     )
     
     # Add optional features if configured
     if bedrock_config['guardrail_id']:
         bedrock_model.guardrail_id = bedrock_config['guardrail_id']
     
+    model = rate_limited(apply_execution_policy(bedrock_model, 'sitemeta', model_id=bedrock_config['model_id']))
+    
     # Create agent with optimized model and tools
     return Agent(
-        model=bedrock_model,
-        tools=[fetch_url_metadata]
+        model=trace_model(metrics_model(model, 'sitemeta')),
+        tools=[fetch_url_metadata_async if async_tools else fetch_url_metadata],
+        hooks=usage_hooks('sitemeta') + trace_hooks('sitemeta') + metrics_hooks('sitemeta')
     )
 
 
@@ -119,6 +136,38 @@ def sitemeta(url: str, agent=None, save_markdown: bool = None, output_dir: str =
     
     result = agent(message)
     
+    return _save_result(url, result, save_markdown, output_dir)
+
+
+async def sitemeta_async(url: str, agent=None, save_markdown: bool = None, output_dir: str = None):
+    """
+    Analyze a website without blocking the event loop.
+    
+    Async counterpart of sitemeta() built on Agent.invoke_async, so an asyncio host
+    can run many analyses concurrently on one event loop.
+    
+    Args:
+        url: The URL to analyze
+        agent: Optional pre-configured agent. If None, creates one with async tools.
+               An agent handles one call at a time - use one agent per concurrent call.
+        save_markdown: Whether to save response as markdown. Uses config default if None.
+        output_dir: Output directory for markdown file. Uses config default if None.
+    
+    Returns:
+        Result object from the agent
+    """
+    if agent is None:
+        agent = create_sitemeta_agent(async_tools=True)
+    
+    message = format_prompt_cached("sitemeta", url=url)
+    
+    result = await agent.invoke_async(message)
+    
+    return await asyncio.to_thread(_save_result, url, result, save_markdown, output_dir)
+
+
+def _save_result(url: str, result, save_markdown: bool = None, output_dir: str = None):
+    """Save the agent result as markdown if configured and return the result."""
     # Save to markdown if configured to do so
     if save_markdown is None:
         save_markdown = get_sitemeta_save_markdown()
@@ -1,12 +1,23 @@
 """
 CLI module - Command-line interfaces for various analyst agents.
+
+Each command module is imported on first access, so a console script only
+loads its own command.
 """
 
-from .sitemeta import main as sitemeta_main
-from .news import main as news_main
-from .get_article import main as get_article_main
-from .html_to_markdown import main as html_to_markdown_main
-from .chat import main as chat_main
-from .provider_info import main as provider_info_main
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "sitemeta_main": (".sitemeta", "main"),
+    "news_main": (".news", "main"),
+    "get_article_main": (".get_article", "main"),
+    "html_to_markdown_main": (".html_to_markdown", "main"),
+    "chat_main": (".chat", "main"),
+    "provider_info_main": (".provider_info", "main"),
+    "usage_main": (".usage", "main"),
+    "analyst_main": (".main", "main"),
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = ["sitemeta_main", "news_main", "get_article_main", "html_to_markdown_main", "chat_main", "provider_info_main"]
\ No newline at end of file
+lazy_exports(__name__, _EXPORTS)
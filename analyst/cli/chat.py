@@ -34,10 +34,12 @@ try:
 except ImportError:
     HAS_READLINE = False
 
-# Import standard chat dependencies
-from ..agents.chat import create_chat_agent, chat_with_agent, get_session_info
+# Import standard chat dependencies (the chat agent itself is imported when it
+# is first used, so --help does not load strands and the tools)
 from ..config import get_config
 from ..utils import configure_logging, get_rotating_prompts, get_more_examples
+from ..utils.tracing import add_trace_argument, trace_from_args
+from ..utils.profiling import add_profile_arguments, profile_from_args
 
 
 def setup_readline(history_file: Optional[Path] = None):
@@ -125,18 +127,23 @@ def print_help():
 
 def print_session_info(agent):
     """Print information about the current session."""
+    from ..agents.chat import get_session_info
     info = get_session_info(agent)
     print("📊 Session Information:")
     print(f"  Session ID: {info['session_id']}")
     print(f"  Has Session: {info['has_session']}")
     if 'session_dir' in info:
         print(f"  Session Directory: {info['session_dir']}")
+    if 'context_messages' in info:
+        print(f"  Context: {info['context_messages']} messages, ~{info['context_tokens']:,} tokens "
+              f"({info['evicted_messages']} older messages evicted)")
     print()
 
 
 def save_conversation_summary(agent, session_dir: str):
     """Save a summary of the conversation to a file."""
     try:
+        from ..agents.chat import get_session_info
         session_info = get_session_info(agent)
         session_id = session_info.get('session_id', 'unknown')
         
@@ -184,6 +191,7 @@ This chat session used the Analyst Chat agent with access to:
 
 def interactive_chat(agent, args):
     """Run the interactive chat interface."""
+    from ..agents.chat import chat_with_agent
     try:
         # Set up readline for better input handling
         history_file = None
@@ -274,6 +282,7 @@ def interactive_chat(agent, args):
 
 def single_message_mode(agent, message: str, args):
     """Handle single message mode."""
+    from ..agents.chat import chat_with_agent
     response = chat_with_agent(agent, message, verbose=args.verbose)
     # When streaming is enabled, the response is already printed by Strands SDK
     # We only need to handle error cases
@@ -284,6 +293,7 @@ def single_message_mode(agent, message: str, args):
 
 def main():
     """Main CLI entry point for the analystai command."""
+    config = get_config()
     
     parser = argparse.ArgumentParser(
         description="Interactive chat interface for AI-powered analysis with multi-turn conversations.",
@@ -306,8 +316,20 @@ def main():
     parser.add_argument(
         "--window-size", "-w",
         type=int,
-        default=20,
-        help="Conversation window size for context management (default: 20)"
+        default=None,
+        help=f"Conversation window size in messages for context management (default: {config.get_chat_window_size()})"
+    )
+    parser.add_argument(
+        "--max-context-tokens",
+        type=int,
+        default=None,
+        help=f"Token budget for conversation history, 0 for no limit (default: {config.get_chat_max_context_tokens()})"
+    )
+    parser.add_argument(
+        "--summarize-evicted",
+        action="store_true",
+        default=None,
+        help="Summarize turns evicted from the conversation window in the background"
     )
     parser.add_argument(
         "--verbose", "-v",
@@ -335,9 +357,28 @@ def main():
         help="Show tool execution timing information"
     )
     
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="Serve Prometheus metrics on PORT at /metrics while the chat runs (address: metrics.endpoint.host)"
+    )
+    add_trace_argument(parser)
+    add_profile_arguments(parser)
+    
     args = parser.parse_args()
+    trace_from_args(args, "analystai")
+    profile_from_args(args, "analystai")
+    
+    from ..agents.chat import create_chat_agent
+    from ..utils.dynamic_model_config import warm_up_models
     
     try:
+        # Start the metrics endpoint before the agent is created, so its hooks record
+        if args.metrics_port is not None:
+            from ..utils.metrics_endpoint import start_metrics_server
+            start_metrics_server(args.metrics_port)
         
         # Configure logging
         if not args.no_logging:
@@ -360,7 +401,9 @@ def main():
             session_id=args.session_id,
             session_dir=args.session_dir,
             window_size=args.window_size,
-            enable_logging=not args.no_logging
+            enable_logging=not args.no_logging,
+            max_context_tokens=args.max_context_tokens,
+            summarize_evicted=args.summarize_evicted
         )
         
         # Determine mode based on arguments
@@ -369,7 +412,9 @@ def main():
             message = " ".join(args.message)
             single_message_mode(agent, message, args)
         else:
-            # Interactive mode
+            # Interactive mode - warm up models while the user types the first message
+            if agent._dynamic_model_selection and config.get_bedrock_warmup_mode() == 'background':
+                warm_up_models()
             interactive_chat(agent, args)
         
             
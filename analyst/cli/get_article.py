@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 import argparse
 import sys
-from ..agents import create_get_article_agent, get_article, print_result_metrics
 from ..config import get_config
 from ..utils import configure_logging, print_metrics
+from ..utils.tracing import add_trace_argument, trace_from_args
+from ..utils.profiling import add_profile_arguments, profile_from_args
 
 
 def main():
@@ -30,13 +31,31 @@ def main():
         default=None,
         help=f"Output directory for downloaded files (default: {default_output_dir})"
     )
+    parser.add_argument(
+        "--summarize",
+        action="store_true",
+        help="Summarize the full article with parallel map-reduce summarization instead of a single-pass analysis"
+    )
+    parser.add_argument(
+        "--focus",
+        default=None,
+        help="Topic or question the summary should focus on (used with --summarize)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Show detailed metrics about the analysis"
     )
     
+    add_trace_argument(parser)
+    add_profile_arguments(parser)
+    
     args = parser.parse_args()
+    trace_from_args(args, "article", url=args.url)
+    profile_from_args(args, "article")
+    
+    # Import the agent after parsing arguments, so --help does not load it
+    from ..agents import create_get_article_agent, get_article, summarize_article, print_result_metrics
     
     # Ensure URL has protocol
     url = args.url
@@ -50,6 +69,23 @@ def main():
         # Configure logging based on verbose flag
         configure_logging(verbose=args.verbose)
         
+        if args.summarize:
+            article, summary = summarize_article(url,
+                                                 download_images=download_images,
+                                                 output_dir=args.output_dir,
+                                                 focus=args.focus)
+            print(summary.summary)
+            
+            if args.verbose:
+                print()
+                print(f"Chunks: {summary.chunk_count} | Model calls: {summary.model_calls} | "
+                      f"Tokens: {summary.input_tokens:,} in, {summary.output_tokens:,} out | "
+                      f"Duration: {summary.elapsed_seconds:.2f}s")
+                print(f"Article: {article['output_folder']}")
+                if summary.summary_file:
+                    print(f"Summary: {summary.summary_file}")
+            return
+        
         # Create agent and download/analyze article
         agent = create_get_article_agent()
         result = get_article(url, 
@@ -2,9 +2,10 @@
 import argparse
 import sys
 from pathlib import Path
-from ..agents import create_html_to_markdown_agent, html_to_markdown
 from ..config import get_config
 from ..utils import configure_logging, print_metrics
+from ..utils.tracing import add_trace_argument, trace_from_args
+from ..utils.profiling import add_profile_arguments, profile_from_args
 
 
 def main():
@@ -36,7 +37,15 @@ def main():
         help="Show detailed metrics about the conversion"
     )
     
+    add_trace_argument(parser)
+    add_profile_arguments(parser)
+    
     args = parser.parse_args()
+    trace_from_args(args, "htmlmd", html_file=args.html_file)
+    profile_from_args(args, "htmlmd")
+    
+    # Import the agent after parsing arguments, so --help does not load it
+    from ..agents import create_html_to_markdown_agent, html_to_markdown
     
     # Validate HTML file path
     html_path = Path(args.html_file)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Top-level `analyst` command for Strands Analyst.
+
+Dispatches to the reporting subcommands:
+    analyst usage [options]    Token usage, cost and latency from the usage ledger
+    analyst trace [options]    Waterfall of the phase timings recorded with --trace
+"""
+
+import importlib
+import sys
+from typing import List, Optional
+
+# Subcommand name -> (module, description)
+COMMANDS = {
+    "usage": ("analyst.cli.usage", "Token usage, cost and latency from the usage ledger"),
+    "trace": ("analyst.cli.trace", "Waterfall of the phase timings recorded with --trace"),
+}
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI function."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ("-h", "--help") or argv[0] not in COMMANDS:
+        if argv and argv[0] not in ("-h", "--help"):
+            print(f"Unknown command: {argv[0]}\n")
+        print("usage: analyst <command> [options]\n\nCommands:")
+        for name, (_, description) in COMMANDS.items():
+            print(f"  {name:<10} {description}")
+        return 0 if argv and argv[0] in ("-h", "--help") else 2
+
+    module = importlib.import_module(COMMANDS[argv[0]][0])
+    return module.main(argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
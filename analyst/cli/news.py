@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 import argparse
 import sys
-from ..agents import create_news_agent, news, print_result_metrics
 from ..config import get_config, get_news_output_dir
 from ..utils import configure_logging, print_metrics
+from ..utils.tracing import add_trace_argument, trace_from_args
+from ..utils.profiling import add_profile_arguments, profile_from_args
 
 
 def main():
@@ -46,7 +47,15 @@ def main():
         help=f"Output directory for markdown file (default: {get_news_output_dir()})"
     )
     
+    add_trace_argument(parser)
+    add_profile_arguments(parser)
+    
     args = parser.parse_args()
+    trace_from_args(args, "news", url=args.rss_url)
+    profile_from_args(args, "news")
+    
+    # Import the agent after parsing arguments, so --help does not load it
+    from ..agents import create_news_agent, news, print_result_metrics
     
     # Basic URL validation for RSS feeds
     rss_url = args.rss_url
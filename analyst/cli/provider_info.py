@@ -10,6 +10,8 @@ import json
 from typing import Dict, Any
 from ..utils.model_provider_factory import get_model_factory, get_active_provider, get_provider_display_info
 from ..config import get_config
+from ..utils.tracing import add_trace_argument, trace_from_args
+from ..utils.profiling import add_profile_arguments, profile_from_args
 
 
 def display_provider_info(verbose: bool = False) -> Dict[str, Any]:
@@ -47,10 +49,20 @@ def display_provider_info(verbose: bool = False) -> Dict[str, Any]:
             for feature in anthropic_features:
                 if factory.supports_feature(feature):
                     print(f"  ✅ {feature}")
+        
+        display_cache_stats(factory.get_cache_stats())
     
     return provider_info
 
 
+def display_cache_stats(stats: Dict[str, Any]):
+    """Display model cache statistics."""
+    print("\n📦 Model Cache:")
+    print(f"  Size: {stats['size']}/{stats['max_size']}")
+    print(f"  Hits: {stats['hits']} | Misses: {stats['misses']} | Evictions: {stats['evictions']}")
+    print(f"  Hit Rate: {stats['hit_rate']:.1%}")
+
+
 def run_health_check(verbose: bool = False) -> Dict[str, Any]:
     """Run health check on the active provider."""
     factory = get_model_factory()
@@ -139,13 +151,19 @@ def main():
         help="Output in JSON format"
     )
     
+    add_trace_argument(parser)
+    add_profile_arguments(parser)
+    
     args = parser.parse_args()
+    trace_from_args(args, "provider-info")
+    profile_from_args(args, "provider-info")
     
     results = {}
     
     # Always show provider info
     provider_info = display_provider_info(args.verbose)
     results['provider_info'] = provider_info
+    results['model_cache'] = get_model_factory().get_cache_stats()
     
     # Run health check if requested
     if args.health_check:
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 import argparse
 import sys
-from ..agents import create_sitemeta_agent, sitemeta, print_result_metrics
 from ..utils import configure_logging, print_metrics
 from ..config import get_sitemeta_output_dir
+from ..utils.tracing import add_trace_argument, trace_from_args
+from ..utils.profiling import add_profile_arguments, profile_from_args
 
 
 def main():
@@ -36,7 +37,15 @@ def main():
         help=f"Output directory for markdown file (default: {get_sitemeta_output_dir()})"
     )
     
+    add_trace_argument(parser)
+    add_profile_arguments(parser)
+    
     args = parser.parse_args()
+    trace_from_args(args, "sitemeta", url=args.url)
+    profile_from_args(args, "sitemeta")
+    
+    # Import the agent after parsing arguments, so --help does not load it
+    from ..agents import create_sitemeta_agent, sitemeta, print_result_metrics
     
     # Ensure URL has protocol
     url = args.url
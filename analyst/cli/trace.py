@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Trace viewer CLI for Strands Analyst.
+
+Prints the spans recorded with --trace (see analyst.utils.tracing) as a
+waterfall: one line per span, indented under its parent, with a bar showing
+when it ran within the trace. Reads both the "jsonl" and the "otlp" trace
+file formats.
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import get_config
+
+# Attributes shown next to a span name, in order of preference
+_DETAIL_ATTRIBUTES = ("url", "file", "html_file", "model_id")
+
+
+def _otlp_attributes(attributes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert OTLP key/value attributes to a plain dict."""
+    result = {}
+    for attribute in attributes:
+        value = attribute.get('value', {})
+        for kind in ('stringValue', 'intValue', 'doubleValue', 'boolValue'):
+            if kind in value:
+                result[attribute['key']] = int(value[kind]) if kind == 'intValue' else value[kind]
+                break
+    return result
+
+
+def read_spans(path: Path) -> List[Dict[str, Any]]:
+    """
+    Read the spans of a trace file.
+
+    Args:
+        path: Trace file in "jsonl" or "otlp" format
+
+    Returns:
+        Spans with integer timestamps and attributes as a dict
+    """
+    spans = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if 'resourceSpans' in record:
+                for resource in record['resourceSpans']:
+                    for scope in resource.get('scopeSpans', []):
+                        for otlp_span in scope.get('spans', []):
+                            span = dict(otlp_span, attributes=_otlp_attributes(otlp_span.get('attributes', [])))
+                            spans.append(span)
+            else:
+                spans.append(record)
+
+    for span in spans:
+        span['startTimeUnixNano'] = int(span['startTimeUnixNano'])
+        span['endTimeUnixNano'] = int(span['endTimeUnixNano'])
+    return spans
+
+
+def group_traces(spans: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Group spans by trace, oldest trace first."""
+    traces = defaultdict(list)
+    for span in spans:
+        traces[span['traceId']].append(span)
+    return sorted(traces.values(), key=lambda trace: min(span['startTimeUnixNano'] for span in trace))
+
+
+def _duration_ms(span: Dict[str, Any]) -> float:
+    return (span['endTimeUnixNano'] - span['startTimeUnixNano']) / 1e6
+
+
+def _detail(span: Dict[str, Any]) -> str:
+    """Short description of a span from its attributes."""
+    attributes = span.get('attributes', {})
+    parts = [str(attributes[key]) for key in _DETAIL_ATTRIBUTES if key in attributes][:1]
+    if 'ttft_ms' in attributes:
+        parts.append(f"ttft {attributes['ttft_ms']}ms")
+    if 'output_tokens' in attributes:
+        parts.append(f"{attributes.get('input_tokens', 0)}→{attributes['output_tokens']} tokens")
+    error = span.get('status', {}).get('message')
+    if error:
+        parts.append(f"✗ {error}")
+    return "  ".join(parts)
+
+
+def display_waterfall(trace: List[Dict[str, Any]], width: int = 40, min_ms: float = 0.0) -> None:
+    """Print one trace as a waterfall."""
+    start = min(span['startTimeUnixNano'] for span in trace)
+    end = max(span['endTimeUnixNano'] for span in trace)
+    total = max(end - start, 1)
+
+    span_ids = {span['spanId'] for span in trace}
+    children = defaultdict(list)
+    for span in trace:
+        parent = span.get('parentSpanId') or None
+        children[parent if parent in span_ids else None].append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda span: span['startTimeUnixNano'])
+
+    root = children[None][0]
+    started = datetime.fromtimestamp(start / 1e9).strftime('%Y-%m-%d %H:%M:%S')
+    print(f"🔎 Trace {trace[0]['traceId'][:16]}  {root['name']}  {started}  {total / 1e9:.2f}s  {len(trace)} spans")
+    print("=" * (52 + width))
+
+    def show(span: Dict[str, Any], depth: int) -> None:
+        duration = _duration_ms(span)
+        if depth and duration < min_ms:
+            return
+        offset = int((span['startTimeUnixNano'] - start) / total * width)
+        length = max(1, round((span['endTimeUnixNano'] - span['startTimeUnixNano']) / total * width))
+        bar = (" " * offset + "█" * length)[:width].ljust(width)
+        name = ("  " * depth + span['name'])[:38]
+        print(f"{name:<38}{duration:>10.1f}ms |{bar}| {_detail(span)}")
+        for child in children[span['spanId']]:
+            show(child, depth + 1)
+
+    for top in children[None]:
+        show(top, 0)
+
+
+def display_phase_totals(trace: List[Dict[str, Any]]) -> None:
+    """Print the total time per span name, excluding the root span."""
+    span_ids = {span['spanId'] for span in trace}
+    totals = defaultdict(lambda: [0, 0.0])
+    for span in trace:
+        if span.get('parentSpanId') in span_ids:
+            totals[span['name']][0] += 1
+            totals[span['name']][1] += _duration_ms(span)
+    if not totals:
+        return
+    print("\nTime by phase:")
+    for name, (count, total_ms) in sorted(totals.items(), key=lambda item: item[1][1], reverse=True):
+        print(f"  {name:<36}{count:>4}×{total_ms:>12.1f}ms")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(
+        description="Show the phase timings recorded with --trace as a waterfall",
+        prog="analyst trace"
+    )
+    parser.add_argument(
+        "file",
+        nargs="?",
+        help=f"Trace file (default: {get_config().get_tracing_file()})"
+    )
+    parser.add_argument(
+        "--last", "-n",
+        type=int,
+        default=1,
+        help="Number of most recent traces to show (default: 1)"
+    )
+    parser.add_argument(
+        "--trace-id", "-t",
+        help="Show the trace whose ID starts with this prefix"
+    )
+    parser.add_argument(
+        "--list", "-l",
+        action="store_true",
+        help="List the recorded traces instead of showing waterfalls"
+    )
+    parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=0.0,
+        help="Hide spans shorter than this many milliseconds"
+    )
+    parser.add_argument(
+        "--width", "-w",
+        type=int,
+        default=40,
+        help="Width of the waterfall bars (default: 40)"
+    )
+
+    args = parser.parse_args(argv)
+
+    path = Path(args.file or get_config().get_tracing_file())
+    if not path.is_file():
+        print(f"No traces recorded in {path} (run a command with --trace)")
+        return
+
+    traces = group_traces(read_spans(path))
+    if args.trace_id:
+        traces = [trace for trace in traces if trace[0]['traceId'].startswith(args.trace_id)]
+        if not traces:
+            print(f"No trace with ID {args.trace_id} in {path}", file=sys.stderr)
+            return 1
+
+    if args.list:
+        for trace in traces:
+            root = min(trace, key=lambda span: span['startTimeUnixNano'])
+            started = datetime.fromtimestamp(root['startTimeUnixNano'] / 1e9).strftime('%Y-%m-%d %H:%M:%S')
+            duration = (max(span['endTimeUnixNano'] for span in trace) - root['startTimeUnixNano']) / 1e9
+            print(f"{trace[0]['traceId'][:16]}  {started}  {duration:>8.2f}s  {len(trace):>4} spans  {root['name']}")
+        return
+
+    for index, trace in enumerate(traces[-max(args.last, 1):]):
+        if index:
+            print()
+        display_waterfall(trace, args.width, args.min_ms)
+        display_phase_totals(trace)
+
+
+if __name__ == "__main__":
+    main()
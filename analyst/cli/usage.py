@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Usage and latency report CLI for Strands Analyst.
+
+Summarizes the usage ledger (see analyst.utils.usage_ledger) by agent, model
+or day: invocations, tokens, estimated cost, latency percentiles and the tools
+that took the most time.
+"""
+
+import argparse
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from ..utils.usage_ledger import get_usage_ledger
+
+
+def _percentile(values: List[float], p: float) -> float:
+    """Return the p-th percentile (0-1) of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def summarize(rows, group_by: str = 'agent') -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate ledger rows per agent, model or day.
+
+    Args:
+        rows: Ledger rows from UsageLedger.query()
+        group_by: Column to group by ('agent', 'model' or 'day')
+
+    Returns:
+        Summary per group, ordered by estimated cost
+    """
+    groups = defaultdict(list)
+    for row in rows:
+        groups[row[group_by]].append(row)
+
+    summary = {}
+    for key, group in groups.items():
+        wall = [row['wall_ms'] for row in group]
+        tools = defaultdict(float)
+        for row in group:
+            for name, stats in json.loads(row['tools']).items():
+                tools[name] += stats.get('seconds', 0.0)
+        summary[key] = {
+            'invocations': len(group),
+            'errors': sum(row['error'] for row in group),
+            'input_tokens': sum(row['input_tokens'] for row in group),
+            'output_tokens': sum(row['output_tokens'] for row in group),
+            'cache_read_tokens': sum(row['cache_read_tokens'] for row in group),
+            'cache_write_tokens': sum(row['cache_write_tokens'] for row in group),
+            'cost': round(sum(row['cost'] for row in group), 4),
+            'cycles': sum(row['cycles'] for row in group),
+            'wall_ms': {'p50': _percentile(wall, 0.5), 'p95': _percentile(wall, 0.95), 'p99': _percentile(wall, 0.99)},
+            'tool_seconds': {name: round(seconds, 2) for name, seconds in
+                             sorted(tools.items(), key=lambda item: item[1], reverse=True)}
+        }
+    return dict(sorted(summary.items(), key=lambda item: item[1]['cost'], reverse=True))
+
+
+def display_summary(summary: Dict[str, Dict[str, Any]], group_by: str) -> None:
+    """Print the summary as a table."""
+    print(f"📊 Usage by {group_by}")
+    print("=" * 100)
+    print(f"{group_by.capitalize():<32}{'runs':>6}{'errors':>7}{'tokens in':>12}{'tokens out':>11}"
+          f"{'cache read':>11}{'cost $':>9}{'p50 s':>7}{'p95 s':>7}")
+    for key, stats in summary.items():
+        print(f"{str(key)[:31]:<32}{stats['invocations']:>6}{stats['errors']:>7}{stats['input_tokens']:>12,}"
+              f"{stats['output_tokens']:>11,}{stats['cache_read_tokens']:>11,}{stats['cost']:>9.2f}"
+              f"{stats['wall_ms']['p50'] / 1000:>7.1f}{stats['wall_ms']['p95'] / 1000:>7.1f}")
+        top_tools = list(stats['tool_seconds'].items())[:3]
+        if top_tools:
+            print(f"  {'tools:':<30}" + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in top_tools))
+
+    totals = {
+        'runs': sum(stats['invocations'] for stats in summary.values()),
+        'tokens': sum(stats['input_tokens'] + stats['output_tokens'] for stats in summary.values()),
+        'cost': sum(stats['cost'] for stats in summary.values())
+    }
+    print("-" * 100)
+    print(f"Total: {totals['runs']} invocations, {totals['tokens']:,} tokens, ${totals['cost']:.2f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Report token usage, cost and latency from the usage ledger")
+    parser.add_argument(
+        "--by", "-b",
+        choices=["agent", "model", "day"],
+        default="agent",
+        help="Group results by agent, model or day (default: agent)"
+    )
+    parser.add_argument(
+        "--days", "-d",
+        type=float,
+        help="Only include the last N days"
+    )
+    parser.add_argument(
+        "--agent", "-a",
+        help="Only include invocations of this agent"
+    )
+    parser.add_argument(
+        "--json", "-j",
+        action="store_true",
+        help="Output in JSON format"
+    )
+
+    args = parser.parse_args(argv)
+
+    ledger = get_usage_ledger()
+    since = time.time() - args.days * 86400 if args.days else None
+    rows = [row for row in ledger.query(since) if not args.agent or row['agent'] == args.agent]
+
+    if not rows:
+        print(f"No usage recorded in {ledger.path}")
+        return
+
+    summary = summarize(rows, args.by)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        display_summary(summary, args.by)
+
+
+if __name__ == "__main__":
+    main()
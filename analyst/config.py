@@ -2,19 +2,132 @@
 Configuration management for Strands Analyst.
 
 This module handles loading and accessing configuration settings from config.yml.
+
+The defaults and config.yml are merged once into an immutable ConfigSnapshot
+with a flat index of every dotted key path, so Config.get() is a single dict
+lookup. config.yml is checked for changes at most every
+app.config_reload_interval seconds; a changed file is loaded into a new
+snapshot that replaces the old one atomically, and subscribers registered
+with Config.subscribe() are notified.
 """
 
 import os
-import yaml
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, Optional, Callable, List
 from pathlib import Path
 
+from .startup_cache import load_yaml
+
+
+class ConfigSection(dict):
+    """Read-only configuration mapping with attribute access."""
+    
+    __slots__ = ()
+    
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Configuration snapshots are read-only; use dict(section) for a mutable copy")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __copy__(self) -> dict:
+        return dict(self)
+    
+    def __deepcopy__(self, memo) -> dict:
+        return thaw(self)
+    
+    def __reduce__(self):
+        return (dict, (thaw(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Convert nested dicts and lists to ConfigSections and tuples."""
+    if isinstance(value, dict):
+        return ConfigSection({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Convert a frozen configuration value back to mutable dicts and lists."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+_MISSING = object()
+
+
+class ConfigSnapshot:
+    """
+    Immutable merged configuration.
+    
+    Every dotted key path is indexed when the snapshot is built, so lookups do
+    not walk the nested sections. Top-level sections are also available as
+    attributes (snapshot.bedrock.advanced.region_name).
+    """
+    
+    def __init__(self, data: Dict[str, Any], path: Optional[Path] = None, mtime: Optional[float] = None):
+        """
+        Build a snapshot.
+        
+        Args:
+            data: Merged configuration
+            path: File the configuration was loaded from
+            mtime: Modification time of the file when it was loaded
+        """
+        root = freeze(data)
+        index = {}
+        
+        def add(prefix: str, section: ConfigSection) -> None:
+            for key, value in section.items():
+                # Keys that Config.get() cannot address are not indexed
+                if not isinstance(key, str) or '.' in key:
+                    continue
+                key_path = f"{prefix}.{key}" if prefix else key
+                index[key_path] = value
+                if isinstance(value, ConfigSection):
+                    add(key_path, value)
+        
+        add('', root)
+        object.__setattr__(self, 'root', root)
+        object.__setattr__(self, 'path', path)
+        object.__setattr__(self, 'mtime', mtime)
+        object.__setattr__(self, '_index', index)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError("ConfigSnapshot is immutable")
+    
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.root[name]
+        except KeyError:
+            raise AttributeError(name) from None
+    
+    def get(self, key_path: str, default: Any = None) -> Any:
+        """Get a value by dotted key path."""
+        return self._index.get(key_path, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a mutable copy of the configuration."""
+        return thaw(self.root)
+
 
 class Config:
     """Configuration manager for the analyst package."""
     
     _instance = None
-    _config = None
+    _snapshot = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -22,18 +135,24 @@ class Config:
         return cls._instance
     
     def __init__(self):
-        if self._config is None:
+        if self._snapshot is None:
+            self._lock = threading.RLock()
+            self._subscribers: List[Callable[[ConfigSnapshot, ConfigSnapshot], None]] = []
+            self._next_check = 0.0
             self._load_config()
     
-    def _load_config(self):
-        """Load configuration from config.yml file."""
+    @staticmethod
+    def _config_path() -> Path:
+        """Get the path of config.yml in the project root."""
         # Find config.yml in project root (parent directory of analyst package)
-        current_dir = Path(__file__).parent
-        project_root = current_dir.parent
-        config_path = project_root / "config.yml"
+        return Path(__file__).parent.parent / "config.yml"
+    
+    def _load_config(self):
+        """Load configuration from config.yml file into a new snapshot."""
+        config_path = self._config_path()
         
         # Default configuration
-        self._config = {
+        config_data = {
             "rss": {
                 "default_items": 10,
                 "max_items": 50,
@@ -44,7 +163,17 @@ class Config:
                 "output_dir": "articles",
                 "timeout": 30,
                 "download_images": True,
-                "max_images": 20
+                "max_images": 20,
+                "content_format": "markdown",
+                "max_content_tokens": 6000
+            },
+            "summarize": {
+                "chunk_tokens": 3000,
+                "max_in_flight": 4,
+                "reduce_tokens": 12000,
+                "chunk_summary_words": 200,
+                "summary_words": 500,
+                "save_summary": True
             },
             "markdown": {
                 "output_format": "markdown",
@@ -64,18 +193,22 @@ class Config:
             "chat": {
                 "session_dir": "refer/chat-sessions",
                 "window_size": 20,
+                "max_context_tokens": 60000,
+                "summarize_evicted": False,
                 "save_on_exit": True,
                 "session_timeout": 0
             },
             "app": {
                 "name": "Strands Analyst",
-                "version": "0.1.0"
+                "version": "0.1.0",
+                "config_reload_interval": 2.0
             },
             "logging": {
                 "level": "INFO",
                 "show_by_default": False,
                 "show_in_verbose": True,
                 "format": "%(levelname)s | %(name)s | %(message)s",
+                "output_format": "text",
                 "enabled": True
             },
             "metrics": {
@@ -93,6 +226,21 @@ class Config:
                     "colors": True,
                     "minimalist": True,
                     "add_spacing": True
+                },
+                "tracing": {
+                    "file": "refer/traces.jsonl",
+                    "format": "jsonl"
+                },
+                "profiling": {
+                    "output_dir": "refer/profiles",
+                    "mode": "sampling",
+                    "sample_interval": 0.005,
+                    "memory_top": 25
+                },
+                "endpoint": {
+                    "enabled": False,
+                    "host": "127.0.0.1",
+                    "port": 9464
                 }
             },
             "bedrock": {
@@ -102,6 +250,24 @@ class Config:
                         "fast": "us.anthropic.claude-3-7-sonnet-20250219-v1:0",
                         "reasoning": "us.anthropic.claude-3-7-sonnet-20250219-v1:0",
                         "chat": "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
+                    },
+                    "warmup": {
+                        "mode": "lazy",
+                        "max_workers": 4
+                    },
+                    "routing": {
+                        "latency_aware": False,
+                        "latency_slo_ms": {
+                            "simple": 2000,
+                            "moderate": 4000,
+                            "complex": 8000,
+                            "reasoning": 8000
+                        },
+                        "ewma_alpha": 0.3,
+                        "min_samples": 5,
+                        "max_error_rate": 0.25,
+                        "probe_interval": 20,
+                        "stats_file": "refer/model-latency.json"
                     }
                 },
                 "performance": {
@@ -140,12 +306,29 @@ class Config:
                     "caching": {
                         "cache_prompt": True,
                         "cache_tools": True,
+                        "cache_point_type": "default",
                         "cache_timeout": 3600
                     },
                     "timeouts": {
                         "connection_timeout": 30,
                         "read_timeout": 120,
                         "total_timeout": 180
+                    },
+                    "client": {
+                        "max_pool_connections": 50,
+                        "retry_mode": "adaptive",
+                        "max_attempts": 3,
+                        "tcp_keepalive": True
+                    },
+                    "region_routing": {
+                        "enabled": False,
+                        "regions": [],
+                        "probe_interval": 300,
+                        "probe_model_id": None,
+                        "ewma_alpha": 0.3,
+                        "max_failures": 2,
+                        "tolerance_ms": 50,
+                        "stats_file": "refer/region-latency.json"
                     }
                 },
                 "agents": {
@@ -171,17 +354,37 @@ class Config:
                         "optimize_system_prompt": True,
                         "session_optimization": True,
                         "multimodal": True
+                    },
+                    "summarize": {
+                        "model_id": None,
+                        "reasoning_mode": False,
+                        "optimize_system_prompt": True
                     }
                 },
                 "cost_optimization": {
                     "track_usage": True,
                     "cost_warnings": True,
                     "hourly_token_limit": 0,
-                    "hourly_cost_limit": 0.0
+                    "hourly_cost_limit": 0.0,
+                    "rate_limiter": {
+                        "enabled": False,
+                        "initial_concurrency": 4,
+                        "max_concurrency": 16,
+                        "requests_per_minute": 0,
+                        "throttle_cooldown": 1.0,
+                        "max_throttle_cooldown": 30.0,
+                        "pricing": {}
+                    },
+                    "ledger": {
+                        "file": "refer/usage.db",
+                        "batch_size": 50,
+                        "flush_interval": 5.0
+                    }
                 }
             },
             "community_tools": {
                 "enabled": True,
+                "manifest_file": None,
                 "consent": {
                     "require_consent": True,
                     "bypass_for_safe_tools": True,
@@ -271,15 +474,21 @@ class Config:
         }
         
         # Load from file if it exists
+        mtime = None
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    file_config = yaml.safe_load(f)
-                    if file_config:
-                        self._deep_merge(self._config, file_config)
+                mtime = config_path.stat().st_mtime
+                file_config = load_yaml(config_path)
+                if file_config:
+                    self._deep_merge(config_data, file_config)
             except Exception as e:
+                if self._snapshot is not None:
+                    # Reload: keep the current configuration (see reload())
+                    raise
                 print(f"Warning: Could not load config.yml: {e}")
                 print("Using default configuration.")
+        
+        self._snapshot = ConfigSnapshot(config_data, config_path, mtime)
     
     def _deep_merge(self, base_dict: Dict, update_dict: Dict):
         """Recursively merge update_dict into base_dict."""
@@ -300,15 +509,50 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split('.')
-        value = self._config
-        
+        return self.snapshot.get(key_path, default)
+    
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Get the current configuration snapshot, reloading it if config.yml changed."""
+        snapshot = self._snapshot
+        interval = snapshot.get('app.config_reload_interval', 2.0)
+        if interval and interval > 0:
+            now = time.monotonic()
+            if now >= self._next_check:
+                self._next_check = now + interval
+                self._reload_if_changed()
+                snapshot = self._snapshot
+        return snapshot
+    
+    def _reload_if_changed(self) -> None:
+        """Reload the configuration if config.yml's modification time changed."""
         try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+            mtime = self._config_path().stat().st_mtime
+        except OSError:
+            mtime = None
+        with self._lock:
+            if mtime != self._snapshot.mtime:
+                self.reload()
+    
+    def subscribe(self, callback: Callable[[ConfigSnapshot, ConfigSnapshot], None]) -> Callable[[], None]:
+        """
+        Call a function after every configuration reload.
+        
+        Args:
+            callback: Called with the previous and the new snapshot
+            
+        Returns:
+            Function that removes the subscription
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        
+        return unsubscribe
     
     def get_rss_default_items(self) -> int:
         """Get the default number of RSS items to fetch and display."""
@@ -339,6 +583,39 @@ class Config:
         """Get the maximum number of images to download per article."""
         return self.get('article.max_images', 20)
     
+    def get_article_content_format(self) -> str:
+        """Get the format of article content returned to the model (markdown, text or html)."""
+        return self.get('article.content_format', 'markdown')
+    
+    def get_article_max_content_tokens(self) -> int:
+        """Get the token budget for article content returned to the model (0 = no limit)."""
+        return self.get('article.max_content_tokens', 6000)
+    
+    # Summarization configuration getters
+    def get_summarize_chunk_tokens(self) -> int:
+        """Get the maximum number of tokens per map chunk."""
+        return self.get('summarize.chunk_tokens', 3000)
+    
+    def get_summarize_max_in_flight(self) -> int:
+        """Get the maximum number of concurrent summarization requests."""
+        return self.get('summarize.max_in_flight', 4)
+    
+    def get_summarize_reduce_tokens(self) -> int:
+        """Get the maximum number of tokens of chunk summaries combined in one reduce call."""
+        return self.get('summarize.reduce_tokens', 12000)
+    
+    def get_summarize_chunk_summary_words(self) -> int:
+        """Get the target length in words of each chunk summary."""
+        return self.get('summarize.chunk_summary_words', 200)
+    
+    def get_summarize_summary_words(self) -> int:
+        """Get the target length in words of the final summary."""
+        return self.get('summarize.summary_words', 500)
+    
+    def get_summarize_save_summary(self) -> bool:
+        """Get whether to save the summary next to the source document."""
+        return self.get('summarize.save_summary', True)
+    
     # Markdown configuration getters
     def get_markdown_output_format(self) -> str:
         """Get the output format for markdown files."""
@@ -387,6 +664,14 @@ class Config:
         """Get the default conversation window size."""
         return self.get('chat.window_size', 20)
     
+    def get_chat_max_context_tokens(self) -> int:
+        """Get the token budget for conversation history (0 = no limit)."""
+        return self.get('chat.max_context_tokens', 60000)
+    
+    def get_chat_summarize_evicted(self) -> bool:
+        """Get whether turns evicted from the conversation window are summarized."""
+        return self.get('chat.summarize_evicted', False)
+    
     def get_chat_save_on_exit(self) -> bool:
         """Get whether to save conversation summaries on exit by default."""
         return self.get('chat.save_on_exit', True)
@@ -416,6 +701,10 @@ class Config:
         """Get the logging format string."""
         return self.get('logging.format', '%(levelname)s | %(name)s | %(message)s')
     
+    def get_logging_output_format(self) -> str:
+        """Get the log output format: "text" or "json" (one JSON object per line)."""
+        return str(self.get('logging.output_format', 'text')).lower()
+    
     # Metrics configuration getters
     def get_metrics_show_by_default(self) -> bool:
         """Get whether to show metrics by default (non-verbose mode)."""
@@ -461,6 +750,42 @@ class Config:
         """Get whether to add spacing around metrics."""
         return self.get('metrics.display.add_spacing', True)
     
+    def get_tracing_file(self) -> str:
+        """Get the file --trace writes spans to."""
+        return self.get('metrics.tracing.file', 'refer/traces.jsonl')
+    
+    def get_tracing_format(self) -> str:
+        """Get the trace file format: "jsonl" (one span per line) or "otlp" (OTLP/JSON)."""
+        return str(self.get('metrics.tracing.format', 'jsonl')).lower()
+    
+    def get_profiling_output_dir(self) -> str:
+        """Get the directory --profile writes its reports to."""
+        return self.get('metrics.profiling.output_dir', 'refer/profiles')
+    
+    def get_profiling_mode(self) -> str:
+        """Get the default profiler: "sampling" (all threads) or "deterministic" (cProfile)."""
+        return str(self.get('metrics.profiling.mode', 'sampling')).lower()
+    
+    def get_profiling_sample_interval(self) -> float:
+        """Get the seconds between stack samples in sampling mode."""
+        return float(self.get('metrics.profiling.sample_interval', 0.005))
+    
+    def get_profiling_memory_top(self) -> int:
+        """Get the number of allocation sites reported by --profile-memory."""
+        return int(self.get('metrics.profiling.memory_top', 25))
+    
+    def get_metrics_endpoint_enabled(self) -> bool:
+        """Get whether agents serve Prometheus metrics over HTTP."""
+        return bool(self.get('metrics.endpoint.enabled', False))
+    
+    def get_metrics_endpoint_host(self) -> str:
+        """Get the address the metrics endpoint binds to."""
+        return self.get('metrics.endpoint.host', '127.0.0.1')
+    
+    def get_metrics_endpoint_port(self) -> int:
+        """Get the port of the metrics endpoint."""
+        return int(self.get('metrics.endpoint.port', 9464))
+    
     # Bedrock model configuration getters
     def get_bedrock_default_model_id(self) -> str:
         """Get the default Bedrock model ID."""
@@ -482,6 +807,39 @@ class Config:
         """Get the chat model ID."""
         return self.get('bedrock.model.models.chat', 'us.anthropic.claude-3-7-sonnet-20250219-v1:0')
     
+    def get_bedrock_warmup_mode(self) -> str:
+        """Get the model warm-up mode: 'background' or 'lazy'."""
+        return self.get('bedrock.model.warmup.mode', 'lazy')
+    
+    def get_bedrock_warmup_max_workers(self) -> int:
+        """Get the maximum number of models warmed up concurrently."""
+        return self.get('bedrock.model.warmup.max_workers', 4)
+    
+    def get_bedrock_latency_routing_config(self) -> dict:
+        """Get the latency-aware model routing configuration."""
+        return {
+            'enabled': self.get('bedrock.model.routing.latency_aware', False),
+            'slo_ms': self.get('bedrock.model.routing.latency_slo_ms', {}),
+            'ewma_alpha': self.get('bedrock.model.routing.ewma_alpha', 0.3),
+            'min_samples': self.get('bedrock.model.routing.min_samples', 5),
+            'max_error_rate': self.get('bedrock.model.routing.max_error_rate', 0.25),
+            'probe_interval': self.get('bedrock.model.routing.probe_interval', 20),
+            'stats_file': self.get('bedrock.model.routing.stats_file', 'refer/model-latency.json')
+        }
+    
+    def get_bedrock_region_routing_config(self) -> dict:
+        """Get the multi-region routing configuration."""
+        return {
+            'enabled': self.get('bedrock.advanced.region_routing.enabled', False),
+            'regions': list(self.get('bedrock.advanced.region_routing.regions', []) or []),
+            'probe_interval': self.get('bedrock.advanced.region_routing.probe_interval', 300),
+            'probe_model_id': self.get('bedrock.advanced.region_routing.probe_model_id'),
+            'ewma_alpha': self.get('bedrock.advanced.region_routing.ewma_alpha', 0.3),
+            'max_failures': self.get('bedrock.advanced.region_routing.max_failures', 2),
+            'tolerance_ms': self.get('bedrock.advanced.region_routing.tolerance_ms', 50),
+            'stats_file': self.get('bedrock.advanced.region_routing.stats_file', 'refer/region-latency.json')
+        }
+    
     # Bedrock performance configuration getters
     def get_bedrock_temperature(self, agent_name: str = None) -> float:
         """Get the temperature setting for an agent or default."""
@@ -512,8 +870,8 @@ class Config:
         if agent_name:
             stop_seq = self.get(f'bedrock.performance.stop_sequences.{agent_name}')
             if stop_seq is not None:
-                return stop_seq
-        return self.get('bedrock.performance.stop_sequences.default', [])
+                return list(stop_seq)
+        return list(self.get('bedrock.performance.stop_sequences.default', []))
     
     # Bedrock advanced configuration getters
     def get_bedrock_streaming(self) -> bool:
@@ -540,6 +898,10 @@ class Config:
         """Get whether tool caching is enabled."""
         return self.get('bedrock.advanced.caching.cache_tools', True)
     
+    def get_bedrock_cache_point_type(self) -> str:
+        """Get the cache point type placed after the system prompt and tool definitions."""
+        return self.get('bedrock.advanced.caching.cache_point_type', 'default')
+    
     def get_bedrock_cache_timeout(self) -> int:
         """Get the cache timeout in seconds."""
         return self.get('bedrock.advanced.caching.cache_timeout', 3600)
@@ -556,6 +918,22 @@ class Config:
         """Get the total request timeout in seconds."""
         return self.get('bedrock.advanced.timeouts.total_timeout', 180)
     
+    def get_bedrock_max_pool_connections(self) -> int:
+        """Get the maximum number of pooled connections per Bedrock client."""
+        return self.get('bedrock.advanced.client.max_pool_connections', 50)
+    
+    def get_bedrock_retry_mode(self) -> str:
+        """Get the botocore retry mode: 'adaptive', 'standard' or 'legacy'."""
+        return self.get('bedrock.advanced.client.retry_mode', 'adaptive')
+    
+    def get_bedrock_max_attempts(self) -> int:
+        """Get the maximum botocore attempts per Bedrock request, including the first."""
+        return self.get('bedrock.advanced.client.max_attempts', 3)
+    
+    def get_bedrock_tcp_keepalive(self) -> bool:
+        """Get whether TCP keep-alive is enabled on Bedrock connections."""
+        return self.get('bedrock.advanced.client.tcp_keepalive', True)
+    
     # Bedrock agent-specific configuration getters
     def get_bedrock_reasoning_mode(self, agent_name: str) -> bool:
         """Get whether reasoning mode is enabled for a specific agent."""
@@ -594,11 +972,55 @@ class Config:
         """Get the hourly cost limit in USD (0.0 = no limit)."""
         return self.get('bedrock.cost_optimization.hourly_cost_limit', 0.0)
     
+    def get_rate_limiter_enabled(self) -> bool:
+        """Get whether model calls go through the shared rate limiter."""
+        return self.get('bedrock.cost_optimization.rate_limiter.enabled', False)
+    
+    def get_rate_limiter_initial_concurrency(self) -> int:
+        """Get the number of model calls allowed in flight at start."""
+        return self.get('bedrock.cost_optimization.rate_limiter.initial_concurrency', 4)
+    
+    def get_rate_limiter_max_concurrency(self) -> int:
+        """Get the upper bound for the adaptive concurrency limit."""
+        return self.get('bedrock.cost_optimization.rate_limiter.max_concurrency', 16)
+    
+    def get_rate_limiter_requests_per_minute(self) -> float:
+        """Get the maximum model request rate (0 = no limit)."""
+        return self.get('bedrock.cost_optimization.rate_limiter.requests_per_minute', 0)
+    
+    def get_rate_limiter_throttle_cooldown(self) -> float:
+        """Get the seconds new model calls pause after the first throttle in a row (0 = no pause)."""
+        return self.get('bedrock.cost_optimization.rate_limiter.throttle_cooldown', 1.0)
+    
+    def get_rate_limiter_max_throttle_cooldown(self) -> float:
+        """Get the upper bound of the throttle cool-down, which doubles with each throttle in a row."""
+        return self.get('bedrock.cost_optimization.rate_limiter.max_throttle_cooldown', 30.0)
+    
+    def get_rate_limiter_pricing(self) -> Dict[str, Any]:
+        """Get model price overrides (USD per million input/output tokens by model ID substring)."""
+        return self.get('bedrock.cost_optimization.rate_limiter.pricing', {}) or {}
+    
+    def get_usage_ledger_file(self) -> str:
+        """Get the SQLite file that agent invocations are recorded in."""
+        return self.get('bedrock.cost_optimization.ledger.file', 'refer/usage.db')
+    
+    def get_usage_ledger_batch_size(self) -> int:
+        """Get the maximum number of usage records written per transaction."""
+        return self.get('bedrock.cost_optimization.ledger.batch_size', 50)
+    
+    def get_usage_ledger_flush_interval(self) -> float:
+        """Get the seconds a usage record may wait before it is written."""
+        return self.get('bedrock.cost_optimization.ledger.flush_interval', 5.0)
+    
     # Community tools configuration getters
     def get_community_tools_enabled(self) -> bool:
         """Get whether community tools are enabled globally."""
         return self.get('community_tools.enabled', True)
     
+    def get_community_tools_manifest_file(self) -> Optional[str]:
+        """Get the file that caches the community tool specifications (None = in the user cache directory)."""
+        return self.get('community_tools.manifest_file')
+    
     def get_community_tools_require_consent(self) -> bool:
         """Get whether tools require user consent by default."""
         return self.get('community_tools.consent.require_consent', True)
@@ -609,8 +1031,8 @@ class Config:
     
     def get_community_tools_always_consent(self) -> list:
         """Get list of tools that always require consent."""
-        return self.get('community_tools.consent.always_require_consent', 
-                       ["shell", "python_repl", "file_write", "editor", "use_agent", "swarm", "workflow"])
+        return list(self.get('community_tools.consent.always_require_consent', 
+                            ["shell", "python_repl", "file_write", "editor", "use_agent", "swarm", "workflow"]))
     
     def get_community_tools_handoff_enabled(self) -> bool:
         """Get whether human-in-the-loop handoff is enabled."""
@@ -704,9 +1126,26 @@ class Config:
         }
     
     def reload(self):
-        """Reload configuration from file."""
-        self._config = None
-        self._load_config()
+        """
+        Reload configuration from file and notify subscribers.
+        
+        If config.yml cannot be read, for example while an edit is half saved,
+        the current configuration stays in place and the next check retries.
+        """
+        with self._lock:
+            previous = self._snapshot
+            try:
+                self._load_config()
+            except Exception as e:
+                print(f"Warning: Could not reload config.yml, keeping the current configuration: {e}")
+                return
+            current = self._snapshot
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(previous, current)
+            except Exception as e:
+                print(f"Warning: Configuration change handler failed: {e}")
 
 
 # Global configuration instance
@@ -749,6 +1188,46 @@ def get_article_max_images() -> int:
     return config.get_article_max_images()
 
 
+def get_article_content_format() -> str:
+    """Get the format of article content returned to the model (markdown, text or html)."""
+    return config.get_article_content_format()
+
+
+def get_article_max_content_tokens() -> int:
+    """Get the token budget for article content returned to the model (0 = no limit)."""
+    return config.get_article_max_content_tokens()
+
+
+def get_summarize_chunk_tokens() -> int:
+    """Get the maximum number of tokens per map chunk."""
+    return config.get_summarize_chunk_tokens()
+
+
+def get_summarize_max_in_flight() -> int:
+    """Get the maximum number of concurrent summarization requests."""
+    return config.get_summarize_max_in_flight()
+
+
+def get_summarize_reduce_tokens() -> int:
+    """Get the maximum number of tokens of chunk summaries combined in one reduce call."""
+    return config.get_summarize_reduce_tokens()
+
+
+def get_summarize_chunk_summary_words() -> int:
+    """Get the target length in words of each chunk summary."""
+    return config.get_summarize_chunk_summary_words()
+
+
+def get_summarize_summary_words() -> int:
+    """Get the target length in words of the final summary."""
+    return config.get_summarize_summary_words()
+
+
+def get_summarize_save_summary() -> bool:
+    """Get whether to save the summary next to the source document."""
+    return config.get_summarize_save_summary()
+
+
 def get_markdown_output_format() -> str:
     """Get the output format for markdown files."""
     return config.get_markdown_output_format()
@@ -804,6 +1283,16 @@ def get_chat_window_size() -> int:
     return config.get_chat_window_size()
 
 
+def get_chat_max_context_tokens() -> int:
+    """Get the token budget for conversation history (0 = no limit)."""
+    return config.get_chat_max_context_tokens()
+
+
+def get_chat_summarize_evicted() -> bool:
+    """Get whether turns evicted from the conversation window are summarized."""
+    return config.get_chat_summarize_evicted()
+
+
 def get_chat_save_on_exit() -> bool:
     """Get whether to save conversation summaries on exit by default."""
     return config.get_chat_save_on_exit()
@@ -832,6 +1321,36 @@ def get_bedrock_config_for_agent(agent_name: str) -> dict:
     }
 
 
+# Bedrock model families that accept cache points on the system prompt and on tool definitions
+_PROMPT_CACHE_MODELS = ('anthropic.claude', 'amazon.nova')
+_TOOL_CACHE_MODELS = ('anthropic.claude',)
+
+
+def get_bedrock_cache_options(model_id: str, cache_prompt: Optional[bool] = None,
+                              cache_tools: Optional[bool] = None) -> dict:
+    """
+    Get the BedrockModel caching options for a model.
+    
+    Returns cache_prompt/cache_tools cache point settings when caching is enabled in
+    configuration (or by the explicit arguments) and supported by the model family,
+    so they can be passed straight to BedrockModel(**options). Pass cache_prompt=False
+    for agents without a system prompt, since the cache point would have nothing to cache.
+    """
+    if cache_prompt is None:
+        cache_prompt = config.get_bedrock_cache_prompt()
+    if cache_tools is None:
+        cache_tools = config.get_bedrock_cache_tools()
+    
+    cache_point_type = config.get_bedrock_cache_point_type()
+    model_id = model_id or ''
+    options = {}
+    if cache_prompt and any(family in model_id for family in _PROMPT_CACHE_MODELS):
+        options['cache_prompt'] = cache_point_type
+    if cache_tools and any(family in model_id for family in _TOOL_CACHE_MODELS):
+        options['cache_tools'] = cache_point_type
+    return options
+
+
 def get_bedrock_default_model_id() -> str:
     """Get the default Bedrock model ID."""
     return config.get_bedrock_default_model_id()
@@ -847,6 +1366,26 @@ def get_bedrock_region() -> str:
     return config.get_bedrock_region()
 
 
+def get_bedrock_warmup_mode() -> str:
+    """Get the model warm-up mode: 'background' or 'lazy'."""
+    return config.get_bedrock_warmup_mode()
+
+
+def get_bedrock_warmup_max_workers() -> int:
+    """Get the maximum number of models warmed up concurrently."""
+    return config.get_bedrock_warmup_max_workers()
+
+
+def get_bedrock_latency_routing_config() -> dict:
+    """Get the latency-aware model routing configuration."""
+    return config.get_bedrock_latency_routing_config()
+
+
+def get_bedrock_region_routing_config() -> dict:
+    """Get the multi-region routing configuration."""
+    return config.get_bedrock_region_routing_config()
+
+
 # Community tools configuration convenience functions
 def get_community_tools_enabled() -> bool:
     """Get whether community tools are enabled globally."""
@@ -8,6 +8,8 @@ import os
 from pathlib import Path
 from typing import Dict, Any
 
+from .startup_cache import read_text
+
 
 def load_prompt(prompt_name: str) -> str:
     """
@@ -30,8 +32,7 @@ def load_prompt(prompt_name: str) -> str:
     if not prompt_file.exists():
         raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
     
-    with open(prompt_file, 'r', encoding='utf-8') as f:
-        return f.read().strip()
+    return read_text(prompt_file).strip()
 
 
 def format_prompt(prompt_name: str, **kwargs) -> str:
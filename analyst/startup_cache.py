@@ -0,0 +1,159 @@
+"""
+Startup cache for parsed configuration and prompt files.
+
+Every process used to parse config.yml with the pure-Python YAML loader and
+re-read try-prompts.yml and the prompt templates. load_yaml() parses with the
+C YAML loader when PyYAML was built with libyaml, and stores the result as a
+marshal file keyed by the source path, its modification time and size, the
+package version and the Python version, so later processes skip parsing
+altogether. Both loaders also keep results in memory and only stat the
+source file on repeated calls.
+
+The cache lives in $ANALYST_CACHE_DIR, or strands-analyst in the user cache
+directory. Set ANALYST_CACHE_DIR to an empty string to disable the on-disk
+cache.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # PyYAML without libyaml
+    _YamlLoader = yaml.SafeLoader
+
+# Version of the cache format; part of every cache key
+_CACHE_FORMAT = 1
+
+_memory: Dict[Tuple[str, str], Tuple[tuple, Any]] = {}
+_lock = threading.Lock()
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Get the startup cache directory, or None if the on-disk cache is disabled."""
+    cache_dir = os.environ.get('ANALYST_CACHE_DIR')
+    if cache_dir is not None:
+        return Path(cache_dir).expanduser() if cache_dir else None
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'strands-analyst'
+
+
+def _source_key(path: Path) -> Optional[tuple]:
+    """Get the cache key of a source file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    from . import __version__
+    return (str(path), stat.st_mtime_ns, stat.st_size, __version__, sys.version_info[:2], _CACHE_FORMAT)
+
+
+def _cache_file(cache_dir: Path, path: Path) -> Path:
+    digest = hashlib.sha1(str(path).encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f"{path.name}.{digest}.marshal"
+
+
+def _read_cache(cache_file: Path, key: tuple) -> Tuple[bool, Any]:
+    """Read a cache file; returns (hit, data)."""
+    try:
+        cached_key, data = marshal.loads(cache_file.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return False, None
+    return (True, data) if tuple(cached_key) == key else (False, None)
+
+
+def _write_cache(cache_file: Path, key: tuple, data: Any) -> None:
+    """Write a cache file atomically; values marshal cannot store are not cached."""
+    try:
+        payload = marshal.dumps((key, data))
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        temp_file.write_bytes(payload)
+        os.replace(temp_file, cache_file)
+    except (OSError, ValueError):
+        pass
+
+
+def load_yaml(path: Path) -> Any:
+    """
+    Load a YAML file through the startup cache.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        Parsed content; do not modify it, it is shared with later calls
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file cannot be parsed
+    """
+    path = Path(path).resolve()
+    key = _source_key(path)
+    if key is None:
+        raise FileNotFoundError(f"File not found: {path}")
+
+    with _lock:
+        cached = _memory.get(('yaml', str(path)))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    cache_dir = get_cache_dir()
+    hit, data = _read_cache(_cache_file(cache_dir, path), key) if cache_dir else (False, None)
+    if not hit:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        if cache_dir:
+            _write_cache(_cache_file(cache_dir, path), key, data)
+
+    with _lock:
+        _memory[('yaml', str(path))] = (key, data)
+    return data
+
+
+def read_text(path: Path) -> str:
+    """
+    Read a text file, reusing the content while the file is unchanged.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(path).resolve()
+    key = _source_key(path)
+    if key is None:
+        raise FileNotFoundError(f"File not found: {path}")
+
+    with _lock:
+        cached = _memory.get(('text', str(path)))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    text = path.read_text(encoding='utf-8')
+    with _lock:
+        _memory[('text', str(path))] = (key, text)
+    return text
+
+
+def clear_cache(on_disk: bool = False) -> None:
+    """
+    Clear the in-memory cache, and optionally the cache files.
+
+    Args:
+        on_disk: Also delete the marshal files in the cache directory
+    """
+    with _lock:
+        _memory.clear()
+    cache_dir = get_cache_dir()
+    if on_disk and cache_dir and cache_dir.is_dir():
+        for cache_file in cache_dir.glob('*.marshal'):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
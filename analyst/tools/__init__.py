@@ -1,17 +1,31 @@
 """
 Tools module - Contains reusable tools for agents.
+
+Tools are imported on first access, so an agent only loads the libraries of
+the tools it uses.
 """
 
-from .fetch_url_metadata import fetch_url_metadata
-from .fetch_rss_content import fetch_rss_content
-from .download_article_content import download_article_content
-from .convert_html_to_markdown import convert_html_to_markdown
-from .pdf_to_markdown import pdf_to_markdown
-from .download_pdf_to_markdown import download_pdf_to_markdown
-from .speak_tool import speak_custom
-from .save_file import save_file
-from .save_file_smart import save_file_smart
-from .http_request_tool import http_request_custom
-from .python_repl_tool import python_repl_custom
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "fetch_url_metadata": (".fetch_url_metadata", "fetch_url_metadata"),
+    "fetch_url_metadata_async": (".fetch_url_metadata", "fetch_url_metadata_async"),
+    "fetch_rss_content": (".fetch_rss_content", "fetch_rss_content"),
+    "fetch_rss_content_async": (".fetch_rss_content", "fetch_rss_content_async"),
+    "download_article_content": (".download_article_content", "download_article_content"),
+    "download_article_content_async": (".download_article_content", "download_article_content_async"),
+    "convert_html_to_markdown": (".convert_html_to_markdown", "convert_html_to_markdown"),
+    "pdf_to_markdown": (".pdf_to_markdown", "pdf_to_markdown"),
+    "download_pdf_to_markdown": (".download_pdf_to_markdown", "download_pdf_to_markdown"),
+    "summarize_document": (".summarize_document", "summarize_document"),
+    "speak_custom": (".speak_tool", "speak_custom"),
+    "save_file": (".save_file", "save_file"),
+    "save_file_smart": (".save_file_smart", "save_file_smart"),
+    "http_request_custom": (".http_request_tool", "http_request_custom"),
+    "http_request_custom_async": (".http_request_tool", "http_request_custom_async"),
+    "python_repl_custom": (".python_repl_tool", "python_repl_custom"),
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = ["fetch_url_metadata", "fetch_rss_content", "download_article_content", "convert_html_to_markdown", "pdf_to_markdown", "download_pdf_to_markdown", "speak_custom", "save_file", "save_file_smart", "http_request_custom", "python_repl_custom"]
\ No newline at end of file
+lazy_exports(__name__, _EXPORTS)
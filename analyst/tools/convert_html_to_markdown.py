@@ -10,6 +10,7 @@ from markdownify import markdownify as md
 from strands import tool
 
 from ..config import get_markdown_output_format, get_markdown_heading_style, get_markdown_include_metadata
+from ..utils.tracing import span
 
 
 def validate_html_file(file_path: str) -> bool:
@@ -208,20 +209,22 @@ def convert_html_to_markdown(html_file_path: str, output_filename: Optional[str]
         html_path = Path(html_file_path)
         html_content = html_path.read_text(encoding='utf-8')
         
-        # Extract metadata
-        metadata = extract_metadata_from_html(html_content, html_file_path)
-        
-        # Extract main content
-        main_content_html, word_count = extract_main_content(html_content)
-        
-        # Process images and get count
-        soup = BeautifulSoup(main_content_html, 'html.parser')
-        images_folder = html_path.parent / "images"
-        images_exist = images_folder.exists() and any(images_folder.iterdir())
-        image_count = process_image_references(soup, images_exist)
+        with span("html.parse"):
+            # Extract metadata
+            metadata = extract_metadata_from_html(html_content, html_file_path)
+            
+            # Extract main content
+            main_content_html, word_count = extract_main_content(html_content)
+            
+            # Process images and get count
+            soup = BeautifulSoup(main_content_html, 'html.parser')
+            images_folder = html_path.parent / "images"
+            images_exist = images_folder.exists() and any(images_folder.iterdir())
+            image_count = process_image_references(soup, images_exist)
         
         # Convert to markdown
-        markdown_content = convert_to_markdown(str(soup), heading_style)
+        with span("markdown.convert"):
+            markdown_content = convert_to_markdown(str(soup), heading_style)
         
         # Use same destination folder as parent of source HTML
         dest_folder = html_path.parent
@@ -243,7 +246,8 @@ def convert_html_to_markdown(html_file_path: str, output_filename: Optional[str]
         final_markdown = '\n\n'.join(final_content_parts)
         
         # Write markdown file
-        markdown_file.write_text(final_markdown, encoding='utf-8')
+        with span("file.write", file=str(markdown_file)):
+            markdown_file.write_text(final_markdown, encoding='utf-8')
         
         result = {
             'metadata': metadata,
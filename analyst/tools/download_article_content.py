@@ -1,5 +1,6 @@
 """Download web articles with metadata extraction and image handling."""
 
+import asyncio
 import os
 import re
 from datetime import datetime
@@ -8,12 +9,19 @@ from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import urllib.parse
 
+import httpx
 import requests
 from bs4 import BeautifulSoup, Comment
 from readability.readability import Document
 from strands import tool
 
-from ..config import get_article_output_dir, get_article_timeout, get_article_download_images, get_article_max_images
+from ..config import (
+    get_article_output_dir, get_article_timeout, get_article_download_images, get_article_max_images,
+    get_article_content_format, get_article_max_content_tokens, get_markdown_heading_style
+)
+from ..utils.tracing import span
+from ..utils.token_budget import estimate_tokens, compact_to_budget, strip_links_and_images, markdown_to_text
+from .convert_html_to_markdown import convert_to_markdown
 
 
 def validate_html(content: str) -> bool:
@@ -199,6 +207,41 @@ def find_images_in_content(content: str) -> List[str]:
     return list(image_urls)
 
 
+IMAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+}
+
+
+def image_filename(img_url: str, content_type: str) -> str:
+    """Determine the local filename for a downloaded image."""
+    parsed_url = urlparse(img_url)
+    filename = os.path.basename(parsed_url.path)
+    
+    # Clean up filename and ensure extension
+    if not filename or '.' not in filename:
+        if 'png' in content_type:
+            ext = '.png'
+        elif 'jpeg' in content_type or 'jpg' in content_type:
+            ext = '.jpg'
+        elif 'gif' in content_type:
+            ext = '.gif'
+        elif 'svg' in content_type:
+            ext = '.svg'
+        elif 'webp' in content_type:
+            ext = '.webp'
+        else:
+            ext = '.png'  # default
+        
+        # Create a unique filename without image_ prefix
+        filename = f"img_{abs(hash(img_url)) % 10000:04d}{ext}"
+    
+    # Remove query parameters from filename
+    return filename.split('?')[0].split('&')[0]
+
+
 def download_image(img_url: str, dest_folder: Path, base_url: str) -> Optional[str]:
     """Download an image with proper headers and return the local filename."""
     try:
@@ -206,48 +249,39 @@ def download_image(img_url: str, dest_folder: Path, base_url: str) -> Optional[s
         if not img_url.startswith(('http://', 'https://')):
             img_url = urljoin(base_url, img_url)
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Referer': base_url,
-            'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-        }
-        
-        response = requests.get(img_url, headers=headers, timeout=15, stream=True)
-        response.raise_for_status()
-        
-        # Determine filename
-        parsed_url = urlparse(img_url)
-        filename = os.path.basename(parsed_url.path)
-        
-        # Clean up filename and ensure extension
-        if not filename or '.' not in filename:
-            content_type = response.headers.get('content-type', '')
-            if 'png' in content_type:
-                ext = '.png'
-            elif 'jpeg' in content_type or 'jpg' in content_type:
-                ext = '.jpg'
-            elif 'gif' in content_type:
-                ext = '.gif'
-            elif 'svg' in content_type:
-                ext = '.svg'
-            elif 'webp' in content_type:
-                ext = '.webp'
-            else:
-                ext = '.png'  # default
+        headers = dict(IMAGE_HEADERS, Referer=base_url)
+        with span("image.download", url=img_url):
+            response = requests.get(img_url, headers=headers, timeout=15, stream=True)
+            response.raise_for_status()
+            
+            filename = image_filename(img_url, response.headers.get('content-type', ''))
+            filepath = dest_folder / filename
             
-            # Create a unique filename without image_ prefix
-            filename = f"img_{abs(hash(img_url)) % 10000:04d}{ext}"
+            with open(filepath, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    f.write(chunk)
         
-        # Remove query parameters from filename
-        filename = filename.split('?')[0].split('&')[0]
+        return filename
         
-        filepath = dest_folder / filename
+    except Exception:
+        return None
+
+
+async def download_image_async(client: httpx.AsyncClient, img_url: str, dest_folder: Path,
+                               base_url: str) -> Optional[str]:
+    """Download an image with an async client and return the local filename."""
+    try:
+        # Make URL absolute
+        if not img_url.startswith(('http://', 'https://')):
+            img_url = urljoin(base_url, img_url)
         
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        headers = dict(IMAGE_HEADERS, Referer=base_url)
+        with span("image.download", url=img_url):
+            response = await client.get(img_url, headers=headers, timeout=15)
+            response.raise_for_status()
+            
+            filename = image_filename(img_url, response.headers.get('content-type', ''))
+            await asyncio.to_thread((dest_folder / filename).write_bytes, response.content)
         
         return filename
         
@@ -478,122 +512,301 @@ def generate_html_document(content: str, metadata: Dict[str, str]) -> str:
     return html_template
 
 
-@tool
-def download_article_content(url: str, output_dir: Optional[str] = None, 
-                           download_images: Optional[bool] = None) -> Dict:
+def build_model_content(html_content: str, markdown_file: Path, content_format: str, 
+                        max_tokens: int) -> Dict:
     """
-    Download and extract content from a web article with metadata.
+    Build the compact, token-budgeted article content returned to the model.
+    
+    The full markdown is always written to markdown_file so that anything trimmed
+    from the returned content remains available on disk.
     
     Args:
-        url: URL of the article to download
-        output_dir: Directory to save files (optional, uses config default)
-        download_images: Whether to download images (optional, uses config default)
+        html_content: Cleaned article HTML
+        markdown_file: Path where the full markdown version is saved
+        content_format: Returned content format (markdown, text or html)
+        max_tokens: Token budget for the returned content (0 = no limit)
         
     Returns:
-        Dict containing article content, metadata, and file paths
+        Dict with content, token accounting and truncation details
     """
-    # Use configuration defaults if not specified
+    with span("markdown.convert"):
+        full_markdown = convert_to_markdown(html_content, get_markdown_heading_style())
+    with span("file.write", file=str(markdown_file)):
+        markdown_file.write_text(full_markdown, encoding='utf-8')
+    
+    if content_format == 'html':
+        return {
+            'content': html_content,
+            'content_format': 'html',
+            'content_tokens': estimate_tokens(html_content),
+            'markdown_file': str(markdown_file)
+        }
+    
+    compacted = compact_to_budget(strip_links_and_images(full_markdown), max_tokens)
+    content = compacted['content']
+    if content_format == 'text':
+        content = markdown_to_text(content)
+    
+    model_content = {
+        'content': content,
+        'content_format': content_format,
+        'content_tokens': estimate_tokens(content),
+        'source_html_tokens': estimate_tokens(html_content),
+        'content_truncated': compacted['truncated'],
+        'markdown_file': str(markdown_file)
+    }
+    
+    if compacted['truncated']:
+        model_content['omitted_sections'] = compacted['omitted_sections']
+        model_content['full_content_file'] = str(markdown_file)
+    
+    return model_content
+
+
+ARTICLE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; analyst-article-downloader/1.0)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+
+def resolve_article_options(output_dir: Optional[str], download_images: Optional[bool],
+                            content_format: Optional[str], max_content_tokens: Optional[int]) -> Tuple:
+    """Fill unspecified download options from configuration."""
     if output_dir is None:
         output_dir = get_article_output_dir()
     if download_images is None:
         download_images = get_article_download_images()
+    if content_format is None:
+        content_format = get_article_content_format()
+    if max_content_tokens is None:
+        max_content_tokens = get_article_max_content_tokens()
     
-    timeout = get_article_timeout()
-    max_images = get_article_max_images()
+    content_format = content_format.lower()
+    if content_format not in ('markdown', 'text', 'html'):
+        content_format = 'markdown'
     
-    try:
-        # Fetch the page with proper headers
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (compatible; analyst-article-downloader/1.0)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        html_content = response.text
-        final_url = response.url
-        
+    return output_dir, download_images, content_format, max_content_tokens
+
+
+def parse_article(html_content: str, final_url: str, output_dir: str) -> Dict:
+    """
+    Extract metadata and main content from a fetched page and create its folder.
+    
+    Returns:
+        Partial result dict with metadata, content, url, word_count and output_folder,
+        or a dict with an 'error' key
+    """
+    with span("html.parse"):
         if not validate_html(html_content):
             return {'error': 'Invalid HTML content received'}
         
         # Extract metadata
         metadata = extract_metadata(html_content, final_url)
-        
-        # Extract main content
+    
+    # Extract main content
+    with span("readability"):
         main_content, extracted_title = extract_main_content(html_content, final_url)
-        
-        if not main_content or len(main_content.strip()) < 100:
-            return {'error': 'Could not extract meaningful content from the article'}
-        
-        # Use extracted title if metadata title is generic
-        if len(metadata['title']) < 10 or metadata['title'].lower() in ['untitled', 'document']:
-            metadata['title'] = extracted_title
-        
-        result = {
-            'metadata': metadata,
-            'content': main_content,
-            'url': final_url,
-            'word_count': len(BeautifulSoup(main_content, 'html.parser').get_text().split()),
+    
+    if not main_content or len(main_content.strip()) < 100:
+        return {'error': 'Could not extract meaningful content from the article'}
+    
+    # Use extracted title if metadata title is generic
+    if len(metadata['title']) < 10 or metadata['title'].lower() in ['untitled', 'document']:
+        metadata['title'] = extracted_title
+    
+    # Create destination folder for article
+    kebab_title = create_kebab_case(metadata['title'])
+    dest_folder = Path(output_dir) / kebab_title
+    dest_folder.mkdir(parents=True, exist_ok=True)
+    
+    return {
+        'metadata': metadata,
+        'content': main_content,
+        'url': final_url,
+        'word_count': len(BeautifulSoup(main_content, 'html.parser').get_text().split()),
+        'output_folder': str(dest_folder)
+    }
+
+
+def select_images(main_content: str, dest_folder: Path, max_images: int) -> Tuple[List[str], Path]:
+    """Find the images to download and create the images folder."""
+    images_folder = dest_folder / "images"
+    images_folder.mkdir(parents=True, exist_ok=True)
+    
+    image_urls = find_images_in_content(main_content)
+    if len(image_urls) > max_images:
+        image_urls = image_urls[:max_images]
+    
+    return image_urls, images_folder
+
+
+def finalize_article(result: Dict, image_urls: List[str], local_filenames: List[Optional[str]],
+                     images_folder: Optional[Path], content_format: str, max_content_tokens: int) -> Dict:
+    """
+    Rewrite image references, save index.html and content.md, and build the tool result.
+    
+    Args:
+        result: Partial result from parse_article
+        image_urls: Image URLs that were requested
+        local_filenames: Local filename for each image URL, or None if the download failed
+        images_folder: Folder images were saved to, or None if images were not downloaded
+        content_format: Returned content format (markdown, text or html)
+        max_content_tokens: Token budget for the returned content (0 = no limit)
+    """
+    dest_folder = Path(result['output_folder'])
+    main_content = result['content']
+    final_url = result['url']
+    
+    # Prepare content for HTML generation
+    final_content = main_content
+    image_info = {'found': 0, 'downloaded': 0, 'folder': None}
+    
+    if images_folder is not None:
+        image_mapping = {}
+        for img_url, local_filename in zip(image_urls, local_filenames):
+            if local_filename:
+                # Make URL absolute for mapping
+                if not img_url.startswith(('http://', 'https://')):
+                    img_url = urljoin(final_url, img_url)
+                image_mapping[img_url] = local_filename
+        
+        # Update image references in content if any images were downloaded
+        if image_mapping:
+            final_content = update_image_references(main_content, image_mapping, final_url)
+        
+        image_info = {
+            'found': len(image_urls),
+            'downloaded': len(image_mapping),
+            'folder': str(images_folder) if image_mapping else None
         }
+    
+    # Generate and save HTML file
+    html_content = generate_html_document(final_content, result['metadata'])
+    html_file = dest_folder / "index.html"
+    with span("file.write", file=str(html_file)):
+        html_file.write_text(html_content, encoding='utf-8')
+    
+    # Update result with compact content, file paths and information
+    result.update(build_model_content(final_content, dest_folder / "content.md",
+                                      content_format, max_content_tokens))
+    result['images'] = image_info
+    result['html_file'] = str(html_file)
+    
+    return result
+
+
+@tool
+def download_article_content(url: str, output_dir: Optional[str] = None, 
+                           download_images: Optional[bool] = None,
+                           content_format: Optional[str] = None,
+                           max_content_tokens: Optional[int] = None) -> Dict:
+    """
+    Download and extract content from a web article with metadata.
+    
+    The returned content is a compact markdown (or plain text) view of the article
+    limited to a token budget. When sections are trimmed, their titles are listed in
+    omitted_sections and the complete markdown is available at full_content_file.
+    
+    Args:
+        url: URL of the article to download
+        output_dir: Directory to save files (optional, uses config default)
+        download_images: Whether to download images (optional, uses config default)
+        content_format: Format of returned content - markdown, text or html (optional, uses config default)
+        max_content_tokens: Token budget for returned content, 0 for no limit (optional, uses config default)
+        
+    Returns:
+        Dict containing article content, metadata, and file paths
+    """
+    output_dir, download_images, content_format, max_content_tokens = resolve_article_options(
+        output_dir, download_images, content_format, max_content_tokens)
+    
+    try:
+        # Fetch the page with proper headers
+        with span("http.fetch", url=url) as fetch:
+            response = requests.get(url, headers=ARTICLE_HEADERS, timeout=get_article_timeout())
+            fetch.set_attribute("status", response.status_code)
+            fetch.set_attribute("bytes", len(response.content))
+            response.raise_for_status()
         
-        # Create destination folder for article
-        kebab_title = create_kebab_case(metadata['title'])
-        dest_folder = Path(output_dir) / kebab_title
-        dest_folder.mkdir(parents=True, exist_ok=True)
+        result = parse_article(response.text, response.url, output_dir)
+        if 'error' in result:
+            return result
         
-        # Prepare content for HTML generation
-        final_content = main_content
-        image_info = {'found': 0, 'downloaded': 0, 'folder': None}
+        image_urls, local_filenames, images_folder = [], [], None
         
         # Handle image download if enabled
         if download_images:
-            images_folder = dest_folder / "images"
-            images_folder.mkdir(parents=True, exist_ok=True)
-            
-            # Find and download images
-            image_urls = find_images_in_content(main_content)
-            if len(image_urls) > max_images:
-                image_urls = image_urls[:max_images]
-            
-            image_mapping = {}
-            downloaded_count = 0
-            
-            for img_url in image_urls:
-                local_filename = download_image(img_url, images_folder, final_url)
-                if local_filename:
-                    # Make URL absolute for mapping
-                    if not img_url.startswith(('http://', 'https://')):
-                        img_url = urljoin(final_url, img_url)
-                    image_mapping[img_url] = local_filename
-                    downloaded_count += 1
-            
-            # Update image references in content if any images were downloaded
-            if image_mapping:
-                final_content = update_image_references(main_content, image_mapping, final_url)
-            
-            image_info = {
-                'found': len(image_urls),
-                'downloaded': downloaded_count,
-                'folder': str(images_folder) if downloaded_count > 0 else None
-            }
-        
-        # Generate and save HTML file
-        html_content = generate_html_document(final_content, metadata)
-        html_file = dest_folder / "index.html"
-        html_file.write_text(html_content, encoding='utf-8')
-        
-        # Update result with file paths and information
-        result['content'] = final_content
-        result['images'] = image_info
-        result['output_folder'] = str(dest_folder)
-        result['html_file'] = str(html_file)
+            image_urls, images_folder = select_images(result['content'], Path(result['output_folder']),
+                                                      get_article_max_images())
+            local_filenames = [download_image(img_url, images_folder, result['url'])
+                               for img_url in image_urls]
         
-        return result
+        return finalize_article(result, image_urls, local_filenames, images_folder,
+                                content_format, max_content_tokens)
         
     except requests.RequestException as e:
         return {'error': f'Failed to fetch URL: {str(e)}'}
     except Exception as e:
-        return {'error': f'Unexpected error: {str(e)}'}
\ No newline at end of file
+        return {'error': f'Unexpected error: {str(e)}'}
+
+
+@tool(name="download_article_content")
+async def download_article_content_async(url: str, output_dir: Optional[str] = None, 
+                                         download_images: Optional[bool] = None,
+                                         content_format: Optional[str] = None,
+                                         max_content_tokens: Optional[int] = None) -> Dict:
+    """
+    Download and extract content from a web article with metadata.
+    
+    The returned content is a compact markdown (or plain text) view of the article
+    limited to a token budget. When sections are trimmed, their titles are listed in
+    omitted_sections and the complete markdown is available at full_content_file.
+    
+    Args:
+        url: URL of the article to download
+        output_dir: Directory to save files (optional, uses config default)
+        download_images: Whether to download images (optional, uses config default)
+        content_format: Format of returned content - markdown, text or html (optional, uses config default)
+        max_content_tokens: Token budget for returned content, 0 for no limit (optional, uses config default)
+        
+    Returns:
+        Dict containing article content, metadata, and file paths
+    """
+    output_dir, download_images, content_format, max_content_tokens = resolve_article_options(
+        output_dir, download_images, content_format, max_content_tokens)
+    
+    try:
+        async with httpx.AsyncClient(timeout=get_article_timeout(), follow_redirects=True) as client:
+            # Fetch the page with proper headers
+            with span("http.fetch", url=url) as fetch:
+                response = await client.get(url, headers=ARTICLE_HEADERS)
+                fetch.set_attribute("status", response.status_code)
+                fetch.set_attribute("bytes", len(response.content))
+                response.raise_for_status()
+            
+            # Content extraction is CPU bound - keep it off the event loop
+            result = await asyncio.to_thread(parse_article, response.text, str(response.url), output_dir)
+            if 'error' in result:
+                return result
+            
+            image_urls, local_filenames, images_folder = [], [], None
+            
+            # Download images concurrently if enabled
+            if download_images:
+                image_urls, images_folder = select_images(result['content'], Path(result['output_folder']),
+                                                          get_article_max_images())
+                local_filenames = await asyncio.gather(*[
+                    download_image_async(client, img_url, images_folder, result['url'])
+                    for img_url in image_urls
+                ])
+        
+        return await asyncio.to_thread(finalize_article, result, image_urls, list(local_filenames),
+                                       images_folder, content_format, max_content_tokens)
+        
+    except httpx.HTTPError as e:
+        return {'error': f'Failed to fetch URL: {str(e)}'}
+    except Exception as e:
+        return {'error': f'Unexpected error: {str(e)}'}
@@ -7,6 +7,8 @@ from typing import Dict, Optional
 from urllib.parse import urlparse
 import requests
 
+from ..utils.tracing import span
+
 try:
     from strands import tool
     STRANDS_AVAILABLE = True
@@ -60,29 +62,30 @@ def download_pdf_from_url(url: str, timeout: int = 30) -> str:
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
         }
-        
-        # Download the PDF
-        response = requests.get(url, headers=headers, timeout=timeout, stream=True)
-        response.raise_for_status()
-        
-        # Verify it's actually a PDF by checking content type and magic bytes
-        content_type = response.headers.get('content-type', '').lower()
-        if 'pdf' not in content_type:
-            # Check first few bytes for PDF magic number
-            first_bytes = response.content[:4]
-            if not first_bytes.startswith(b'%PDF'):
-                raise ValueError(f"URL does not appear to contain a PDF file. Content-Type: {content_type}")
-        
-        # Create temporary file
-        temp_dir = tempfile.gettempdir()
-        temp_filename = f"downloaded_pdf_{hash(url) % 100000}.pdf"
-        temp_path = os.path.join(temp_dir, temp_filename)
-        
-        # Write PDF content to temporary file
-        with open(temp_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            
+        with span("http.fetch", url=url):
+            # Download the PDF
+            response = requests.get(url, headers=headers, timeout=timeout, stream=True)
+            response.raise_for_status()
+            
+            # Verify it's actually a PDF by checking content type and magic bytes
+            content_type = response.headers.get('content-type', '').lower()
+            if 'pdf' not in content_type:
+                # Check first few bytes for PDF magic number
+                first_bytes = response.content[:4]
+                if not first_bytes.startswith(b'%PDF'):
+                    raise ValueError(f"URL does not appear to contain a PDF file. Content-Type: {content_type}")
+            
+            # Create temporary file
+            temp_dir = tempfile.gettempdir()
+            temp_filename = f"downloaded_pdf_{hash(url) % 100000}.pdf"
+            temp_path = os.path.join(temp_dir, temp_filename)
+            
+            # Write PDF content to temporary file
+            with open(temp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    if chunk:
+                        f.write(chunk)
         
         return temp_path
         
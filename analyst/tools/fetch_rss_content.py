@@ -1,138 +1,199 @@
+import asyncio
 import feedparser
 import html
 import re
+import httpx
 from strands import tool
 from typing import List, Dict, Any
 from datetime import datetime
 from ..config import get_config
+from ..utils.tracing import span
 
 
-@tool
-def fetch_rss_content(url: str, max_items: int = None) -> Dict[str, Any]:
-    """
-    Fetch and parse RSS feed from a URL, returning items with proper content extraction.
+def _resolve_max_items(max_items: int = None) -> int:
+    """Apply the configured default and maximum to the requested number of items."""
+    config = get_config()
+    if max_items is None:
+        max_items = config.get_rss_default_items()
     
-    This tool properly extracts descriptions, summaries, and content from RSS feeds,
-    handling various RSS formats and cleaning HTML content for readability.
+    # Ensure max_items doesn't exceed configured maximum
+    return min(max_items, config.get_rss_max_items())
+
+
+def parse_feed(feed, max_items: int) -> Dict[str, Any]:
+    """
+    Extract feed metadata and up to max_items items from a parsed feed.
     
     Args:
-        url: RSS feed URL to fetch
-        max_items: Maximum number of items to return (defaults to config setting)
+        feed: Feed parsed by feedparser
+        max_items: Maximum number of items to return
     
     Returns:
         Dict containing feed metadata and list of items with descriptions
     """
-    # Get configuration and set default max_items if not specified
-    config = get_config()
-    if max_items is None:
-        max_items = config.get_rss_default_items()
+    if feed.bozo and hasattr(feed, 'bozo_exception'):
+        # Feed has errors but might still be parseable
+        if not feed.entries:
+            return {
+                "error": f"Failed to parse RSS feed: {feed.bozo_exception}",
+                "feed_title": None,
+                "feed_description": None,
+                "items": []
+            }
     
-    # Ensure max_items doesn't exceed configured maximum
-    max_allowed = config.get_rss_max_items()
-    max_items = min(max_items, max_allowed)
-    try:
-        # Parse the RSS feed
-        feed = feedparser.parse(url)
-        
-        if feed.bozo and hasattr(feed, 'bozo_exception'):
-            # Feed has errors but might still be parseable
-            if not feed.entries:
-                return {
-                    "error": f"Failed to parse RSS feed: {feed.bozo_exception}",
-                    "feed_title": None,
-                    "feed_description": None,
-                    "items": []
-                }
+    # Extract feed metadata
+    feed_info = {
+        "feed_title": getattr(feed.feed, 'title', 'Unknown Feed'),
+        "feed_description": getattr(feed.feed, 'description', ''),
+        "feed_link": getattr(feed.feed, 'link', ''),
+        "items": []
+    }
+    
+    # Extract items (optimized to process only max_items)
+    processed_count = 0
+    for entry in feed.entries:
+        # Early termination - stop processing once we have enough items
+        if processed_count >= max_items:
+            break
         
-        # Extract feed metadata
-        feed_info = {
-            "feed_title": getattr(feed.feed, 'title', 'Unknown Feed'),
-            "feed_description": getattr(feed.feed, 'description', ''),
-            "feed_link": getattr(feed.feed, 'link', ''),
-            "items": []
+        # Skip entries without essential data (optimization)
+        title = getattr(entry, 'title', '')
+        link = getattr(entry, 'link', '')
+        if not title and not link:
+            continue
+            
+        # Extract basic info
+        item = {
+            "title": title or 'No Title',
+            "link": link,
+            "author": getattr(entry, 'author', 'Unknown'),
+            "published": getattr(entry, 'published', ''),
+            "published_parsed": getattr(entry, 'published_parsed', None)
         }
         
-        # Extract items (optimized to process only max_items)
-        processed_count = 0
-        for entry in feed.entries:
-            # Early termination - stop processing once we have enough items
-            if processed_count >= max_items:
+        # Optimized description extraction with early termination
+        description = ""
+        
+        # Try different content fields in order of preference
+        content_fields = ['content', 'summary', 'description', 'subtitle']
+        
+        for field in content_fields:
+            if description:  # Early termination once we have description
                 break
-            
-            # Skip entries without essential data (optimization)
-            title = getattr(entry, 'title', '')
-            link = getattr(entry, 'link', '')
-            if not title and not link:
-                continue
                 
-            # Extract basic info
-            item = {
-                "title": title or 'No Title',
-                "link": link,
-                "author": getattr(entry, 'author', 'Unknown'),
-                "published": getattr(entry, 'published', ''),
-                "published_parsed": getattr(entry, 'published_parsed', None)
-            }
-            
-            # Optimized description extraction with early termination
-            description = ""
-            
-            # Try different content fields in order of preference
-            content_fields = ['content', 'summary', 'description', 'subtitle']
-            
-            for field in content_fields:
-                if description:  # Early termination once we have description
-                    break
-                    
-                if hasattr(entry, field):
-                    field_content = getattr(entry, field)
-                    
-                    if isinstance(field_content, list):
-                        # Handle content as list (common in RSS)
-                        for content_item in field_content:
-                            if isinstance(content_item, dict) and content_item.get('value'):
-                                description = content_item['value']
-                                break
-                            elif isinstance(content_item, str) and content_item.strip():
-                                description = content_item
-                                break
-                    elif isinstance(field_content, str) and field_content.strip():
-                        description = field_content
-                    elif hasattr(field_content, 'value') and field_content.value:
-                        description = field_content.value
-            
-            # Clean and process the description (only if we have one)
-            if description:
-                # Remove HTML tags and decode entities
-                description = re.sub(r'<[^>]+>', '', description)
-                description = html.unescape(description)
-                
-                # Clean up whitespace and normalize
-                description = ' '.join(description.split())
+            if hasattr(entry, field):
+                field_content = getattr(entry, field)
                 
-                # Truncate if too long (keep first 500 characters)
-                if len(description) > 500:
-                    description = description[:500] + "..."
-            
-            item["description"] = description or "No description available"
+                if isinstance(field_content, list):
+                    # Handle content as list (common in RSS)
+                    for content_item in field_content:
+                        if isinstance(content_item, dict) and content_item.get('value'):
+                            description = content_item['value']
+                            break
+                        elif isinstance(content_item, str) and content_item.strip():
+                            description = content_item
+                            break
+                elif isinstance(field_content, str) and field_content.strip():
+                    description = field_content
+                elif hasattr(field_content, 'value') and field_content.value:
+                    description = field_content.value
+        
+        # Clean and process the description (only if we have one)
+        if description:
+            # Remove HTML tags and decode entities
+            description = re.sub(r'<[^>]+>', '', description)
+            description = html.unescape(description)
             
-            # Optimized category extraction
-            categories = []
-            if hasattr(entry, 'tags') and entry.tags:
-                categories = [tag.get('term', '') for tag in entry.tags if tag.get('term')]
-            elif hasattr(entry, 'categories') and entry.categories:
-                categories = entry.categories
-            item["categories"] = categories
+            # Clean up whitespace and normalize
+            description = ' '.join(description.split())
             
-            feed_info["items"].append(item)
-            processed_count += 1
+            # Truncate if too long (keep first 500 characters)
+            if len(description) > 500:
+                description = description[:500] + "..."
         
-        return feed_info
+        item["description"] = description or "No description available"
+        
+        # Optimized category extraction
+        categories = []
+        if hasattr(entry, 'tags') and entry.tags:
+            categories = [tag.get('term', '') for tag in entry.tags if tag.get('term')]
+        elif hasattr(entry, 'categories') and entry.categories:
+            categories = entry.categories
+        item["categories"] = categories
+        
+        feed_info["items"].append(item)
+        processed_count += 1
+    
+    return feed_info
+
+
+def _parse_response(content: bytes, headers: Dict[str, str], max_items: int) -> Dict[str, Any]:
+    """Parse a downloaded feed document and extract up to max_items items."""
+    feed = feedparser.parse(content, response_headers=headers)
+    return parse_feed(feed, max_items)
+
+
+def _feed_error(e: Exception) -> Dict[str, Any]:
+    """Build the error response for a feed that could not be fetched."""
+    return {
+        "error": f"Error fetching RSS feed: {str(e)}",
+        "feed_title": None,
+        "feed_description": None,
+        "items": []
+    }
+
+
+@tool
+def fetch_rss_content(url: str, max_items: int = None) -> Dict[str, Any]:
+    """
+    Fetch and parse RSS feed from a URL, returning items with proper content extraction.
+    
+    This tool properly extracts descriptions, summaries, and content from RSS feeds,
+    handling various RSS formats and cleaning HTML content for readability.
+    
+    Args:
+        url: RSS feed URL to fetch
+        max_items: Maximum number of items to return (defaults to config setting)
+    
+    Returns:
+        Dict containing feed metadata and list of items with descriptions
+    """
+    max_items = _resolve_max_items(max_items)
+    try:
+        # feedparser downloads and parses the feed in one call
+        with span("http.fetch", url=url, includes_parse=True):
+            feed = feedparser.parse(url)
+        with span("feed.parse"):
+            return parse_feed(feed, max_items)
+    except Exception as e:
+        return _feed_error(e)
+
+
+@tool(name="fetch_rss_content")
+async def fetch_rss_content_async(url: str, max_items: int = None) -> Dict[str, Any]:
+    """
+    Fetch and parse RSS feed from a URL, returning items with proper content extraction.
+    
+    This tool properly extracts descriptions, summaries, and content from RSS feeds,
+    handling various RSS formats and cleaning HTML content for readability.
+    
+    Args:
+        url: RSS feed URL to fetch
+        max_items: Maximum number of items to return (defaults to config setting)
+    
+    Returns:
+        Dict containing feed metadata and list of items with descriptions
+    """
+    max_items = _resolve_max_items(max_items)
+    try:
+        timeout = get_config().get_rss_timeout()
+        with span("http.fetch", url=url):
+            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+                response = await client.get(url, headers={"User-Agent": feedparser.USER_AGENT})
+                response.raise_for_status()
         
+        # Parsing and HTML cleanup are CPU-bound, so they run off the event loop
+        with span("feed.parse"):
+            return await asyncio.to_thread(_parse_response, response.content, dict(response.headers), max_items)
     except Exception as e:
-        return {
-            "error": f"Error fetching RSS feed: {str(e)}",
-            "feed_title": None,
-            "feed_description": None,
-            "items": []
-        }
\ No newline at end of file
+        return _feed_error(e)
@@ -1,31 +1,20 @@
+import httpx
 import requests
 from bs4 import BeautifulSoup
 from strands import tool
 
+from ..utils.tracing import span
 
-@tool
-def fetch_url_metadata(url: str, timeout: int = 10) -> dict:
-    """
-    Efficiently fetch metadata (title, description, keywords, og tags) from a URL.
-    Only downloads until </head> is found to avoid fetching the entire body.
-    """
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; MetaScraper/1.0)"}
-    response = requests.get(url, headers=headers, stream=True, timeout=timeout)
-    response.raise_for_status()
 
-    content = []
-    for chunk in response.iter_content(chunk_size=1024, decode_unicode=True):
-        if chunk:
-            content.append(chunk)
-            joined = "".join(content)
-            if "</head>" in joined.lower():
-                break
-
-    html_head = "".join(content)
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; MetaScraper/1.0)"}
+
+
+def parse_head_metadata(html_head: str) -> dict:
+    """Extract title, description, keywords and og tags from the <head> of a page."""
     soup = BeautifulSoup(html_head, "html.parser")
 
     metadata = {
-        "title": soup.title.string.strip() if soup.title else None,
+        "title": soup.title.string.strip() if soup.title and soup.title.string else None,
         "description": None,
         "keywords": None,
         "og_title": None,
@@ -55,4 +44,48 @@ def fetch_url_metadata(url: str, timeout: int = 10) -> dict:
     if og_img and og_img.get("content"):
         metadata["og_image"] = og_img["content"].strip()
 
-    return metadata
\ No newline at end of file
+    return metadata
+
+
+@tool
+def fetch_url_metadata(url: str, timeout: int = 10) -> dict:
+    """
+    Efficiently fetch metadata (title, description, keywords, og tags) from a URL.
+    Only downloads until </head> is found to avoid fetching the entire body.
+    """
+    with span("http.fetch", url=url):
+        response = requests.get(url, headers=HEADERS, stream=True, timeout=timeout)
+        response.raise_for_status()
+
+        content = []
+        for chunk in response.iter_content(chunk_size=1024, decode_unicode=True):
+            if chunk:
+                content.append(chunk)
+                joined = "".join(content)
+                if "</head>" in joined.lower():
+                    break
+
+    with span("html.parse"):
+        return parse_head_metadata("".join(content))
+
+
+@tool(name="fetch_url_metadata")
+async def fetch_url_metadata_async(url: str, timeout: int = 10) -> dict:
+    """
+    Efficiently fetch metadata (title, description, keywords, og tags) from a URL.
+    Only downloads until </head> is found to avoid fetching the entire body.
+    """
+    content = []
+    with span("http.fetch", url=url):
+        async with httpx.AsyncClient(headers=HEADERS, timeout=timeout, follow_redirects=True) as client:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_text(chunk_size=1024):
+                    if chunk:
+                        content.append(chunk)
+                        joined = "".join(content)
+                        if "</head>" in joined.lower():
+                            break
+
+    with span("html.parse"):
+        return parse_head_metadata("".join(content))
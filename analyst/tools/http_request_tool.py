@@ -1,10 +1,32 @@
 """Custom HTTP request tool for making API calls."""
 
+import httpx
 import requests
 import json
 from typing import Optional, Dict, Any, Union
 from strands import tool
 
+def _prepare_auth(headers: Optional[Dict[str, str]], auth: Optional[Union[tuple, str]]):
+    """Return request headers and a Basic auth tuple for the given auth argument."""
+    # Prepare headers
+    request_headers = dict(headers or {})
+    
+    # Handle authentication
+    auth_param = None
+    if auth:
+        if isinstance(auth, str) and auth.startswith("Bearer "):
+            # Bearer token authentication
+            request_headers["Authorization"] = auth
+        elif isinstance(auth, str):
+            # Assume it's a bearer token without prefix
+            request_headers["Authorization"] = f"Bearer {auth}"
+        elif isinstance(auth, (tuple, list)) and len(auth) == 2:
+            # Basic authentication
+            auth_param = tuple(auth)
+    
+    return request_headers, auth_param
+
+
 @tool
 def http_request_custom(
     url: str,
@@ -57,21 +79,7 @@ def http_request_custom(
         )
     """
     try:
-        # Prepare headers
-        request_headers = headers or {}
-        
-        # Handle authentication
-        auth_param = None
-        if auth:
-            if isinstance(auth, str) and auth.startswith("Bearer "):
-                # Bearer token authentication
-                request_headers["Authorization"] = auth
-            elif isinstance(auth, str):
-                # Assume it's a bearer token without prefix
-                request_headers["Authorization"] = f"Bearer {auth}"
-            elif isinstance(auth, tuple) and len(auth) == 2:
-                # Basic authentication
-                auth_param = auth
+        request_headers, auth_param = _prepare_auth(headers, auth)
         
         # Make the request
         response = requests.request(
@@ -118,4 +126,87 @@ def http_request_custom(
             "error": "Unexpected error occurred",
             "message": str(e),
             "url": url
-        }
\ No newline at end of file
+        }
+
+
+@tool(name="http_request_custom")
+async def http_request_custom_async(
+    url: str,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    data: Optional[Union[str, Dict[str, Any]]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+    auth: Optional[Union[tuple, str]] = None,
+    timeout: int = 30
+) -> Union[Dict[str, Any], str]:
+    """
+    Make HTTP requests to any API with comprehensive authentication support.
+    
+    Args:
+        url: The URL to make the request to
+        method: HTTP method (GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS)
+        headers: Optional dictionary of HTTP headers
+        params: Optional dictionary of URL parameters for GET requests
+        data: Optional data to send in the body (for POST/PUT/PATCH)
+        json_data: Optional JSON data to send (sets Content-Type automatically)
+        auth: Optional authentication - either tuple (username, password) for Basic auth,
+              or string for Bearer token (prefix with "Bearer ")
+        timeout: Request timeout in seconds (default 30)
+        
+    Returns:
+        Response data as dict if JSON, otherwise as string
+    """
+    try:
+        request_headers, auth_param = _prepare_auth(headers, auth)
+        
+        # httpx separates form data from raw body content
+        body = {}
+        if not json_data and data is not None:
+            body = {'content': data} if isinstance(data, str) else {'data': data}
+        
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+            response = await client.request(
+                method=method.upper(),
+                url=url,
+                headers=request_headers,
+                params=params,
+                json=json_data,
+                auth=auth_param,
+                **body
+            )
+        
+        # Check for HTTP errors
+        response.raise_for_status()
+        
+        # Try to return JSON if possible
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            # Return text if not JSON
+            return response.text
+            
+    except httpx.TimeoutException:
+        return {
+            "error": "Request timed out",
+            "url": url,
+            "timeout": timeout
+        }
+    except httpx.ConnectError:
+        return {
+            "error": "Connection error - could not reach the server",
+            "url": url
+        }
+    except httpx.HTTPStatusError as e:
+        return {
+            "error": f"HTTP error: {e.response.status_code}",
+            "message": str(e),
+            "url": url,
+            "response_text": e.response.text[:500] if e.response.text else None
+        }
+    except Exception as e:
+        return {
+            "error": "Unexpected error occurred",
+            "message": str(e),
+            "url": url
+        }
@@ -15,6 +15,7 @@ except ImportError:
     PYMUPDF_AVAILABLE = False
 
 from ..config import get_markdown_output_format, get_markdown_heading_style, get_markdown_include_metadata
+from ..utils.tracing import span
 
 
 def validate_pdf_file(file_path: str) -> bool:
@@ -256,7 +257,8 @@ def pdf_to_markdown(pdf_file_path: str, output_filename: Optional[str] = None,
         
         # Convert PDF to markdown using PyMuPDF4LLM
         try:
-            markdown_content = pymupdf4llm.to_markdown(pdf_file_path)
+            with span("markdown.convert", source="pdf"):
+                markdown_content = pymupdf4llm.to_markdown(pdf_file_path)
         except Exception as e:
             return {'error': f'Failed to convert PDF to markdown: {str(e)}'}
         
@@ -282,7 +284,8 @@ def pdf_to_markdown(pdf_file_path: str, output_filename: Optional[str] = None,
         final_markdown = '\n\n'.join(final_content_parts)
         
         # Write markdown file
-        markdown_file.write_text(final_markdown, encoding='utf-8')
+        with span("file.write", file=str(markdown_file)):
+            markdown_file.write_text(final_markdown, encoding='utf-8')
         
         result = {
             'metadata': metadata,
@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Optional
 from strands import tool
 
+from ..utils.tracing import span
+
 
 @tool
 def save_file(content: str, filename: str, directory: Optional[str] = None) -> str:
@@ -31,7 +33,7 @@ def save_file(content: str, filename: str, directory: Optional[str] = None) -> s
         filepath = Path(directory) / filename
         
         # Write content to file
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with span("file.write", file=str(filepath)), open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
         
         # Return absolute path for clarity
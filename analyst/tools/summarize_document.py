@@ -0,0 +1,89 @@
+"""Summarize long local documents with parallel map-reduce summarization."""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+from strands import tool
+
+from ..config import get_markdown_heading_style, get_summarize_save_summary
+from ..utils.summarizer import summarize_text
+from ..utils.token_budget import strip_links_and_images
+from .convert_html_to_markdown import convert_to_markdown
+from .pdf_to_markdown import PYMUPDF_AVAILABLE
+
+if PYMUPDF_AVAILABLE:
+    import pymupdf4llm
+
+
+def load_document_markdown(file_path: Path) -> str:
+    """Load a markdown, text, HTML or PDF file as markdown."""
+    suffix = file_path.suffix.lower()
+
+    if suffix == '.pdf':
+        if not PYMUPDF_AVAILABLE:
+            raise ValueError('PyMuPDF4LLM is not installed. Please install with: pip install pymupdf4llm')
+        return pymupdf4llm.to_markdown(str(file_path))
+
+    content = file_path.read_text(encoding='utf-8', errors='replace')
+    if suffix in ('.html', '.htm'):
+        return convert_to_markdown(content, get_markdown_heading_style())
+    return content
+
+
+def strip_frontmatter(markdown: str) -> str:
+    """Remove YAML frontmatter added by the conversion tools."""
+    if markdown.startswith('---\n'):
+        end = markdown.find('\n---', 4)
+        if end != -1:
+            return markdown[end + 4:].lstrip()
+    return markdown
+
+
+@tool
+def summarize_document(file_path: str, focus: Optional[str] = None,
+                       save_summary: Optional[bool] = None) -> Dict:
+    """
+    Summarize a long local document using parallel map-reduce summarization.
+
+    The document is split into chunks at headings, chunks are summarized concurrently,
+    and the chunk summaries are combined into one summary. Use this for long articles,
+    reports and PDFs (including markdown files produced by pdf_to_markdown or
+    download_article_content) instead of reading the full document into the conversation.
+
+    Args:
+        file_path: Path to a markdown, text, HTML or PDF file
+        focus: Optional topic or question the summary should focus on
+        save_summary: Whether to save the summary as <name>.summary.md next to the document (optional, uses config default)
+
+    Returns:
+        Dict containing the summary, summary file path and run statistics
+    """
+    if save_summary is None:
+        save_summary = get_summarize_save_summary()
+
+    try:
+        path = Path(file_path).expanduser()
+        if not path.is_file():
+            return {'error': f'File not found: {file_path}'}
+
+        markdown = strip_links_and_images(strip_frontmatter(load_document_markdown(path)))
+        if not markdown.strip():
+            return {'error': f'No text content found in: {file_path}'}
+
+        result = summarize_text(markdown, focus=focus)
+
+        if save_summary:
+            summary_file = path.with_name(f"{path.stem}.summary.md")
+            summary_file.write_text(result.summary + '\n', encoding='utf-8')
+            result.summary_file = str(summary_file)
+
+        response = result.to_dict()
+        response['source_file'] = str(path)
+        return response
+
+    except ValueError as e:
+        return {'error': str(e)}
+    except PermissionError:
+        return {'error': f'Permission denied accessing file: {file_path}'}
+    except Exception as e:
+        return {'error': f'Failed to summarize document: {str(e)}'}
@@ -2,16 +2,24 @@
 Utility modules for Strands Analyst.
 
 This package contains reusable utilities for logging, metrics, and other common functionality.
+Utilities are imported on first access.
 """
 
-from .logging_utils import configure_logging, with_logging
-from .metrics_utils import print_metrics, with_metrics_display
-from .prompt_utils import get_rotating_prompts, get_simple_prompt_list, load_try_prompts, get_more_examples
+from .._lazy import lazy_exports
 
 __version__ = "0.1.0"
 
-__all__ = [
-    "configure_logging", "with_logging",
-    "print_metrics", "with_metrics_display",
-    "get_rotating_prompts", "get_simple_prompt_list", "load_try_prompts", "get_more_examples"
-]
\ No newline at end of file
+_EXPORTS = {
+    "configure_logging": (".logging_utils", "configure_logging"),
+    "with_logging": (".logging_utils", "with_logging"),
+    "print_metrics": (".metrics_utils", "print_metrics"),
+    "with_metrics_display": (".metrics_utils", "with_metrics_display"),
+    "get_rotating_prompts": (".prompt_utils", "get_rotating_prompts"),
+    "get_simple_prompt_list": (".prompt_utils", "get_simple_prompt_list"),
+    "load_try_prompts": (".prompt_utils", "load_try_prompts"),
+    "get_more_examples": (".prompt_utils", "get_more_examples"),
+}
+
+__all__ = list(_EXPORTS)
+
+lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,179 @@
+"""
+Shared AWS client settings for Bedrock models.
+
+Every BedrockModel in Strands Analyst is created with the options from
+get_bedrock_client_options(): one boto3 session per region, shared by all
+models, and one botocore client config built from bedrock.advanced.timeouts
+and bedrock.advanced.client. The config sets the connection pool size,
+adaptive retries and TCP keep-alive, so concurrent agents do not queue on
+botocore's default pool of 10 connections. botocore has no limit on the
+length of a whole call, so Bedrock runtime clients from the shared sessions
+cut off response streams that run past total_timeout. With
+bedrock.advanced.region_routing enabled, the region comes from the region
+router for every request.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+import boto3
+from botocore.config import Config as BotocoreConfig
+
+from ..config import get_config
+
+
+class _SharedSession(boto3.Session):
+    """boto3 session that can be shared between threads.
+
+    boto3 sessions are not thread-safe, so client creation is serialized.
+    Clients created from the session are thread-safe and used concurrently.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._client_lock = threading.Lock()
+
+    def client(self, *args: Any, **kwargs: Any):
+        with self._client_lock:
+            client = super().client(*args, **kwargs)
+        service_name = kwargs.get('service_name', args[0] if args else None)
+        total_timeout = get_config().get_bedrock_total_timeout()
+        if service_name == 'bedrock-runtime' and total_timeout and total_timeout > 0:
+            return _DeadlineClient(client, total_timeout)
+        return client
+
+
+class _DeadlineClient:
+    """
+    Bedrock runtime client that applies bedrock.advanced.timeouts.total_timeout.
+
+    connect_timeout and read_timeout bound each connection and read, so a
+    response that keeps trickling in is never cut off by botocore. The stream
+    of a ConverseStream response ends with a TimeoutError once the call has
+    run for total_timeout seconds; the check runs between events, so it can
+    fire up to read_timeout late. A Converse response arrives in one read and
+    is bounded by the connect and read timeouts.
+    """
+
+    def __init__(self, client: Any, total_timeout: float):
+        self.client = client
+        self.total_timeout = total_timeout
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def converse_stream(self, **request: Any) -> Dict[str, Any]:
+        """Send a ConverseStream request whose stream stops at the deadline."""
+        deadline = time.monotonic() + self.total_timeout
+        response = self.client.converse_stream(**request)
+        return {**response, 'stream': self._until(deadline, response['stream'])}
+
+    def _until(self, deadline: float, stream: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for event in stream:
+            if time.monotonic() > deadline:
+                close = getattr(stream, 'close', None)
+                if close is not None:
+                    close()
+                raise TimeoutError(f"Bedrock response took longer than total_timeout ({self.total_timeout}s)")
+            yield event
+
+
+_sessions: Dict[str, boto3.Session] = {}
+_client_config: Optional[BotocoreConfig] = None
+_lock = threading.Lock()
+
+
+def get_bedrock_client_config() -> BotocoreConfig:
+    """Get the botocore client config shared by all Bedrock models."""
+    global _client_config
+    with _lock:
+        if _client_config is None:
+            config = get_config()
+            _client_config = BotocoreConfig(
+                connect_timeout=config.get_bedrock_connection_timeout(),
+                read_timeout=config.get_bedrock_read_timeout(),
+                max_pool_connections=config.get_bedrock_max_pool_connections(),
+                retries={
+                    'mode': config.get_bedrock_retry_mode(),
+                    'total_max_attempts': config.get_bedrock_max_attempts()
+                },
+                tcp_keepalive=config.get_bedrock_tcp_keepalive()
+            )
+        return _client_config
+
+
+def get_bedrock_session(region_name: Optional[str] = None) -> boto3.Session:
+    """Get the boto3 session shared by all Bedrock models in a region."""
+    region_name = region_name or get_config().get_bedrock_region()
+    with _lock:
+        session = _sessions.get(region_name)
+        if session is None:
+            session = _sessions[region_name] = _SharedSession(region_name=region_name)
+        return session
+
+
+class _RegionRoutedSession:
+    """
+    Stands in for the boto3 session of a BedrockModel whose region is routed.
+
+    BedrockModel only creates its client from the session; the client returned
+    here is a RegionRoutedClient that picks the region for every request.
+    """
+
+    def __init__(self, router, session_id: Optional[str] = None):
+        self.router = router
+        self.session_id = session_id
+
+    @property
+    def region_name(self) -> str:
+        return self.router.best_region()
+
+    def client(self, service_name: str, config: Optional[BotocoreConfig] = None,
+               endpoint_url: Optional[str] = None, **kwargs: Any):
+        from .region_router import RegionRoutedClient
+
+        def create(region: str):
+            return get_bedrock_session(region).client(service_name, config=config, endpoint_url=endpoint_url)
+
+        return RegionRoutedClient(self.router, create, self.session_id)
+
+
+def get_bedrock_client_options(region_name: Optional[str] = None, session_id: Optional[str] = None) -> dict:
+    """
+    Get the BedrockModel session and client options for a region.
+
+    Use in place of region_name: BedrockModel(**get_bedrock_client_options(region)).
+    When multi-region routing is enabled, models for the configured region send
+    each request to the region chosen by the region router instead; pass a chat
+    session ID to keep the session in one region. Other explicit regions are
+    used as given.
+
+    Args:
+        region_name: Region to call (defaults to bedrock.advanced.region_name)
+        session_id: Chat session that should stay in one region
+    """
+    default_region = get_config().get_bedrock_region()
+    region_name = region_name or default_region
+    session = None
+    if region_name == default_region:
+        from .region_router import get_region_router
+        router = get_region_router()
+        if router is not None:
+            session = _RegionRoutedSession(router, session_id)
+    return {
+        'boto_session': session or get_bedrock_session(region_name),
+        'boto_client_config': get_bedrock_client_config()
+    }
+
+
+def reset_bedrock_clients() -> None:
+    """Drop the shared sessions and client config, e.g. after a configuration reload."""
+    global _client_config
+    with _lock:
+        _sessions.clear()
+        _client_config = None
+
+
+# Rebuild the sessions and client config with the new settings after config.yml changes
+get_config().subscribe(lambda previous, current: reset_bedrock_clients())
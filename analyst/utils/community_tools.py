@@ -0,0 +1,309 @@
+"""
+Lazy loading of strands_tools community tools.
+
+Importing the strands_tools modules takes seconds, and most community tools
+are never called in a chat session. load_community_tools() registers each
+enabled tool as a LazyCommunityTool proxy instead: the proxy serves the tool's
+name, description and input schema from an on-disk manifest and imports the
+real module on its first invocation.
+
+The manifest lives in the user cache directory and is rebuilt when the
+installed strands-agents-tools or strands-agents version changes. Building it
+imports each tool once. A tool that cannot be imported because a dependency is
+missing (an uninstalled extra) is recorded with the missing module, so it is
+not imported again on every start but is retried as soon as that module can
+be found. Other import errors are not saved.
+"""
+
+import importlib
+import importlib.util
+import inspect
+import json
+import logging
+import threading
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from strands.types.tools import AgentTool, ToolGenerator, ToolSpec, ToolUse
+
+from ..config import get_config
+from ..startup_cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Tool name -> strands_tools module
+COMMUNITY_TOOL_MODULES = {
+    # RAG & Memory
+    "retrieve": "strands_tools.retrieve",
+    "memory": "strands_tools.memory",
+    "agent_core_memory": "strands_tools.agent_core_memory",
+    "mem0_memory": "strands_tools.mem0_memory",
+
+    # File Operations
+    "editor": "strands_tools.editor",
+    "file_read": "strands_tools.file_read",
+
+    # Shell & System
+    "environment": "strands_tools.environment",
+    "shell": "strands_tools.shell",
+    "cron": "strands_tools.cron",
+    "use_computer": "strands_tools.use_computer",
+
+    # Code Interpretation
+    "code_interpreter": "strands_tools.code_interpreter",
+
+    # Web & Network
+    "slack": "strands_tools.slack",
+    "browser": "strands_tools.browser",
+    "rss": "strands_tools.rss",
+
+    # Multi-modal
+    "generate_image_stability": "strands_tools.generate_image_stability",
+    "image_reader": "strands_tools.image_reader",
+    "generate_image": "strands_tools.generate_image",
+    "nova_reels": "strands_tools.nova_reels",
+    "diagram": "strands_tools.diagram",
+
+    # AWS Services
+    "use_aws": "strands_tools.use_aws",
+
+    # Utilities
+    "calculator": "strands_tools.calculator",
+    "current_time": "strands_tools.current_time",
+    "load_tool": "strands_tools.load_tool",
+    "sleep": "strands_tools.sleep",
+
+    # Agents & Workflows
+    "graph": "strands_tools.graph",
+    "agent_graph": "strands_tools.agent_graph",
+    "journal": "strands_tools.journal",
+    "swarm": "strands_tools.swarm",
+    "stop": "strands_tools.stop",
+    "handoff_to_user": "strands_tools.handoff_to_user",
+    "use_agent": "strands_tools.use_agent",
+    "think": "strands_tools.think",
+    "use_llm": "strands_tools.use_llm",
+    "workflow": "strands_tools.workflow",
+    "batch": "strands_tools.batch",
+    "a2a_client": "strands_tools.a2a_client"
+}
+
+# Tools that should be registered first
+PRIORITY_TOOLS = ["diagram", "nova_reels", "generate_image", "use_computer", "browser"]
+
+
+def import_community_tool(name: str, module_path: str) -> AgentTool:
+    """
+    Import a community tool and return it as an AgentTool.
+
+    Handles @tool functions, modules with a TOOL_SPEC and a function of the
+    tool's name, and packages whose tool lives in a submodule of the same name.
+
+    Raises:
+        ImportError: If the module or one of its dependencies is not installed
+        ValueError: If the module does not provide a tool
+    """
+    from strands.tools.tools import PythonAgentTool
+
+    module = importlib.import_module(module_path)
+    candidate = getattr(module, name, None)
+    if inspect.ismodule(candidate):
+        module, candidate = candidate, getattr(candidate, name, None)
+
+    if isinstance(candidate, AgentTool):
+        return candidate
+    if callable(candidate) and isinstance(getattr(module, 'TOOL_SPEC', None), dict):
+        return PythonAgentTool(name, module.TOOL_SPEC, candidate)
+
+    # Some tools have different function names: use the module's tool
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if not attr_name.startswith('_') and isinstance(attr, AgentTool):
+            return attr
+    raise ValueError(f"{module_path} does not provide a tool")
+
+
+class LazyCommunityTool(AgentTool):
+    """Community tool proxy that imports the tool on its first invocation."""
+
+    def __init__(self, name: str, module_path: str, tool_spec: ToolSpec, tool_type: str = "function"):
+        """
+        Initialize the proxy.
+
+        Args:
+            name: Configured tool name (key of COMMUNITY_TOOL_MODULES)
+            module_path: strands_tools module providing the tool
+            tool_spec: Tool specification from the manifest
+            tool_type: Tool type of the real tool
+        """
+        super().__init__()
+        self.name = name
+        self.module_path = module_path
+        self._tool_spec = tool_spec
+        self._tool_type = tool_type
+        self._tool: Optional[AgentTool] = None
+        self._lock = threading.Lock()
+
+    @property
+    def tool_name(self) -> str:
+        return self._tool_spec['name']
+
+    @property
+    def tool_spec(self) -> ToolSpec:
+        return self._tool_spec
+
+    @property
+    def tool_type(self) -> str:
+        return self._tool_type
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the real tool has been imported."""
+        return self._tool is not None
+
+    def load(self) -> AgentTool:
+        """Import the real tool (once)."""
+        with self._lock:
+            if self._tool is None:
+                logger.debug(f"Importing community tool {self.name} from {self.module_path}")
+                self._tool = import_community_tool(self.name, self.module_path)
+            return self._tool
+
+    async def stream(self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any) -> ToolGenerator:
+        """Import the real tool if needed and stream its events."""
+        async for event in self.load().stream(tool_use, invocation_state, **kwargs):
+            yield event
+
+
+class ToolManifest:
+    """
+    Tool specifications of the community tools, cached on disk.
+
+    The manifest is tied to the installed strands-agents-tools and
+    strands-agents versions and starts empty when either changes.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """
+        Initialize the manifest.
+
+        Args:
+            path: JSON file the manifest is loaded from and saved to (None = memory only)
+        """
+        self.path = Path(path) if path else None
+        self.versions = self._installed_versions()
+        self.tools: Dict[str, Dict[str, Any]] = {}
+        self._changed = False
+        self._load()
+
+    @staticmethod
+    def _installed_versions() -> Dict[str, Optional[str]]:
+        versions = {}
+        for package in ("strands-agents-tools", "strands-agents"):
+            try:
+                versions[package] = metadata.version(package)
+            except metadata.PackageNotFoundError:
+                versions[package] = None
+        return versions
+
+    def _load(self) -> None:
+        if not self.path or not self.path.is_file():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load community tool manifest from {self.path}: {e}")
+            return
+        if data.get('versions') == self.versions:
+            self.tools = data.get('tools', {})
+        else:
+            logger.debug("Installed tool versions changed, rebuilding community tool manifest")
+
+    def save(self) -> None:
+        """Write the manifest if entries were added (errors only when a dependency is missing)."""
+        if not self.path or not self._changed:
+            return
+        tools = {name: entry for name, entry in self.tools.items() if 'error' not in entry or entry.get('missing')}
+        data = {'versions': self.versions, 'tools': tools}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+            self._changed = False
+        except OSError as e:
+            logger.warning(f"Could not save community tool manifest to {self.path}: {e}")
+
+    def entry(self, name: str, module_path: str) -> Dict[str, Any]:
+        """Get the manifest entry of a tool, importing the tool if it is not cached."""
+        entry = self.tools.get(name)
+        if entry is not None and entry.get('module') == module_path and not _installed_since(entry):
+            return entry
+
+        try:
+            tool = import_community_tool(name, module_path)
+            entry = {'module': module_path, 'spec': tool.tool_spec, 'type': tool.tool_type}
+            json.dumps(entry)
+        except ImportError as e:
+            # Not installed (the tool may require extras)
+            logger.debug(f"Community tool '{name}' is not available: {e}")
+            entry = {'module': module_path, 'error': str(e), 'missing': e.name}
+        except ValueError as e:
+            # Not a tool
+            logger.debug(f"Community tool '{name}' is not available: {e}")
+            entry = {'module': module_path, 'error': str(e)}
+        except Exception as e:
+            logger.warning(f"Error loading community tool '{name}': {e}")
+            entry = {'module': module_path, 'error': str(e)}
+        self.tools[name] = entry
+        self._changed = True
+        return entry
+
+
+def _installed_since(entry: Dict[str, Any]) -> bool:
+    """Return whether the module missing for an unavailable tool can be imported now."""
+    missing = entry.get('missing')
+    if 'error' not in entry or not missing:
+        return False
+    try:
+        return importlib.util.find_spec(missing) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def default_manifest_file() -> Optional[str]:
+    """Get the manifest file in the user cache directory, or None if the on-disk cache is disabled."""
+    cache_dir = get_cache_dir()
+    return str(cache_dir / 'community-tools.json') if cache_dir else None
+
+
+def load_community_tools(tool_names: List[str], manifest_file: Optional[str] = None) -> List[LazyCommunityTool]:
+    """
+    Create lazy proxies for community tools.
+
+    Args:
+        tool_names: Enabled tool names; unknown names are skipped
+        manifest_file: Manifest file (defaults to community_tools.manifest_file, or
+            community-tools.json in the user cache directory)
+
+    Returns:
+        Proxies of the available tools, priority tools first
+    """
+    if manifest_file is None:
+        manifest_file = get_config().get_community_tools_manifest_file() or default_manifest_file()
+    manifest = ToolManifest(manifest_file)
+
+    # The config may list a tool more than once; each name is registered once
+    names = list(dict.fromkeys(tool_names))
+    ordered = [name for name in names if name in PRIORITY_TOOLS]
+    ordered += [name for name in names if name not in PRIORITY_TOOLS]
+
+    tools = []
+    for name in ordered:
+        module_path = COMMUNITY_TOOL_MODULES.get(name)
+        if module_path is None:
+            continue
+        entry = manifest.entry(name, module_path)
+        if 'spec' in entry:
+            tools.append(LazyCommunityTool(name, module_path, entry['spec'], entry.get('type', 'function')))
+    manifest.save()
+    return tools
@@ -0,0 +1,273 @@
+"""
+Conversation management utilities for Strands Analyst.
+
+This module provides a token-aware sliding window for chat sessions. History is
+bounded by message count and by an estimated token budget, whole turns are
+evicted so a tool call is never separated from its result, and evicted turns can
+be summarized in the background into a running summary that stays in context.
+"""
+
+import concurrent.futures
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from strands import Agent
+from strands.agent.conversation_manager import SlidingWindowConversationManager
+from strands.types.content import Message, Messages
+
+from ..prompts import format_prompt_cached
+from .token_budget import estimate_tokens
+from .usage_ledger import usage_hooks
+from .tracing import trace_hooks, trace_model
+
+logger = logging.getLogger(__name__)
+
+# Fixed token cost charged for non-text content blocks such as images and documents
+_BINARY_BLOCK_TOKENS = 1000
+
+# Limits applied when rendering evicted turns for the summarizer
+_TRANSCRIPT_TOOL_CHARS = 600
+_TRANSCRIPT_MAX_CHARS = 40000
+_SUMMARY_WORDS = 300
+
+_SUMMARY_PREFIX = "Summary of the earlier conversation (older turns were removed from context):\n\n"
+_SUMMARY_ACK = "Understood, I'll continue the conversation with that summary in mind."
+
+
+def _block_tokens(block: Dict[str, Any]) -> int:
+    """Estimate the tokens of a single message content block."""
+    if 'text' in block:
+        return estimate_tokens(block['text'])
+    if 'toolUse' in block:
+        tool_use = block['toolUse']
+        return estimate_tokens(tool_use.get('name', '')) + estimate_tokens(json.dumps(tool_use.get('input', {}), default=str))
+    if 'toolResult' in block:
+        return sum(_block_tokens(item) for item in block['toolResult'].get('content', []))
+    if 'json' in block:
+        return estimate_tokens(json.dumps(block['json'], default=str))
+    if 'reasoningContent' in block:
+        return estimate_tokens(block['reasoningContent'].get('reasoningText', {}).get('text', ''))
+    if 'cachePoint' in block:
+        return 0
+    return _BINARY_BLOCK_TOKENS
+
+
+def estimate_message_tokens(message: Message) -> int:
+    """Estimate the tokens a message adds to the model context."""
+    return 4 + sum(_block_tokens(block) for block in message.get('content', []))
+
+
+def _is_turn_start(message: Message) -> bool:
+    """Return True if a message starts a new user turn (a user message that is not a tool result)."""
+    return message['role'] == 'user' and not any('toolResult' in block for block in message['content'])
+
+
+def _render_transcript(messages: Messages) -> str:
+    """Render messages as a compact plain-text transcript for summarization."""
+    lines = []
+    for message in messages:
+        role = 'User' if message['role'] == 'user' else 'Assistant'
+        for block in message.get('content', []):
+            if 'text' in block and block['text'].strip():
+                lines.append(f"{role}: {block['text'].strip()}")
+            elif 'toolUse' in block:
+                tool_input = json.dumps(block['toolUse'].get('input', {}), default=str)
+                lines.append(f"{role} called tool {block['toolUse'].get('name')}: {tool_input[:_TRANSCRIPT_TOOL_CHARS]}")
+            elif 'toolResult' in block:
+                result_text = ' '.join(item.get('text', '') or json.dumps(item.get('json', ''), default=str)
+                                       for item in block['toolResult'].get('content', []))
+                lines.append(f"Tool result ({block['toolResult'].get('status', 'success')}): "
+                             f"{result_text[:_TRANSCRIPT_TOOL_CHARS]}")
+
+    transcript = '\n'.join(lines)
+    if len(transcript) > _TRANSCRIPT_MAX_CHARS:
+        transcript = transcript[-_TRANSCRIPT_MAX_CHARS:]
+    return transcript
+
+
+def _summary_ack() -> Message:
+    """Build the assistant message that acknowledges the running summary."""
+    return {"role": "assistant", "content": [{"text": _SUMMARY_ACK}]}
+
+
+class TokenAwareConversationManager(SlidingWindowConversationManager):
+    """
+    Sliding conversation window bounded by message count and estimated tokens.
+
+    After each agent invocation the oldest turns are evicted until the history has
+    at most window_size messages and, when max_tokens is set, at most max_tokens
+    estimated tokens. Trimming happens at the start of a user turn so tool calls
+    stay paired with their results. With summarize_evicted enabled, evicted turns
+    are folded into a running summary on a background thread; once it is ready the
+    summary is kept at the start of the history as a user message followed by an
+    assistant acknowledgement, so user and assistant turns keep alternating.
+    """
+
+    def __init__(self, window_size: int = 20, max_tokens: int = 0, summarize_evicted: bool = False,
+                 summary_model=None, should_truncate_results: bool = True):
+        """
+        Initialize the token-aware conversation manager.
+
+        Args:
+            window_size: Maximum number of messages to keep in the agent's history
+            max_tokens: Maximum estimated tokens of history to keep (0 = no token limit)
+            summarize_evicted: Summarize evicted turns in the background and keep the summary in context
+            summary_model: Model used for summaries (defaults to the agent's model)
+            should_truncate_results: Truncate tool results when the model's context window overflows
+        """
+        super().__init__(window_size=window_size, should_truncate_results=should_truncate_results)
+        self.max_tokens = max_tokens
+        self.summarize_evicted = summarize_evicted
+        self.summary_model = summary_model
+
+        self._summary_text: Optional[str] = None
+        self._summary_message: Optional[Message] = None
+        self._summary_updated = False
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pending: List[concurrent.futures.Future] = []
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get the manager state, including the running summary, for session persistence."""
+        return {"summary_text": self._summary_text, **super().get_state()}
+
+    def restore_from_session(self, state: Dict[str, Any]) -> Optional[List[Message]]:
+        """Restore the manager state and return the summary messages to prepend to the history."""
+        super().restore_from_session(state)
+        self._summary_text = state.get("summary_text")
+        self._summary_message = self._build_summary_message()
+        return [self._summary_message, _summary_ack()] if self._summary_message else None
+
+    def apply_management(self, agent: Agent, **kwargs: Any) -> None:
+        """Evict the oldest turns until the history fits the message and token budgets."""
+        messages = agent.messages
+        self._detach_summary(messages)
+
+        try:
+            evicted = self._evict(messages)
+            if evicted:
+                logger.debug(f"evicted {len(evicted)} messages, {len(messages)} remain in context")
+                if self.summarize_evicted:
+                    self._schedule_summary(agent, evicted)
+        finally:
+            self._attach_summary(messages)
+
+    def reduce_context(self, agent: Agent, e: Optional[Exception] = None, **kwargs: Any) -> None:
+        """Reduce the history after a context window overflow, keeping the running summary."""
+        messages = agent.messages
+        self._detach_summary(messages)
+        try:
+            super().reduce_context(agent, e, **kwargs)
+        finally:
+            self._attach_summary(messages)
+
+    def context_tokens(self, messages: Messages) -> int:
+        """Estimate the tokens of a message history."""
+        return sum(estimate_message_tokens(message) for message in messages)
+
+    def wait_for_summaries(self, timeout: Optional[float] = None) -> None:
+        """Block until scheduled background summaries have finished (useful before saving a session)."""
+        pending, self._pending = self._pending, []
+        concurrent.futures.wait(pending, timeout=timeout)
+
+    def _evict(self, messages: Messages) -> Messages:
+        """Remove the oldest turns from messages in place and return the removed messages."""
+        tokens = [estimate_message_tokens(message) for message in messages]
+        total = sum(tokens)
+        evicted: Messages = []
+
+        while len(messages) > self.window_size or (self.max_tokens and total > self.max_tokens):
+            minimum = max(1, len(messages) - self.window_size)
+            trim_index = self._find_trim_index(messages, minimum)
+            if trim_index is None:
+                logger.debug("no valid trim index found, keeping history as is")
+                break
+
+            evicted.extend(messages[:trim_index])
+            total -= sum(tokens[:trim_index])
+            del tokens[:trim_index]
+            messages[:] = messages[trim_index:]
+            self.removed_message_count += trim_index
+
+        return evicted
+
+    def _find_trim_index(self, messages: Messages, minimum: int) -> Optional[int]:
+        """
+        Find the smallest index at or after minimum where the history can be cut.
+
+        Prefers the start of a user turn. Falls back to any index that does not start
+        with a tool result or an unanswered tool call, as the sliding window does.
+        The last message is never removed.
+        """
+        for index in range(minimum, len(messages)):
+            if _is_turn_start(messages[index]):
+                return index
+
+        for index in range(minimum, len(messages)):
+            content = messages[index]['content']
+            if any('toolResult' in block for block in content):
+                continue
+            if (any('toolUse' in block for block in content) and index + 1 < len(messages)
+                    and not any('toolResult' in block for block in messages[index + 1]['content'])):
+                continue
+            return index
+
+        return None
+
+    def _build_summary_message(self) -> Optional[Message]:
+        """Build the user message that carries the running summary."""
+        if not self._summary_text:
+            return None
+        return {"role": "user", "content": [{"text": _SUMMARY_PREFIX + self._summary_text}]}
+
+    def _detach_summary(self, messages: Messages) -> None:
+        """Remove the summary message and its acknowledgement from the start of the history, if present."""
+        if self._summary_message is not None and messages and messages[0] == self._summary_message:
+            del messages[0]
+            if messages and messages[0] == _summary_ack():
+                del messages[0]
+
+    def _attach_summary(self, messages: Messages) -> None:
+        """Put the latest summary message at the start of the history."""
+        with self._lock:
+            if self._summary_updated:
+                self._summary_message = self._build_summary_message()
+                self._summary_updated = False
+
+        if self._summary_message is not None:
+            # Bedrock rejects consecutive user messages: the acknowledgement is only
+            # needed when the history (or the next prompt) starts with a user turn
+            if not messages or messages[0]['role'] == 'user':
+                messages[:0] = [self._summary_message, _summary_ack()]
+            else:
+                messages.insert(0, self._summary_message)
+
+    def _schedule_summary(self, agent: Agent, evicted: Messages) -> None:
+        """Fold evicted messages into the running summary on a background thread."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat-summary")
+
+        model = self.summary_model or agent.model
+        transcript = _render_transcript(evicted)
+        self._pending = [future for future in self._pending if not future.done()]
+        self._pending.append(self._executor.submit(self._update_summary, model, transcript))
+
+    def _update_summary(self, model, transcript: str) -> None:
+        """Generate the updated summary. Runs on the summary worker thread."""
+        try:
+            prompt = format_prompt_cached("summarize_conversation",
+                                          words=_SUMMARY_WORDS,
+                                          summary=self._summary_text or "(none yet)",
+                                          transcript=transcript)
+            hooks = usage_hooks('context_summary') + trace_hooks('context_summary')
+            result = Agent(model=trace_model(model), callback_handler=None, hooks=hooks)(prompt)
+            summary = str(result).strip()
+        except Exception as e:
+            logger.warning(f"Could not summarize evicted conversation turns: {e}")
+            return
+
+        with self._lock:
+            self._summary_text = summary
+            self._summary_updated = True
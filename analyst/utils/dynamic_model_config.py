@@ -7,17 +7,28 @@ and reduce cold start latency.
 """
 
 import asyncio
+import atexit
+import concurrent.futures
+import functools
 import threading
 import time
 import re
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 import json
 import logging
 from pathlib import Path
 
-from ..config import get_config, Config
+from ..config import (
+    get_config, get_bedrock_cache_options, get_bedrock_warmup_max_workers,
+    get_bedrock_latency_routing_config, Config
+)
+from .bedrock_client import get_bedrock_client_options, reset_bedrock_clients
+from .rate_limiter import rate_limited
+from .model_provider_factory import apply_execution_policy
+from .latency_router import LatencyRouter, LatencyObservation, RequestTimer
+from strands.models import Model
 from strands.models.bedrock import BedrockModel
 
 
@@ -59,6 +70,34 @@ class ModelWarmupStats:
     warmup_timestamp: float = 0.0
 
 
+@dataclass(frozen=True)
+class RoutingDecision:
+    """Result of routing a message: its complexity and the model chosen for it."""
+    complexity: TaskComplexity
+    model_key: str
+    config: ModelConfig
+    scores: Dict[str, int]
+    reason: Optional[str] = None
+
+
+# Model key used for each complexity level
+_COMPLEXITY_MODEL_KEYS = {
+    TaskComplexity.SIMPLE: 'fast',
+    TaskComplexity.MODERATE: 'chat',
+    TaskComplexity.COMPLEX: 'reasoning',
+    TaskComplexity.REASONING: 'reasoning'
+}
+
+# Substrings that mark code-related requests
+_CODE_KEYWORDS = ('code', 'python', 'javascript', 'sql', 'algorithm')
+
+# Number of distinct messages whose classification is memoized
+_ROUTING_MEMO_SIZE = 1024
+
+# Opening parenthesis of a capturing group (not escaped, not (?...)
+_CAPTURING_GROUP = re.compile(r'(?<!\\)\((?!\?)')
+
+
 class DynamicModelConfigManager:
     """
     Manages dynamic model configuration updates, warm-up, and automated selection.
@@ -71,11 +110,20 @@ class DynamicModelConfigManager:
         
         # Model configuration cache
         self._model_configs: Dict[str, ModelConfig] = {}
-        self._warmed_models: Dict[str, BedrockModel] = {}
+        self._warmed_models: Dict[str, Model] = {}
         self._warmup_stats: Dict[str, ModelWarmupStats] = {}
         
-        # Task complexity patterns
+        # Warm-up bookkeeping: in-flight warm-ups per model key, and one warmed
+        # client per (model_id, region) endpoint shared by all keys that use it
+        self._warmup_futures: Dict[str, concurrent.futures.Future] = {}
+        self._warm_clients: Dict[Tuple[str, str], Any] = {}
+        self._endpoint_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._warmup_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        
+        # Task complexity patterns, compiled into a single-pass classifier
         self._complexity_patterns = self._initialize_complexity_patterns()
+        self._classifier = self._compile_classifier()
+        self._classify_cached = functools.lru_cache(maxsize=_ROUTING_MEMO_SIZE)(self._classify)
         
         # Configuration update lock
         self._config_lock = threading.RLock()
@@ -83,9 +131,10 @@ class DynamicModelConfigManager:
         # Initialize default model configurations
         self._initialize_model_configs()
         
-        # Start background warm-up thread
-        self._warmup_thread = threading.Thread(target=self._background_warmup, daemon=True)
-        self._warmup_thread.start()
+        # Latency-aware routing, when enabled; the statistics of the last few
+        # seconds are saved at exit (registered once, the router changes on reload)
+        self._latency_router = self._create_latency_router()
+        atexit.register(self._save_latency_stats)
     
     def _initialize_complexity_patterns(self) -> Dict[TaskComplexity, List[str]]:
         """Initialize task complexity analysis patterns."""
@@ -126,6 +175,8 @@ class DynamicModelConfigManager:
             fast_model = self.config.get('bedrock.model.models.fast', default_model)
             reasoning_model = self.config.get('bedrock.model.models.reasoning', default_model)
             chat_model = self.config.get('bedrock.model.models.chat', default_model)
+            cache_prompt = self.config.get('bedrock.advanced.caching.cache_prompt', True)
+            cache_tools = self.config.get('bedrock.advanced.caching.cache_tools', True)
             
             # Create model configurations
             self._model_configs = {
@@ -133,52 +184,201 @@ class DynamicModelConfigManager:
                     model_id=default_model,
                     temperature=0.3,
                     top_p=0.8,
-                    max_tokens=4096
+                    max_tokens=4096,
+                    cache_prompt=cache_prompt,
+                    cache_tools=cache_tools
                 ),
                 'fast': ModelConfig(
                     model_id=fast_model,
                     temperature=0.2,
                     top_p=0.7,
-                    max_tokens=2048
+                    max_tokens=2048,
+                    cache_prompt=cache_prompt,
+                    cache_tools=cache_tools
                 ),
                 'reasoning': ModelConfig(
                     model_id=reasoning_model,
                     temperature=0.1,
                     top_p=0.6,
-                    max_tokens=8192
+                    max_tokens=8192,
+                    cache_prompt=cache_prompt,
+                    cache_tools=cache_tools
                 ),
                 'chat': ModelConfig(
                     model_id=chat_model,
                     temperature=0.5,
                     top_p=0.9,
-                    max_tokens=8192
+                    max_tokens=8192,
+                    cache_prompt=cache_prompt,
+                    cache_tools=cache_tools
                 )
             }
     
-    def _background_warmup(self):
-        """Background thread for model warm-up."""
-        try:
-            # Wait a short time for app initialization
-            time.sleep(2)
+    def _create_latency_router(self) -> Optional[LatencyRouter]:
+        """Create the latency router if latency-aware routing is enabled."""
+        routing_config = get_bedrock_latency_routing_config()
+        if not routing_config['enabled']:
+            return None
+        return LatencyRouter(
+            slo_ms=routing_config['slo_ms'],
+            ewma_alpha=routing_config['ewma_alpha'],
+            min_samples=routing_config['min_samples'],
+            max_error_rate=routing_config['max_error_rate'],
+            probe_interval=routing_config['probe_interval'],
+            stats_file=routing_config['stats_file']
+        )
+    
+    def _save_latency_stats(self) -> None:
+        """Save the latency router statistics, if latency-aware routing is enabled."""
+        router = self._latency_router
+        if router is not None:
+            router.save()
+    
+    def _cache_options(self, config: ModelConfig) -> Dict[str, str]:
+        """Get BedrockModel cache point options for a model configuration."""
+        return get_bedrock_cache_options(config.model_id, config.cache_prompt, config.cache_tools)
+    
+    def _endpoint(self, config: ModelConfig) -> Tuple[str, str]:
+        """Get the (model_id, region) endpoint a model configuration calls."""
+        return config.model_id, config.region_name
+    
+    def _build_model(self, config: ModelConfig) -> BedrockModel:
+        """Create a BedrockModel for a model configuration."""
+        return BedrockModel(
+            model_id=config.model_id,
+            temperature=config.temperature,
+            top_p=config.top_p,
+            max_tokens=config.max_tokens,
+            stop_sequences=config.stop_sequences,
+            streaming=config.streaming,
+            **get_bedrock_client_options(config.region_name),
+            **self._cache_options(config)
+        )
+    
+    def _apply_execution_policy(self, model: BedrockModel, config: ModelConfig) -> Model:
+        """Apply providers.execution.policy (hedging, failover) to a model built from a configuration."""
+        return apply_execution_policy(model, 'chat', model_id=config.model_id, temperature=config.temperature,
+                                      top_p=config.top_p, max_tokens=config.max_tokens)
+    
+    def warm_up(self, model_keys: Optional[List[str]] = None,
+                send_request: bool = True) -> Dict[str, concurrent.futures.Future]:
+        """
+        Start warming up models concurrently without blocking.
+        
+        Model keys that share an endpoint are warmed by a single task that sends
+        one warm-up request. Keys that are already warmed or warming are not
+        scheduled again; their existing future is returned.
+        
+        Args:
+            model_keys: Keys of the models to warm up (default: all models, fastest first)
+            send_request: Send a minimal request to open the endpoint connection ahead of use
             
-            # Warm up models in priority order
-            priority_models = ['fast', 'chat', 'reasoning', 'default']
+        Returns:
+            Dictionary mapping model key to the future of its warm-up
+        """
+        if model_keys is None:
+            model_keys = ['fast', 'chat', 'reasoning', 'default']
+        
+        futures = {}
+        with self._config_lock:
+            pending: Dict[Tuple[str, str], List[str]] = {}
+            for model_key in model_keys:
+                if model_key not in self._model_configs:
+                    continue
+                if model_key in self._warmup_futures:
+                    futures[model_key] = self._warmup_futures[model_key]
+                    continue
+                endpoint = self._endpoint(self._model_configs[model_key])
+                pending.setdefault(endpoint, []).append(model_key)
+            
+            if pending and self._warmup_executor is None:
+                self._warmup_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max(1, get_bedrock_warmup_max_workers()),
+                    thread_name_prefix="model-warmup"
+                )
             
-            for model_key in priority_models:
-                if model_key in self._model_configs:
-                    try:
-                        self._warmup_model(model_key)
-                        # Stagger warm-ups to avoid overwhelming the system
-                        time.sleep(1)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to warm up model {model_key}: {e}")
-                        
+            for endpoint_keys in pending.values():
+                configs = {key: self._model_configs[key] for key in endpoint_keys}
+                future = self._warmup_executor.submit(self._warmup_models, configs, send_request)
+                for model_key in endpoint_keys:
+                    self._warmup_futures[model_key] = future
+                    futures[model_key] = future
+        
+        return futures
+    
+    def _warmup_models(self, configs: Dict[str, ModelConfig], send_request: bool) -> None:
+        """
+        Create the models for keys that share one endpoint and warm the endpoint once.
+        
+        Runs on a warm-up worker thread. All models of the endpoint share one
+        client, so the connection opened by the warm-up request is the one used
+        by later requests.
+        
+        Args:
+            configs: Model configurations by model key, all with the same endpoint
+            send_request: Send a warm-up request if the endpoint has no client yet
+        """
+        endpoint = self._endpoint(next(iter(configs.values())))
+        with self._config_lock:
+            endpoint_lock = self._endpoint_locks.setdefault(endpoint, threading.Lock())
+        
+        with endpoint_lock:
+            for model_key, config in configs.items():
+                start_time = time.time()
+                model = self._build_model(config)
+                init_time = time.time() - start_time
+                
+                first_response_time = 0.0
+                client = self._warm_clients.get(endpoint)
+                if client is not None:
+                    model.client = client
+                else:
+                    if send_request:
+                        first_response_time = self._send_warmup_request(model, config)
+                    self._warm_clients[endpoint] = model.client
+                
+                with self._config_lock:
+                    # Skip configurations that were updated while warming up
+                    if self._model_configs.get(model_key) is not config:
+                        continue
+                    # Hedging wraps the warmed model, so its adaptive delay persists across requests
+                    self._warmed_models[model_key] = self._apply_execution_policy(model, config)
+                    self._warmup_stats[model_key] = ModelWarmupStats(
+                        model_id=config.model_id,
+                        warmup_time=time.time() - start_time,
+                        initialization_time=init_time,
+                        first_response_time=first_response_time,
+                        is_warmed=True,
+                        warmup_timestamp=time.time()
+                    )
+                
+                self.logger.info(f"Model {model_key} warmed up in {time.time() - start_time:.2f}s")
+    
+    def _send_warmup_request(self, model: BedrockModel, config: ModelConfig) -> float:
+        """
+        Send a minimal request so the endpoint connection is open before the first message.
+        
+        Returns:
+            Response time in seconds, or 0.0 if the request failed
+        """
+        response_start = time.time()
+        try:
+            model.client.converse(
+                modelId=config.model_id,
+                messages=[{"role": "user", "content": [{"text": "Hello"}]}],
+                inferenceConfig={"maxTokens": 1}
+            )
+            return time.time() - response_start
         except Exception as e:
-            self.logger.error(f"Background warmup failed: {e}")
+            # The model is still usable; only the warm-up request failed
+            self.logger.warning(f"Warm-up request for {config.model_id} failed: {e}")
+            return 0.0
     
     def _warmup_model(self, model_key: str) -> bool:
         """
-        Warm up a specific model to reduce cold start latency.
+        Create a model on first use, waiting for a warm-up already in progress.
+        
+        No warm-up request is sent: the caller's own request follows immediately.
         
         Args:
             model_key: Key of the model to warm up
@@ -186,106 +386,138 @@ class DynamicModelConfigManager:
         Returns:
             True if warmup successful, False otherwise
         """
-        if model_key not in self._model_configs:
+        future = self.warm_up([model_key], send_request=False).get(model_key)
+        if future is None:
             return False
         
-        if model_key in self._warmed_models:
-            return True  # Already warmed
-        
         try:
-            start_time = time.time()
-            config = self._model_configs[model_key]
-            
-            # Create model instance
-            init_start = time.time()
-            model = BedrockModel(
-                model_id=config.model_id,
-                temperature=config.temperature,
-                top_p=config.top_p,
-                max_tokens=config.max_tokens,
-                stop_sequences=config.stop_sequences,
-                streaming=config.streaming,
-                region_name=config.region_name
-            )
-            init_time = time.time() - init_start
-            
-            # Send a minimal warm-up prompt
-            response_start = time.time()
-            try:
-                # Use a very simple prompt for warm-up
-                warmup_response = model.invoke("Hello", max_tokens=10)
-                first_response_time = time.time() - response_start
-            except Exception:
-                # If invoke fails, just record the initialization time
-                first_response_time = 0.0
-            
-            total_time = time.time() - start_time
-            
-            # Store warmed model and stats
-            self._warmed_models[model_key] = model
-            self._warmup_stats[model_key] = ModelWarmupStats(
-                model_id=config.model_id,
-                warmup_time=total_time,
-                initialization_time=init_time,
-                first_response_time=first_response_time,
-                is_warmed=True,
-                warmup_timestamp=time.time()
-            )
-            
-            self.logger.info(f"Model {model_key} warmed up in {total_time:.2f}s")
-            return True
-            
+            future.result()
         except Exception as e:
             self.logger.error(f"Failed to warm up model {model_key}: {e}")
+            with self._config_lock:
+                # Allow a later retry
+                if self._warmup_futures.get(model_key) is future:
+                    del self._warmup_futures[model_key]
             return False
+        
+        return model_key in self._warmed_models
     
-    def analyze_task_complexity(self, text: str) -> TaskComplexity:
+    def _compile_classifier(self) -> re.Pattern:
         """
-        Analyze task complexity based on text patterns.
-        
-        Args:
-            text: Input text to analyze
-            
+        Compile all complexity patterns into one alternation regex.
+
+        Each complexity level becomes a named group, so a single scan of the text
+        finds every keyword match and match.lastgroup tells which level it counts for.
+        """
+        alternatives = []
+        for complexity, patterns in self._complexity_patterns.items():
+            # Capturing groups inside the patterns would hide the level's group name
+            body = '|'.join(_CAPTURING_GROUP.sub('(?:', pattern) for pattern in patterns)
+            alternatives.append(f'(?P<{complexity.name}>{body})')
+        return re.compile('|'.join(alternatives))
+
+    def _classify(self, text: str) -> Tuple[TaskComplexity, Tuple[Tuple[str, int], ...]]:
+        """
+        Score text against the complexity patterns in a single pass.
+
+        Results are memoized with an LRU cache (see __init__), so repeated
+        messages and repeated calls for the same message are not re-scanned.
+
         Returns:
-            TaskComplexity level
+            Tuple of (TaskComplexity, ((complexity value, score), ...))
         """
         if not text:
-            return TaskComplexity.SIMPLE
-        
+            return TaskComplexity.SIMPLE, tuple((complexity.value, 0) for complexity in TaskComplexity)
+
         text_lower = text.lower()
         complexity_scores = {complexity: 0 for complexity in TaskComplexity}
-        
+
         # Count pattern matches for each complexity level
-        for complexity, patterns in self._complexity_patterns.items():
-            for pattern in patterns:
-                matches = len(re.findall(pattern, text_lower))
-                complexity_scores[complexity] += matches
-        
+        for match in self._classifier.finditer(text_lower):
+            complexity_scores[TaskComplexity[match.lastgroup]] += 1
+
         # Additional heuristics
         word_count = len(text.split())
         if word_count > 100:
             complexity_scores[TaskComplexity.COMPLEX] += 2
         elif word_count > 50:
             complexity_scores[TaskComplexity.MODERATE] += 1
-        
+
         # Check for code-related content
-        if any(keyword in text_lower for keyword in ['code', 'python', 'javascript', 'sql', 'algorithm']):
+        if any(keyword in text_lower for keyword in _CODE_KEYWORDS):
             complexity_scores[TaskComplexity.REASONING] += 1
-        
+
         # Check for question complexity
         question_count = text.count('?')
         if question_count > 2:
             complexity_scores[TaskComplexity.COMPLEX] += 1
-        
+
+        scores = tuple((complexity.value, score) for complexity, score in complexity_scores.items())
+
         # Return highest scoring complexity
         max_complexity = max(complexity_scores, key=complexity_scores.get)
-        max_score = complexity_scores[max_complexity]
-        
+
         # Default to moderate if no clear pattern
-        if max_score == 0:
-            return TaskComplexity.MODERATE
+        if complexity_scores[max_complexity] == 0:
+            return TaskComplexity.MODERATE, scores
+
+        return max_complexity, scores
+
+    def route(self, text: str, agent_name: str = 'chat') -> RoutingDecision:
+        """
+        Classify a message and decide which model should handle it.
+
+        Callers should compute the decision once per message and pass it on
+        (create_model_for_decision, verbose output) instead of re-analyzing.
+
+        Args:
+            text: Input text to analyze
+            agent_name: Name of the agent requesting the model
+
+        Returns:
+            RoutingDecision with complexity, model key, model config and scores
+        """
+        complexity, scores = self._classify_cached(text)
+
+        # Model selection logic
+        model_key = _COMPLEXITY_MODEL_KEYS.get(complexity, 'chat')
         
-        return max_complexity
+        # Move away from a model that is currently too slow or failing
+        reason = None
+        if self._latency_router is not None:
+            model_key, reason = self._latency_router.choose(complexity.value, model_key, self._model_configs.keys())
+
+        # Override with agent-specific preferences if configured
+        agent_model = self.config.get(f'bedrock.agents.{agent_name}.model_id')
+        with self._config_lock:
+            if agent_model:
+                # Find which model key matches this model_id
+                for key, config in self._model_configs.items():
+                    if config.model_id == agent_model:
+                        model_key = key
+                        break
+
+            config = self._model_configs.get(model_key, self._model_configs['chat'])
+
+        return RoutingDecision(
+            complexity=complexity,
+            model_key=model_key,
+            config=config,
+            scores=dict(scores),
+            reason=reason
+        )
+
+    def analyze_task_complexity(self, text: str) -> TaskComplexity:
+        """
+        Analyze task complexity based on text patterns.
+        
+        Args:
+            text: Input text to analyze
+            
+        Returns:
+            TaskComplexity level
+        """
+        return self._classify_cached(text)[0]
     
     def select_optimal_model(self, text: str, agent_name: str = 'chat') -> Tuple[str, ModelConfig]:
         """
@@ -298,32 +530,50 @@ class DynamicModelConfigManager:
         Returns:
             Tuple of (model_key, ModelConfig)
         """
-        complexity = self.analyze_task_complexity(text)
-        
-        # Model selection logic
-        model_key = 'chat'  # default
+        decision = self.route(text, agent_name)
+        return decision.model_key, decision.config
+    
+    def start_request_timer(self, agent, decision: RoutingDecision) -> Optional[RequestTimer]:
+        """
+        Start measuring a request for latency-aware routing.
         
-        if complexity == TaskComplexity.SIMPLE:
-            model_key = 'fast'
-        elif complexity == TaskComplexity.MODERATE:
-            model_key = 'chat'
-        elif complexity == TaskComplexity.COMPLEX:
-            model_key = 'reasoning'
-        elif complexity == TaskComplexity.REASONING:
-            model_key = 'reasoning'
+        Install the returned timer as the agent's callback handler and pass it to
+        finish_request() when the request is done.
         
-        # Override with agent-specific preferences if configured
-        agent_model = self.config.get(f'bedrock.agents.{agent_name}.model_id')
-        if agent_model:
-            # Find which model key matches this model_id
-            for key, config in self._model_configs.items():
-                if config.model_id == agent_model:
-                    model_key = key
-                    break
-        
-        return model_key, self._model_configs.get(model_key, self._model_configs['chat'])
+        Returns:
+            RequestTimer, or None when latency-aware routing is disabled
+        """
+        if self._latency_router is None:
+            return None
+        return RequestTimer(agent, decision.model_key, decision.complexity.value)
+    
+    def finish_request(self, timer: Optional[RequestTimer], error: bool = False) -> None:
+        """Record a request measured with start_request_timer()."""
+        if timer is not None and self._latency_router is not None:
+            self._latency_router.record(timer.observation(error=error))
+    
+    def record_latency(self, observation: LatencyObservation) -> None:
+        """Record an externally measured request for latency-aware routing."""
+        if self._latency_router is not None:
+            self._latency_router.record(observation)
     
-    def get_warmed_model(self, model_key: str) -> Optional[BedrockModel]:
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the learned latency statistics per model key (empty when disabled)."""
+        if self._latency_router is None:
+            return {}
+        return {key: asdict(stats) for key, stats in self._latency_router.get_stats().items()}
+    
+    def get_routing_cache_info(self) -> Dict[str, int]:
+        """Get hit/miss statistics of the memoized complexity classifier."""
+        info = self._classify_cached.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize
+        }
+    
+    def get_warmed_model(self, model_key: str) -> Optional[Model]:
         """
         Get a warmed model instance.
         
@@ -331,18 +581,36 @@ class DynamicModelConfigManager:
             model_key: Key of the model to retrieve
             
         Returns:
-            Warmed BedrockModel instance or None
+            Warmed model (a BedrockModel, or a HedgedModel around one) or None
         """
         # Try to get warmed model first
-        if model_key in self._warmed_models:
-            return self._warmed_models[model_key]
+        model = self._warmed_models.get(model_key)
+        if model is not None:
+            return model
         
-        # If not warmed, try to warm it now
+        # If not warmed, warm it now or wait for the warm-up already in progress
         if self._warmup_model(model_key):
-            return self._warmed_models[model_key]
+            return self._warmed_models.get(model_key)
         
         return None
     
+    def create_model_for_decision(self, decision: RoutingDecision) -> Model:
+        """
+        Get the model for a routing decision.
+        
+        Args:
+            decision: Routing decision from route()
+            
+        Returns:
+            Warmed BedrockModel (or a new one if none is warmed) behind the shared rate limiter
+        """
+        # Try to get warmed model first, create a new one if none is warmed;
+        # the returned model shares the client-side rate limiter
+        model = self.get_warmed_model(decision.model_key)
+        if model is None:
+            model = self._apply_execution_policy(self._build_model(decision.config), decision.config)
+        return rate_limited(model)
+    
     def create_optimized_model(self, text: str, agent_name: str = 'chat') -> BedrockModel:
         """
         Create an optimized model based on task analysis.
@@ -354,23 +622,7 @@ class DynamicModelConfigManager:
         Returns:
             Optimized BedrockModel instance
         """
-        model_key, config = self.select_optimal_model(text, agent_name)
-        
-        # Try to get warmed model first
-        warmed_model = self.get_warmed_model(model_key)
-        if warmed_model:
-            return warmed_model
-        
-        # Create new model if no warmed version available
-        return BedrockModel(
-            model_id=config.model_id,
-            temperature=config.temperature,
-            top_p=config.top_p,
-            max_tokens=config.max_tokens,
-            stop_sequences=config.stop_sequences,
-            streaming=config.streaming,
-            region_name=config.region_name
-        )
+        return self.create_model_for_decision(self.route(text, agent_name))
     
     def update_model_config(self, model_key: str, **updates) -> bool:
         """
@@ -388,19 +640,17 @@ class DynamicModelConfigManager:
                 return False
             
             try:
-                # Update configuration
+                # Replace the configuration so in-flight warm-ups of the old one are discarded
                 config = self._model_configs[model_key]
-                for key, value in updates.items():
-                    if hasattr(config, key):
-                        setattr(config, key, value)
+                valid_updates = {key: value for key, value in updates.items() if hasattr(config, key)}
+                self._model_configs[model_key] = replace(config, **valid_updates)
                 
                 # Invalidate warmed model to force recreation
-                if model_key in self._warmed_models:
-                    del self._warmed_models[model_key]
+                self._warmed_models.pop(model_key, None)
+                self._warmup_futures.pop(model_key, None)
                 
                 # Remove warmup stats to trigger re-warmup
-                if model_key in self._warmup_stats:
-                    del self._warmup_stats[model_key]
+                self._warmup_stats.pop(model_key, None)
                 
                 self.logger.info(f"Updated model config for {model_key}: {updates}")
                 return True
@@ -427,6 +677,12 @@ class DynamicModelConfigManager:
             # Clear warmed models to force recreation with new configs
             self._warmed_models.clear()
             self._warmup_stats.clear()
+            self._warmup_futures.clear()
+            self._warm_clients.clear()
+            reset_bedrock_clients()
+            
+            self._save_latency_stats()
+            self._latency_router = self._create_latency_router()
             
             self.logger.info("Reloaded model configurations from config file")
 
@@ -458,7 +714,35 @@ def create_optimized_model(text: str, agent_name: str = 'chat') -> BedrockModel:
     return manager.create_optimized_model(text, agent_name)
 
 
+def warm_up_models(model_keys: Optional[List[str]] = None) -> Dict[str, concurrent.futures.Future]:
+    """
+    Convenience function to start warming up models in the background.
+    
+    Args:
+        model_keys: Keys of the models to warm up (default: all models)
+        
+    Returns:
+        Dictionary mapping model key to the future of its warm-up
+    """
+    manager = get_dynamic_model_manager()
+    return manager.warm_up(model_keys)
+
+
 def get_model_warmup_stats() -> Dict[str, ModelWarmupStats]:
     """Get model warm-up statistics."""
     manager = get_dynamic_model_manager()
-    return manager.get_warmup_stats()
\ No newline at end of file
+    return manager.get_warmup_stats()
+
+def route_message(text: str, agent_name: str = 'chat') -> RoutingDecision:
+    """
+    Convenience function to classify a message and choose its model.
+    
+    Args:
+        text: Input text to analyze
+        agent_name: Name of the requesting agent
+        
+    Returns:
+        RoutingDecision for the message
+    """
+    manager = get_dynamic_model_manager()
+    return manager.route(text, agent_name)
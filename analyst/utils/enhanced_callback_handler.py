@@ -1,131 +1,416 @@
-"""Enhanced callback handler for Strands agents with rich tool output display."""
+"""Enhanced callback handler for Strands agents with rich tool output display.
 
-import sys
+EnhancedCallbackHandler turns the Strands callback keyword arguments into
+small event dicts and passes them to sinks: the terminal, a JSONL trace file
+and an in-memory ring buffer. Each agent gets its own handler. The record of
+which tool calls have been shown is kept per invocation in a context variable,
+keyed by tool use ID and bounded in size. The handler is also a hook provider:
+registered with the agent's hooks, it ends the invocation from
+AfterInvocationEvent, so the state and the terminal buffers of failed
+invocations are released too.
+"""
+
+import atexit
+import contextvars
+import json
+import threading
 import time
-from typing import Any, Dict, Optional
-from .tool_output_display import (
-    get_tool_output_config,
-    format_tool_name,
-    format_input,
-    format_error,
-    format_success,
-    colorize
-)
+import uuid
+import weakref
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from .tool_output_display import get_tool_output_config, get_renderer, BufferedStreamWriter
+from ..config import get_config
 
-# Global state to track tool calls and prevent duplicate output
-_tool_call_tracker = {}
-_active_tools = {}  # Track currently executing tools
+if TYPE_CHECKING:
+    from strands.hooks import AfterInvocationEvent, HookRegistry
 
-def enhanced_callback_handler(**kwargs) -> None:
+# Shared by all terminal sinks, so concurrent agents do not interleave within a line
+_terminal_lock = threading.RLock()
+
+# Handlers still alive, closed at exit; a handler dropped with its agent is not kept alive
+_open_handlers: 'weakref.WeakSet' = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_handlers() -> None:
+    for handler in list(_open_handlers):
+        handler.close()
+
+_HTTP_METHODS = {'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'}
+
+
+def classify_tool_inputs(tool_inputs: Dict[str, Any]) -> List[Tuple[str, str]]:
     """
-    Enhanced callback handler that provides rich tool output display.
-    
-    This handler replicates the default Strands PrintingCallbackHandler behavior
-    while adding enhanced tool display functionality.
+    Pick the tool inputs worth displaying and classify them.
+
+    Args:
+        tool_inputs: Parsed tool input
+
+    Returns:
+        List of (input type, value) pairs
+    """
+    inputs = []
+    for key, value in tool_inputs.items():
+        if isinstance(value, str) and value.strip():
+            # Skip showing HTTP methods and other short technical values
+            if value.strip().upper() in _HTTP_METHODS:
+                continue
+
+            # Determine input type based on key name and value
+            if key.lower() in ['url', 'link', 'href'] or value.startswith(('http://', 'https://')):
+                inputs.append(('url', value))
+            elif key.lower() in ['file', 'filename', 'file_path', 'path'] or ('/' in value or '\\' in value or value.endswith(('.txt', '.md', '.json', '.yml', '.yaml'))):
+                inputs.append(('file', value))
+            elif key.lower() in ['directory', 'dir', 'folder']:
+                inputs.append(('path', value))
+            elif key.lower() in ['query', 'search', 'q']:
+                inputs.append(('query', value))
+            elif len(value.strip()) > 5:  # Only show meaningful text inputs
+                # Smart truncation for long text
+                display_value = value
+                if len(value) > 80:
+                    display_value = value[:77] + "..."
+                inputs.append(('text', display_value))
+        elif value is not None and str(value).strip():
+            # Show non-string values if they're meaningful
+            value_str = str(value).strip()
+            if len(value_str) > 2 and value_str not in ['{}', '[]', 'null', 'None']:
+                inputs.append(('data', value_str))
+    return inputs
+
+
+class CallbackSink:
+    """
+    Receiver of callback handler events.
+
+    Events are dicts with a 'type' ('invocation_start', 'text', 'tool_start',
+    'tool_input', 'tool_result', 'error', 'invocation_end'), the 'agent' name,
+    the 'invocation' ID and a 'timestamp', plus type-specific fields.
+    """
+
+    def handle(self, event: Dict[str, Any]) -> None:
+        """Process one event."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources held by the sink."""
+
+
+class TerminalSink(CallbackSink):
+    """Print streamed text and tool activity to the terminal.
+
+    Each invocation buffers its streamed text separately, so concurrent
+    invocations write whole batches instead of interleaved tokens.
+    """
+
+    def __init__(self, flush_interval: Optional[float] = None):
+        """
+        Initialize the terminal sink.
+
+        Args:
+            flush_interval: Longest time streamed text is buffered (defaults to tool_output.stream_flush_interval)
+        """
+        if flush_interval is None:
+            flush_interval = get_tool_output_config().get('stream_flush_interval', 0.05)
+        self.flush_interval = flush_interval
+        self._writers: Dict[str, BufferedStreamWriter] = {}
+        self._lock = threading.Lock()
+
+    def _writer(self, invocation: str) -> BufferedStreamWriter:
+        with self._lock:
+            writer = self._writers.get(invocation)
+            if writer is None:
+                writer = self._writers[invocation] = BufferedStreamWriter(
+                    flush_interval=self.flush_interval, lock=_terminal_lock)
+            return writer
+
+    def handle(self, event: Dict[str, Any]) -> None:
+        event_type = event['type']
+        if event_type == 'text':
+            self._writer(event['invocation']).write(event['text'])
+            return
+
+        if event_type == 'invocation_end':
+            with self._lock:
+                writer = self._writers.pop(event['invocation'], None)
+            if writer is not None:
+                writer.close()
+            return
+
+        renderer = get_renderer()
+        with _terminal_lock:
+            # Write out the streamed text first to keep the order
+            with self._lock:
+                writer = self._writers.get(event['invocation'])
+            if writer is not None:
+                writer.flush()
+            if not renderer.enabled:
+                return
+            if event_type == 'tool_start' and renderer.show_tool_names:
+                print()  # Add newline before tool name
+                print(renderer.tool_name(event['tool']))
+            elif event_type == 'tool_input' and renderer.show_inputs:
+                for input_type, input_value in event['inputs']:
+                    print(renderer.input(input_type, input_value))
+            elif event_type == 'error':
+                print(renderer.error(Exception(event['error'])))
+
+    def close(self) -> None:
+        with self._lock:
+            writers = list(self._writers.values())
+            self._writers.clear()
+        for writer in writers:
+            writer.close()
+
+
+class JsonlTraceSink(CallbackSink):
+    """Append events to a JSON Lines file."""
+
+    def __init__(self, path: str, include_text: bool = True):
+        """
+        Initialize the trace sink.
+
+        Args:
+            path: JSONL file the events are appended to
+            include_text: Record streamed text chunks as well as tool activity
+        """
+        self.path = Path(path)
+        self.include_text = include_text
+        self._file = None
+        self._lock = threading.Lock()
+
+    def handle(self, event: Dict[str, Any]) -> None:
+        if event['type'] == 'text' and not self.include_text:
+            return
+        line = json.dumps(event, default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line + '\n')
+            if event['type'] == 'invocation_end':
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RingBufferSink(CallbackSink):
+    """Keep the most recent events in memory."""
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Number of events kept; older events are dropped
+        """
+        self._events = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def handle(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self._events.append(event)
+
+    def events(self, invocation: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the buffered events, optionally of one invocation only."""
+        with self._lock:
+            events = list(self._events)
+        if invocation is not None:
+            events = [event for event in events if event.get('invocation') == invocation]
+        return events
+
+
+class _InvocationState:
+    """Tool calls already shown in one invocation."""
+
+    def __init__(self, max_tracked: int):
+        self.invocation_id = uuid.uuid4().hex[:12]
+        self.max_tracked = max_tracked
+        # Tool use ID -> whether its inputs have been shown
+        self.tools: "OrderedDict[str, bool]" = OrderedDict()
+
+    def track(self, tool_use_id: str) -> bool:
+        """Start tracking a tool call; returns False if it was already tracked."""
+        if tool_use_id in self.tools:
+            return False
+        self.tools[tool_use_id] = False
+        while len(self.tools) > self.max_tracked:
+            self.tools.popitem(last=False)
+        return True
+
+
+class EnhancedCallbackHandler:
     """
-    config = get_tool_output_config()
-    
-    # Handle text data streaming (replicate default PrintingCallbackHandler)
-    if "data" in kwargs:
-        data = kwargs["data"]
-        if isinstance(data, str) and data.strip():
-            print(data, end="", flush=True)
-        return
-    
-    # Handle tool execution events with enhanced display
-    if config.get('enabled', True) and "current_tool_use" in kwargs and kwargs["current_tool_use"]:
-        tool_use = kwargs["current_tool_use"]
-        
+    Callback handler that provides rich tool output display.
+
+    Replicates the default Strands PrintingCallbackHandler behavior while
+    adding enhanced tool display, and passes every event to its sinks. Pass
+    the handler in the agent's hooks as well, so failed invocations are ended.
+    """
+
+    def __init__(self, sinks: Optional[List[CallbackSink]] = None, agent_name: Optional[str] = None,
+                 max_tracked_tools: int = 256):
+        """
+        Initialize the handler.
+
+        Args:
+            sinks: Event receivers (defaults to a TerminalSink)
+            agent_name: Agent name recorded in the events
+            max_tracked_tools: Tool calls remembered per invocation
+        """
+        self.sinks = list(sinks) if sinks is not None else [TerminalSink()]
+        self.agent_name = agent_name
+        self.max_tracked_tools = max_tracked_tools
+        self._current: contextvars.ContextVar[Optional[_InvocationState]] = contextvars.ContextVar(
+            f"callback_state_{id(self)}", default=None)
+
+    def register_hooks(self, registry: 'HookRegistry', **kwargs: Any) -> None:
+        """End the invocation after it finishes, whether it succeeded or failed."""
+        from strands.hooks import AfterInvocationEvent
+        registry.add_callback(AfterInvocationEvent, self.after_invocation)
+
+    def after_invocation(self, event: 'AfterInvocationEvent') -> None:
+        self._end_invocation()
+
+    def _state(self) -> _InvocationState:
+        state = self._current.get()
+        if state is None:
+            state = _InvocationState(self.max_tracked_tools)
+            self._current.set(state)
+        return state
+
+    def _end_invocation(self) -> None:
+        """Emit invocation_end and drop the invocation state (once per invocation)."""
+        state = self._current.get()
+        if state is not None:
+            self._current.set(None)
+            self._emit(state, 'invocation_end')
+
+    def _emit(self, state: _InvocationState, event_type: str, **fields: Any) -> None:
+        event = {'type': event_type, 'agent': self.agent_name, 'invocation': state.invocation_id,
+                 'timestamp': time.time(), **fields}
+        for sink in self.sinks:
+            sink.handle(event)
+
+    def __call__(self, **kwargs: Any) -> None:
+        # Handle text data streaming (replicate default PrintingCallbackHandler)
+        if "data" in kwargs:
+            data = kwargs["data"]
+            if isinstance(data, str) and data.strip():
+                self._emit(self._state(), 'text', text=data)
+            return
+
+        if kwargs.get("init_event_loop"):
+            # A new invocation starts with fresh state
+            self._current.set(None)
+            self._emit(self._state(), 'invocation_start')
+            return
+
+        if "result" in kwargs:
+            # Without the hook registered, the result is the end of the invocation
+            self._end_invocation()
+            return
+
+        state = self._state()
+
+        # Handle tool execution events with enhanced display
+        tool_use = kwargs.get("current_tool_use")
         if tool_use and isinstance(tool_use, dict) and "name" in tool_use:
-            tool_name = tool_use.get("name", "Unknown Tool")
-            tool_inputs = tool_use.get("input", {})
-            
-            # Create a unique key for this tool call
-            tool_key = f"{tool_name}:{id(tool_use)}"
-            
-            # Show tool name (only once per tool call)
-            if tool_key not in _tool_call_tracker:
-                if config.get('show_tool_names', True):
-                    print()  # Add newline before tool name
-                    print(format_tool_name(tool_name))
-                _tool_call_tracker[tool_key] = True
-            
-            # Show inputs when they become available and complete (separate from tool name)
-            inputs_key = f"{tool_key}:inputs"
-            if (config.get('show_inputs', True) and 
-                tool_inputs and 
-                inputs_key not in _tool_call_tracker):
-                
-                parsed_inputs = None
-                
-                # Try to parse inputs based on type
-                if isinstance(tool_inputs, dict) and tool_inputs:  # Non-empty dict
-                    parsed_inputs = tool_inputs
-                elif isinstance(tool_inputs, str) and tool_inputs.strip():
-                    # Try to parse as JSON if it looks complete
-                    if tool_inputs.strip().startswith('{') and tool_inputs.strip().endswith('}'):
-                        try:
-                            import json
-                            parsed_inputs = json.loads(tool_inputs)
-                        except json.JSONDecodeError:
-                            pass  # Skip invalid JSON
-                
-                # Process parsed inputs (only when complete)
-                if parsed_inputs and isinstance(parsed_inputs, dict):
-                    for key, value in parsed_inputs.items():
-                        if isinstance(value, str) and value.strip():
-                            # Skip showing HTTP methods and other short technical values
-                            if value.strip().upper() in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
-                                continue
-                            
-                            # Determine input type based on key name and value
-                            if key.lower() in ['url', 'link', 'href'] or value.startswith(('http://', 'https://')):
-                                print(format_input('url', value))
-                            elif key.lower() in ['file', 'filename', 'file_path', 'path'] or ('/' in value or '\\' in value or value.endswith(('.txt', '.md', '.json', '.yml', '.yaml'))):
-                                print(format_input('file', value))
-                            elif key.lower() in ['directory', 'dir', 'folder']:
-                                print(format_input('path', value))
-                            elif key.lower() in ['query', 'search', 'q']:
-                                print(format_input('query', value))
-                            elif len(value.strip()) > 5:  # Only show meaningful text inputs
-                                # Smart truncation for long text
-                                display_value = value
-                                if len(value) > 80:
-                                    display_value = value[:77] + "..."
-                                print(format_input('text', display_value))
-                        elif value is not None and str(value).strip():
-                            # Show non-string values if they're meaningful
-                            value_str = str(value).strip()
-                            if len(value_str) > 2 and value_str not in ['{}', '[]', 'null', 'None']:
-                                print(format_input('data', value_str))
-                    
-                    # Mark inputs as shown
-                    _tool_call_tracker[inputs_key] = True
-    
-    # Handle tool results and errors (if available in Strands events)
-    if config.get('enabled', True):
-        # Check for tool completion or error events
-        if "tool_result" in kwargs:
-            tool_result = kwargs["tool_result"]
-            if tool_result:
-                # Show success or error based on result
-                result_str = str(tool_result)
-                if "error" in result_str.lower() or "❌" in result_str:
-                    print(format_error(Exception(result_str)))
-                elif "success" in result_str.lower() or "✅" in result_str:
-                    print(format_success("Tool completed successfully"))
-        
+            self._handle_tool_use(state, tool_use)
+
+        # Tool results arrive as the tool result message
+        message = kwargs.get("message")
+        if isinstance(message, dict):
+            for content in message.get("content", []):
+                tool_result = content.get("toolResult") if isinstance(content, dict) else None
+                if tool_result:
+                    self._emit(state, 'tool_result', tool_use_id=tool_result.get("toolUseId"),
+                               status=tool_result.get("status"))
+
         # Handle error events specifically
-        if "error" in kwargs and kwargs["error"]:
-            error = kwargs["error"]
-            if isinstance(error, Exception):
-                print(format_error(error))
-            else:
-                print(format_error(Exception(str(error))))
-    
-    # Handle message events (for final responses)
-    if "message" in kwargs and isinstance(kwargs["message"], dict):
-        message = kwargs["message"]
-        # The text content is already handled by "data" events above
-        pass
\ No newline at end of file
+        if kwargs.get("error"):
+            self._emit(state, 'error', error=str(kwargs["error"]))
+
+    def _handle_tool_use(self, state: _InvocationState, tool_use: Dict[str, Any]) -> None:
+        tool_name = tool_use.get("name", "Unknown Tool")
+        tool_use_id = tool_use.get("toolUseId") or f"{tool_name}:{id(tool_use)}"
+
+        # Show tool name (only once per tool call)
+        if state.track(tool_use_id):
+            self._emit(state, 'tool_start', tool=tool_name, tool_use_id=tool_use_id)
+
+        # Show inputs when they become available and complete (separate from tool name)
+        if state.tools.get(tool_use_id, True):
+            return
+        tool_inputs = tool_use.get("input", {})
+        parsed_inputs = None
+
+        # Try to parse inputs based on type
+        if isinstance(tool_inputs, dict) and tool_inputs:  # Non-empty dict
+            parsed_inputs = tool_inputs
+        elif isinstance(tool_inputs, str) and tool_inputs.strip():
+            # Try to parse as JSON if it looks complete
+            if tool_inputs.strip().startswith('{') and tool_inputs.strip().endswith('}'):
+                try:
+                    parsed_inputs = json.loads(tool_inputs)
+                except json.JSONDecodeError:
+                    pass  # Skip invalid JSON
+
+        # Process parsed inputs (only when complete)
+        if parsed_inputs and isinstance(parsed_inputs, dict):
+            state.tools[tool_use_id] = True
+            self._emit(state, 'tool_input', tool=tool_name, tool_use_id=tool_use_id,
+                       inputs=classify_tool_inputs(parsed_inputs))
+
+    def close(self) -> None:
+        """Close all sinks."""
+        for sink in self.sinks:
+            sink.close()
+
+
+def create_callback_handler(agent_name: Optional[str] = None) -> EnhancedCallbackHandler:
+    """
+    Create a callback handler with the sinks configured in tool_output.event_sinks.
+
+    Args:
+        agent_name: Agent name recorded in the events
+    """
+    config = get_config()
+    sinks: List[CallbackSink] = [TerminalSink()]
+    trace_file = config.get('tool_output.event_sinks.jsonl_file')
+    if trace_file:
+        sinks.append(JsonlTraceSink(trace_file, include_text=config.get('tool_output.event_sinks.jsonl_include_text', True)))
+    ring_buffer_size = config.get('tool_output.event_sinks.ring_buffer_size', 0)
+    if ring_buffer_size:
+        sinks.append(RingBufferSink(ring_buffer_size))
+
+    handler = EnhancedCallbackHandler(sinks, agent_name=agent_name)
+    _open_handlers.add(handler)
+    return handler
+
+
+_default_handler: Optional[EnhancedCallbackHandler] = None
+_default_handler_lock = threading.Lock()
+
+
+def enhanced_callback_handler(**kwargs) -> None:
+    """
+    Enhanced callback handler that provides rich tool output display.
+
+    Function form for code that passes a plain callable; it uses one shared
+    EnhancedCallbackHandler with a terminal sink. Agents should prefer their
+    own handler from create_callback_handler().
+    """
+    global _default_handler
+    if _default_handler is None:
+        with _default_handler_lock:
+            if _default_handler is None:
+                _default_handler = EnhancedCallbackHandler(agent_name=None)
+    _default_handler(**kwargs)
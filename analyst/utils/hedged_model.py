@@ -0,0 +1,225 @@
+"""
+Hedged and failover model execution for Strands Analyst.
+
+HedgedModel wraps a primary model and one or more secondary models (another
+provider, or the same provider in another region) behind the Strands Model
+interface. A request goes to the primary first. If the primary has not started
+responding within the hedge delay - a fixed threshold, or the observed p95
+time to first event of the primary - the request is also sent to the next
+secondary, the first model to respond wins and the other requests are
+cancelled. When a model is throttled before it responds, the request fails
+over to the next secondary immediately.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, AsyncIterable, Deque, Dict, List, Optional, Sequence, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from strands.models import Model
+from strands.types.content import Messages
+from strands.types.exceptions import ModelThrottledException
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Marks the end of a candidate's stream in the shared event queue
+_DONE = object()
+
+# Primary response times kept for the adaptive hedge delay, and samples needed to use it
+_TTFT_WINDOW = 200
+_MIN_TTFT_SAMPLES = 20
+
+# Model that won the latest request made from the current context (agent invocation).
+# A context variable rather than an attribute, because one HedgedModel is shared by
+# concurrent invocations.
+_served_by: contextvars.ContextVar[Optional[Model]] = contextvars.ContextVar("hedged_model_served_by", default=None)
+
+
+class HedgedModel(Model):
+    """
+    Model that hedges slow requests and fails over throttled ones.
+
+    Only the start of a response is raced: once a model has produced its first
+    event it is the winner and the rest of its stream is passed through
+    unchanged. Errors after that point are raised as usual.
+    """
+
+    def __init__(self, primary: Model, secondaries: Sequence[Model], hedge_after_ms: float = 4000,
+                 adaptive: bool = True, min_hedge_ms: float = 500, failover_on_throttling: bool = True):
+        """
+        Initialize the hedged model.
+
+        Args:
+            primary: Model that receives every request first
+            secondaries: Models used for hedged and failover requests, in order of preference
+            hedge_after_ms: Start a hedged request if the primary has not responded after this long
+            adaptive: Use the observed p95 time to first event of the primary (capped at hedge_after_ms)
+            min_hedge_ms: Lower bound for the adaptive hedge delay
+            failover_on_throttling: Send the request to the next model when one is throttled
+        """
+        self.primary = primary
+        self.secondaries = list(secondaries)
+        self.hedge_after_ms = hedge_after_ms
+        self.adaptive = adaptive
+        self.min_hedge_ms = min_hedge_ms
+        self.failover_on_throttling = failover_on_throttling
+
+        self._primary_ttft: Deque[float] = deque(maxlen=_TTFT_WINDOW)
+        self._stats = {'requests': 0, 'hedged': 0, 'secondary_wins': 0, 'failovers': 0}
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration of the model that served this invocation's latest request (the primary before any)."""
+        return self.served_by().get_config()
+
+    def served_by(self) -> Model:
+        """Model that served the latest request of the current invocation, or the primary if none has."""
+        winner = _served_by.get()
+        if winner is not None and (winner is self.primary or any(winner is model for model in self.secondaries)):
+            return winner
+        return self.primary
+
+    def update_config(self, **model_config: Any) -> None:
+        """Update the primary model's configuration."""
+        self.primary.update_config(**model_config)
+
+    def get_config(self) -> Any:
+        """Return the primary model's configuration."""
+        return self.primary.get_config()
+
+    def hedge_delay_ms(self) -> float:
+        """Current delay before a hedged request is sent."""
+        if not self.adaptive or len(self._primary_ttft) < _MIN_TTFT_SAMPLES:
+            return self.hedge_after_ms
+        samples = sorted(self._primary_ttft)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return min(self.hedge_after_ms, max(self.min_hedge_ms, p95))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, hedge, secondary win and failover counts."""
+        return {**self._stats, 'hedge_delay_ms': round(self.hedge_delay_ms())}
+
+    def _is_failover_error(self, error: BaseException) -> bool:
+        """Return whether an error before the first event should move the request to the next model."""
+        return self.failover_on_throttling and isinstance(error, ModelThrottledException)
+
+    @staticmethod
+    async def _pump(index: int, events: AsyncIterable[StreamEvent], queue: asyncio.Queue) -> None:
+        """Forward a candidate's stream events to the shared queue, tagged with its index."""
+        try:
+            async for event in events:
+                await queue.put((index, event))
+            await queue.put((index, _DONE))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put((index, e))
+
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[List[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Stream a response from whichever model starts responding first."""
+        candidates = [self.primary] + self.secondaries
+        queue: asyncio.Queue = asyncio.Queue()
+        tasks: Dict[int, asyncio.Task] = {}
+        started = time.perf_counter()
+        self._stats['requests'] += 1
+
+        def launch() -> None:
+            index = len(tasks)
+            events = candidates[index].stream(messages, tool_specs, system_prompt, **kwargs)
+            tasks[index] = asyncio.create_task(self._pump(index, events, queue))
+
+        def running(exclude: int) -> bool:
+            return any(not task.done() for index, task in tasks.items() if index != exclude)
+
+        launch()
+        hedge_at = started + self.hedge_delay_ms() / 1000
+        winner = None
+
+        try:
+            # Race the candidates until one produces its first event
+            while winner is None:
+                can_hedge = len(tasks) < len(candidates)
+                try:
+                    if can_hedge:
+                        index, item = await asyncio.wait_for(queue.get(), max(0.0, hedge_at - time.perf_counter()))
+                    else:
+                        index, item = await queue.get()
+                except asyncio.TimeoutError:
+                    logger.debug(f"No response after {self.hedge_delay_ms():.0f}ms, sending hedged request")
+                    self._stats['hedged'] += 1
+                    launch()
+                    hedge_at = time.perf_counter() + self.hedge_delay_ms() / 1000
+                    continue
+
+                if isinstance(item, BaseException):
+                    if self._is_failover_error(item) and len(tasks) < len(candidates):
+                        logger.info(f"Model {index} throttled, failing over to the next model")
+                        self._stats['failovers'] += 1
+                        launch()
+                        hedge_at = time.perf_counter() + self.hedge_delay_ms() / 1000
+                        continue
+                    if running(exclude=index):
+                        continue
+                    raise item
+
+                winner = index
+
+            # Stop the other requests
+            for index, task in tasks.items():
+                if index != winner:
+                    task.cancel()
+
+            _served_by.set(candidates[winner])
+            if winner == 0:
+                self._primary_ttft.append((time.perf_counter() - started) * 1000)
+            else:
+                self._stats['secondary_wins'] += 1
+
+            if item is _DONE:
+                return
+            yield item
+
+            # Pass the rest of the winner's stream through
+            while True:
+                index, item = await queue.get()
+                if index != winner:
+                    continue
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def structured_output(
+        self, output_model: Type[T], prompt: Messages, system_prompt: Optional[str] = None, **kwargs: Any
+    ) -> AsyncGenerator[Dict[str, Union[T, Any]], None]:
+        """Get structured output, failing over to the next model when throttled."""
+        candidates = [self.primary] + self.secondaries
+        for position, model in enumerate(candidates):
+            try:
+                async for event in model.structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs):
+                    yield event
+                _served_by.set(model)
+                return
+            except Exception as e:
+                if not self._is_failover_error(e) or position == len(candidates) - 1:
+                    raise
+                self._stats['failovers'] += 1
+                logger.info(f"Model {position} throttled, failing over to the next model")
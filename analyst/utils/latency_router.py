@@ -0,0 +1,285 @@
+"""
+Latency-aware model routing for Strands Analyst.
+
+This module learns how each model key (fast, chat, reasoning, default) actually
+performs and uses it when routing messages. Every request records its latency,
+time to first token, output tokens per second and whether it failed; the
+router keeps exponentially weighted averages per model key in a small JSON
+store. When the model preferred for a complexity class misses the latency SLO
+of that class or fails too often, traffic moves to the next acceptable model,
+with a periodic probe request so the preferred model is picked again once it
+recovers.
+
+Routing decisions can be replayed offline against recorded observations with
+LatencyRouter.replay().
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Models to fall back to, in order, for each complexity class
+FALLBACK_ORDER = {
+    'simple': ['fast', 'chat', 'default', 'reasoning'],
+    'moderate': ['chat', 'fast', 'default', 'reasoning'],
+    'complex': ['reasoning', 'chat', 'default', 'fast'],
+    'reasoning': ['reasoning', 'chat', 'default', 'fast']
+}
+
+# Minimum seconds between writes of the stats file
+_SAVE_INTERVAL = 5.0
+
+
+@dataclass
+class LatencyObservation:
+    """One recorded model request."""
+    model_key: str
+    complexity: str
+    latency_ms: float
+    ttft_ms: Optional[float] = None
+    output_tokens: int = 0
+    error: bool = False
+    timestamp: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyObservation':
+        """Create an observation from a recorded trace entry."""
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+@dataclass
+class ModelLatencyStats:
+    """Exponentially weighted performance averages of one model key."""
+    samples: int = 0
+    successes: int = 0
+    latency_ms: float = 0.0
+    ttft_ms: Optional[float] = None
+    output_tps: float = 0.0
+    error_rate: float = 0.0
+    updated_at: float = 0.0
+
+    def update(self, observation: LatencyObservation, alpha: float) -> None:
+        """Fold an observation into the averages."""
+        def ewma(current: Optional[float], value: float, count: int) -> float:
+            return value if current is None or count == 0 else current + alpha * (value - current)
+
+        # The error rate averages every request, the timings only the successful ones,
+        # so each is seeded by its own first observation
+        self.error_rate = ewma(self.error_rate, 1.0 if observation.error else 0.0, self.samples)
+        if not observation.error:
+            self.latency_ms = ewma(self.latency_ms, observation.latency_ms, self.successes)
+            if observation.ttft_ms is not None:
+                self.ttft_ms = ewma(self.ttft_ms, observation.ttft_ms, self.successes)
+            if observation.output_tokens and observation.latency_ms > 0:
+                tps = observation.output_tokens / (observation.latency_ms / 1000)
+                self.output_tps = ewma(self.output_tps or None, tps, self.successes)
+            self.successes += 1
+        self.samples += 1
+        self.updated_at = observation.timestamp or time.time()
+
+    @property
+    def response_ms(self) -> float:
+        """Expected time until the user sees output: time to first token when known, else latency."""
+        return self.ttft_ms if self.ttft_ms is not None else self.latency_ms
+
+
+class LatencyRouter:
+    """
+    Pick model keys from observed performance and per-complexity latency SLOs.
+
+    The model preferred by the complexity heuristics is kept while it meets the
+    SLO of the complexity class and its error rate stays below max_error_rate,
+    or while it has fewer than min_samples observations. Otherwise the first
+    model in FALLBACK_ORDER that meets both is used, or the fastest acceptable
+    one if none meets the SLO. Every probe_interval-th shifted request still goes
+    to the preferred model so its statistics stay current.
+    """
+
+    def __init__(self, slo_ms: Dict[str, float], ewma_alpha: float = 0.3, min_samples: int = 5,
+                 max_error_rate: float = 0.25, probe_interval: int = 20,
+                 stats_file: Optional[str] = None):
+        """
+        Initialize the latency router.
+
+        Args:
+            slo_ms: Time-to-first-token SLO in milliseconds per complexity class
+            ewma_alpha: Weight of new observations in the moving averages (0-1)
+            min_samples: Observations needed before a model's statistics are trusted
+            max_error_rate: Error rate above which a model is avoided
+            probe_interval: Send every Nth shifted request to the preferred model (0 = never)
+            stats_file: JSON file the statistics are loaded from and saved to (None = memory only)
+        """
+        self.slo_ms = slo_ms
+        self.ewma_alpha = ewma_alpha
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.probe_interval = probe_interval
+        self.stats_file = Path(stats_file) if stats_file else None
+
+        self._stats: Dict[str, ModelLatencyStats] = {}
+        self._shifted: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+        self._load()
+
+    def _load(self) -> None:
+        """Load saved statistics from the stats file, if present."""
+        if not self.stats_file or not self.stats_file.is_file():
+            return
+        try:
+            data = json.loads(self.stats_file.read_text(encoding='utf-8'))
+            self._stats = {key: ModelLatencyStats(**value) for key, value in data.items()}
+        except Exception as e:
+            logger.warning(f"Could not load model latency statistics from {self.stats_file}: {e}")
+
+    def save(self) -> None:
+        """Write the statistics to the stats file."""
+        if not self.stats_file:
+            return
+        with self._lock:
+            data = {key: asdict(stats) for key, stats in self._stats.items()}
+            self._last_save = time.time()
+        try:
+            self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+            self.stats_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not save model latency statistics to {self.stats_file}: {e}")
+
+    def record(self, observation: LatencyObservation) -> None:
+        """Record a completed or failed request."""
+        with self._lock:
+            self._stats.setdefault(observation.model_key, ModelLatencyStats()).update(observation, self.ewma_alpha)
+            save_due = time.time() - self._last_save >= _SAVE_INTERVAL
+        if save_due:
+            self.save()
+
+    def get_stats(self) -> Dict[str, ModelLatencyStats]:
+        """Get a copy of the statistics per model key."""
+        with self._lock:
+            return {key: ModelLatencyStats(**asdict(stats)) for key, stats in self._stats.items()}
+
+    def _acceptable(self, stats: Optional[ModelLatencyStats], slo: float) -> Optional[bool]:
+        """Return whether a model meets the SLO and error limit, or None if it has too few samples."""
+        if stats is None or stats.samples < self.min_samples:
+            return None
+        return stats.error_rate <= self.max_error_rate and stats.response_ms <= slo
+
+    def choose(self, complexity: str, preferred_key: str,
+               candidates: Iterable[str]) -> Tuple[str, Optional[str]]:
+        """
+        Choose the model key for a request.
+
+        Args:
+            complexity: Complexity class of the request (simple, moderate, complex, reasoning)
+            preferred_key: Model key chosen by the complexity heuristics
+            candidates: Model keys that are configured and may be used
+
+        Returns:
+            Tuple of (model key, reason) where reason explains a shift and is None otherwise
+        """
+        slo = self.slo_ms.get(complexity)
+        if not slo:
+            return preferred_key, None
+
+        candidates = set(candidates)
+        with self._lock:
+            preferred = self._stats.get(preferred_key)
+            if self._acceptable(preferred, slo) is not False:
+                return preferred_key, None
+
+            # Periodically probe the preferred model so a recovery is noticed
+            shifted = self._shifted.get(preferred_key, 0) + 1
+            self._shifted[preferred_key] = shifted
+            if self.probe_interval and shifted % self.probe_interval == 0:
+                return preferred_key, "probe"
+
+            usable = []
+            for key in FALLBACK_ORDER.get(complexity, []):
+                if key == preferred_key or key not in candidates:
+                    continue
+                stats = self._stats.get(key)
+                if stats is None or stats.samples < self.min_samples or stats.error_rate > self.max_error_rate:
+                    continue
+                if stats.response_ms <= slo:
+                    return key, (f"{preferred_key} at {preferred.response_ms:.0f}ms/{preferred.error_rate:.0%} errors "
+                                 f"misses the {slo:.0f}ms SLO")
+                usable.append((stats.response_ms, key))
+
+        # No model meets the SLO - use the fastest one if it beats the preferred model
+        if usable:
+            response_ms, key = min(usable)
+            if preferred.error_rate > self.max_error_rate or response_ms < preferred.response_ms:
+                return key, f"{preferred_key} is slower or failing; no model meets the {slo:.0f}ms SLO"
+        return preferred_key, None
+
+    def replay(self, observations: Iterable[Any],
+               preferred_key: Callable[[str], str]) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Replay recorded observations offline and return the routing decisions.
+
+        For each observation, in order, a decision is made for its complexity class
+        and the observation is then recorded, as if its request had just completed.
+
+        Args:
+            observations: LatencyObservation objects or trace dicts, in time order
+            preferred_key: Function mapping a complexity class to its preferred model key
+
+        Returns:
+            List of (complexity, chosen model key, reason) per observation
+        """
+        decisions = []
+        candidates = set(FALLBACK_ORDER['simple'])
+        for observation in observations:
+            if isinstance(observation, dict):
+                observation = LatencyObservation.from_dict(observation)
+            key, reason = self.choose(observation.complexity, preferred_key(observation.complexity), candidates)
+            decisions.append((observation.complexity, key, reason))
+            self.record(observation)
+        return decisions
+
+
+class RequestTimer:
+    """
+    Measure one agent request for the latency router.
+
+    Wraps the agent's callback handler to timestamp the first streamed text
+    chunk, and snapshots the agent's accumulated metrics so the request's own
+    model latency and output tokens can be computed when it finishes.
+    """
+
+    def __init__(self, agent, model_key: str, complexity: str):
+        self.model_key = model_key
+        self.complexity = complexity
+        self.handler = agent.callback_handler
+        self.metrics = agent.event_loop_metrics
+        self.start_time = time.perf_counter()
+        self.first_token_time: Optional[float] = None
+        self.start_latency_ms = self.metrics.accumulated_metrics.get('latencyMs', 0)
+        self.start_output_tokens = self.metrics.accumulated_usage.get('outputTokens', 0)
+
+    def __call__(self, **kwargs: Any) -> None:
+        if self.first_token_time is None and kwargs.get('data'):
+            self.first_token_time = time.perf_counter()
+        if self.handler:
+            self.handler(**kwargs)
+
+    def observation(self, error: bool = False) -> LatencyObservation:
+        """Build the observation for the finished request."""
+        wall_ms = (time.perf_counter() - self.start_time) * 1000
+        model_ms = self.metrics.accumulated_metrics.get('latencyMs', 0) - self.start_latency_ms
+        ttft_ms = (self.first_token_time - self.start_time) * 1000 if self.first_token_time else None
+        return LatencyObservation(
+            model_key=self.model_key,
+            complexity=self.complexity,
+            latency_ms=model_ms if model_ms > 0 else wall_ms,
+            ttft_ms=ttft_ms,
+            output_tokens=self.metrics.accumulated_usage.get('outputTokens', 0) - self.start_output_tokens,
+            error=error,
+            timestamp=time.time()
+        )
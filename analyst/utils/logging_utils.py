@@ -5,13 +5,64 @@ This module provides reusable logging configuration and decorators for agents.
 Based on Strands documentation best practices for logging setup.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
 import functools
+import queue
 import sys
-from typing import Optional, Union
+import threading
+from typing import Dict, Optional, Union
 from ..config import get_config
 
 
+class GrayFormatter(logging.Formatter):
+    """Formatter that shows log messages in dark gray for a subtle appearance."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        return f"\033[90m{super().format(record)}\033[0m"
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that writes each record as one JSON object (for daemon mode and log collectors)."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _LogPipeline:
+    """Queue handler and background listener of one logger."""
+    
+    def __init__(self, logger: logging.Logger):
+        self.output = logging.StreamHandler(sys.stderr)
+        self.queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        self.listener = logging.handlers.QueueListener(self.queue_handler.queue, self.output,
+                                                       respect_handler_level=False)
+        self.listener.start()
+        atexit.register(self.listener.stop)
+        
+        # Remove existing handlers to avoid duplicates
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        logger.addHandler(self.queue_handler)
+        logger.propagate = False  # Prevent duplicate messages
+
+
+# Logger name -> pipeline, set up once per process
+_pipelines: Dict[str, _LogPipeline] = {}
+_pipelines_lock = threading.Lock()
+
+
 def configure_logging(
     verbose: bool = False,
     level: Optional[Union[str, int]] = None,
@@ -21,6 +72,12 @@ def configure_logging(
     """
     Configure Strands logging based on configuration and verbose flag.
     
+    Records are put on a queue by the logging thread and written to stderr by
+    a background listener, so slow or piped stderr does not stall the tool and
+    model threads. The queue and listener are set up once per process; later
+    calls only change the level and format. With logging.output_format set to
+    "json", records are written as JSON lines.
+    
     Args:
         verbose: Whether verbose mode is enabled
         level: Override logging level (uses config if None)
@@ -31,10 +88,11 @@ def configure_logging(
         bool: Whether logging should be visible based on config and verbose flag
     """
     config = get_config()
+    logger = logging.getLogger(logger_name)
     
     # Check if logging is enabled at all
     if not config.get_logging_enabled():
-        logging.getLogger(logger_name).setLevel(logging.CRITICAL + 1)  # Disable all logging
+        logger.setLevel(logging.CRITICAL + 1)  # Disable all logging
         return False
     
     # Determine if logging should be shown
@@ -54,37 +112,19 @@ def configure_logging(
     
     # If logging should not be shown, set level high to suppress output
     if not show_logging:
-        logging.getLogger(logger_name).setLevel(logging.CRITICAL + 1)
+        logger.setLevel(logging.CRITICAL + 1)
+        return show_logging
+    
+    with _pipelines_lock:
+        pipeline = _pipelines.get(logger_name)
+        if pipeline is None:
+            pipeline = _pipelines[logger_name] = _LogPipeline(logger)
+    
+    if config.get_logging_output_format() == 'json':
+        pipeline.output.setFormatter(JsonFormatter())
     else:
-        # Create a custom handler with gray color for subtle appearance
-        class GrayHandler(logging.StreamHandler):
-            def emit(self, record):
-                if config.get_logging_enabled():
-                    # Add subtle gray color to log messages
-                    gray_color = "\033[90m"  # Dark gray
-                    reset_color = "\033[0m"
-                    
-                    # Format the message
-                    msg = self.format(record)
-                    colored_msg = f"{gray_color}{msg}{reset_color}"
-                    
-                    # Write directly to stderr with newline after logs
-                    sys.stderr.write(colored_msg + "\n")
-                    sys.stderr.flush()
-        
-        # Set the Strands logger level
-        logging.getLogger(logger_name).setLevel(log_level)
-        
-        # Remove existing handlers to avoid duplicates
-        logger = logging.getLogger(logger_name)
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-        
-        # Add our custom handler
-        handler = GrayHandler(sys.stderr)
-        handler.setFormatter(logging.Formatter(log_format))
-        logger.addHandler(handler)
-        logger.propagate = False  # Prevent duplicate messages
+        pipeline.output.setFormatter(GrayFormatter(log_format))
+    logger.setLevel(log_level)
     
     return show_logging
 
@@ -97,8 +137,10 @@ def with_logging(
     """
     Decorator to configure logging for agent creation functions.
     
-    This decorator automatically sets up Strands logging when an agent
-    creator function is called, following configuration and verbose settings.
+    This decorator sets up Strands logging the first time an agent creator
+    function is called, following configuration and verbose settings. If
+    logging was already configured (e.g. by a CLI with --verbose), it is
+    left as it is.
     
     Args:
         level: Override logging level (uses config if None)
@@ -115,7 +157,8 @@ def with_logging(
         def wrapper(*args, **kwargs):
             # Configure logging with default verbose=False
             # The actual verbose state will be handled by CLI components
-            configure_logging(verbose=False, level=level, format_string=format_string, logger_name=logger_name)
+            if logger_name not in _pipelines:
+                configure_logging(verbose=False, level=level, format_string=format_string, logger_name=logger_name)
             
             # Call the original function
             return func(*args, **kwargs)
@@ -161,7 +204,8 @@ class LoggingConfig:
     
     def apply(self):
         """Apply the logging configuration."""
-        configure_logging(self.level, self.format_string, self.logger_name)
+        configure_logging(verbose=True, level=self.level, format_string=self.format_string,
+                          logger_name=self.logger_name)
         
         # Apply module-specific levels
         for module, level in self.module_levels.items():
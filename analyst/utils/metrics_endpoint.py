@@ -0,0 +1,427 @@
+"""
+Prometheus metrics endpoint for long-running chat and agent service processes.
+
+print_metrics() reports on one result; a resident process needs metrics that a
+monitoring system can scrape. When the endpoint is enabled (the analystai
+--metrics-port option, or metrics.endpoint.enabled), metrics_hooks() records
+every agent invocation into counters and histograms, and a background HTTP
+server exposes them at /metrics in the Prometheus text format.
+
+Each figure is taken from the call it belongs to, not from differences of
+the agent's cumulative event loop metrics, so invocations running at the same
+time are not counted twice. metrics_model() wraps an agent's model when the
+agent is built and records the latency, time to first token, token usage and
+prompt cache use of each model call from its stream metadata; the tool hooks
+record each tool call, its duration and errors.
+"""
+
+import bisect
+import contextvars
+import logging
+import threading
+import time
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..config import get_config
+
+if TYPE_CHECKING:
+    from strands.hooks import HookProvider, HookRegistry
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+TTFT_BUCKETS = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base of the metric types: a named family of labelled series."""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        return lines + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        if amount <= 0:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+                for key, value in values]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is computed when scraped."""
+
+    metric_type = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 function: Optional[Callable[[], float]] = None):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._function = function
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(self._function())}"]
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+                for key, value in values]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Label values -> [bucket counts..., +Inf count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            series_items = sorted((key, list(series)) for key, series in self._series.items())
+        lines = []
+        for key, series in series_items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += count
+                le = f'le="{"+Inf" if bound == float("inf") else bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(round(series[-1], 6))}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """The metrics of the process, rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._sessions: 'weakref.WeakSet' = weakref.WeakSet()
+
+        self.invocations = self._add(Counter(
+            'analyst_invocations_total', 'Agent invocations', ('agent', 'status')))
+        self.invocations_in_progress = self._add(Gauge(
+            'analyst_invocations_in_progress', 'Agent invocations currently running', ('agent',)))
+        self.invocation_duration = self._add(Histogram(
+            'analyst_invocation_duration_seconds', 'Wall time of agent invocations', ('agent',)))
+        self.model_latency = self._add(Histogram(
+            'analyst_model_latency_seconds', 'Duration of model calls', ('agent', 'model')))
+        self.time_to_first_token = self._add(Histogram(
+            'analyst_model_time_to_first_token_seconds', 'Time from a model call to its first content',
+            ('agent', 'model'), TTFT_BUCKETS))
+        self.tokens = self._add(Counter(
+            'analyst_tokens_total', 'Model tokens by type (input, output, cache_read, cache_write)',
+            ('agent', 'model', 'type')))
+        self.prompt_cache = self._add(Counter(
+            'analyst_prompt_cache_requests_total',
+            'Model calls by prompt cache result (hit: tokens read from cache, miss: none)',
+            ('agent', 'model', 'result')))
+        self.tool_calls = self._add(Counter(
+            'analyst_tool_calls_total', 'Tool calls', ('agent', 'tool')))
+        self.tool_errors = self._add(Counter(
+            'analyst_tool_errors_total', 'Tool calls that returned an error', ('agent', 'tool')))
+        self.tool_duration = self._add(Histogram(
+            'analyst_tool_duration_seconds', 'Duration of tool calls', ('agent', 'tool')))
+        self.active_sessions = self._add(Gauge(
+            'analyst_active_sessions', 'Chat sessions (agents) alive in this process',
+            function=lambda: len(self._sessions)))
+
+    def _add(self, metric: _Metric) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+    def track_session(self, agent: Any) -> None:
+        """Count an agent as an active session while it is alive."""
+        self._sessions.add(agent)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the metrics registry of this process."""
+    return _registry
+
+
+def _model_id(model: Any) -> str:
+    config = getattr(model, 'config', None)
+    return config.get('model_id', 'unknown') if isinstance(config, dict) else 'unknown'
+
+
+class _TimedModel:
+    """Model wrapper that records the latency, time to first token, tokens and prompt cache use of each call."""
+
+    _TOKEN_TYPES = (('inputTokens', 'input'), ('outputTokens', 'output'),
+                    ('cacheReadInputTokens', 'cache_read'), ('cacheWriteInputTokens', 'cache_write'))
+
+    def __init__(self, model: Any, registry: MetricsRegistry, agent_name: str):
+        self.model = model
+        self.registry = registry
+        self.agent_name = agent_name
+
+    def __getattr__(self, name: str) -> Any:
+        # config, get_config, update_config and structured_output
+        return getattr(self.model, name)
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs: Any):
+        """Stream a response, recording the figures of this call."""
+        registry = self.registry
+        started = time.perf_counter()
+        first_token = None
+        metadata = None
+        async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+            if first_token is None and 'contentBlockDelta' in event:
+                first_token = time.perf_counter() - started
+            if 'metadata' in event:
+                metadata = event['metadata']
+            yield event
+
+        # Read after the call: a hedged model reports the model that served it
+        labels = {'agent': self.agent_name, 'model': _model_id(self.model)}
+        if first_token is not None:
+            registry.time_to_first_token.observe(first_token, **labels)
+        latency_ms = (metadata or {}).get('metrics', {}).get('latencyMs')
+        registry.model_latency.observe(latency_ms / 1000 if latency_ms else time.perf_counter() - started, **labels)
+        if metadata is not None:
+            usage = metadata.get('usage', {})
+            for key, token_type in self._TOKEN_TYPES:
+                registry.tokens.inc(usage.get(key, 0), type=token_type, **labels)
+            registry.prompt_cache.inc(result='hit' if usage.get('cacheReadInputTokens') else 'miss', **labels)
+
+
+# Start of the invocation running in this context, linked to the invocation it runs in
+_invocation_started: 'contextvars.ContextVar[Optional[tuple]]' = contextvars.ContextVar(
+    'analyst_metrics_invocation_started', default=None)
+
+
+class MetricsRecorder:
+    """
+    Hook provider that records each invocation and tool call of an agent in the metrics registry.
+
+    Implements the strands HookProvider protocol without subclassing it, so
+    this module can be imported without strands. Every figure is taken from
+    the call it belongs to: model calls are measured by the model wrapper from
+    metrics_model() and tool calls by the tool hooks, so invocations that run
+    at the same time are counted once each.
+    """
+
+    def __init__(self, agent_name: str, registry: MetricsRegistry):
+        self.agent_name = agent_name
+        self.registry = registry
+        self._tools: Dict[str, float] = {}
+
+    def register_hooks(self, registry: 'HookRegistry', **kwargs: Any) -> None:
+        """Register the invocation and tool hooks."""
+        from strands.hooks import BeforeInvocationEvent, AfterInvocationEvent
+        from strands.experimental.hooks import BeforeToolInvocationEvent, AfterToolInvocationEvent
+        registry.add_callback(BeforeInvocationEvent, self.before_invocation)
+        registry.add_callback(AfterInvocationEvent, self.after_invocation)
+        registry.add_callback(BeforeToolInvocationEvent, self.before_tool)
+        registry.add_callback(AfterToolInvocationEvent, self.after_tool)
+
+    def before_invocation(self, event) -> None:
+        """Start timing the invocation."""
+        _invocation_started.set((time.perf_counter(), _invocation_started.get()))
+        self.registry.invocations_in_progress.inc(agent=self.agent_name)
+
+    def after_invocation(self, event) -> None:
+        """Record the invocation that just finished."""
+        entry = _invocation_started.get()
+        if entry is None:
+            return
+        started, outer = entry
+        _invocation_started.set(outer)
+        registry = self.registry
+        registry.invocations_in_progress.dec(agent=self.agent_name)
+        messages = event.agent.messages
+        status = 'success' if messages and messages[-1].get('role') == 'assistant' else 'error'
+        registry.invocations.inc(agent=self.agent_name, status=status)
+        registry.invocation_duration.observe(time.perf_counter() - started, agent=self.agent_name)
+
+    def before_tool(self, event) -> None:
+        """Start timing a tool call."""
+        self._tools[event.tool_use.get('toolUseId', '')] = time.perf_counter()
+
+    def after_tool(self, event) -> None:
+        """Record a tool call, its duration and whether it failed."""
+        started = self._tools.pop(event.tool_use.get('toolUseId', ''), None)
+        name = event.tool_use.get('name', 'unknown')
+        registry = self.registry
+        registry.tool_calls.inc(agent=self.agent_name, tool=name)
+        if event.exception is not None or (isinstance(event.result, dict) and event.result.get('status') == 'error'):
+            registry.tool_errors.inc(agent=self.agent_name, tool=name)
+        if started is not None:
+            registry.tool_duration.observe(time.perf_counter() - started, agent=self.agent_name, tool=name)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves the registry at /metrics."""
+
+    registry: MetricsRegistry = _registry
+
+    def do_GET(self) -> None:
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"metrics endpoint: {format % args}")
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: Optional[int] = None, host: Optional[str] = None) -> ThreadingHTTPServer:
+    """
+    Start the metrics endpoint on a background thread (once per process).
+
+    Args:
+        port: Port to listen on (defaults to metrics.endpoint.port; 0 picks a free port)
+        host: Address to bind (defaults to metrics.endpoint.host)
+
+    Returns:
+        The running server; server.server_address has the bound address
+
+    Raises:
+        OSError: If the address cannot be bound
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            config = get_config()
+            host = host if host is not None else config.get_metrics_endpoint_host()
+            port = port if port is not None else config.get_metrics_endpoint_port()
+            server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="analyst-metrics-endpoint", daemon=True).start()
+            logger.info(f"Serving metrics at http://{server.server_address[0]}:{server.server_address[1]}/metrics")
+            _server = server
+    return _server
+
+
+def metrics_enabled() -> bool:
+    """Whether invocations are recorded: the endpoint is running or enabled in config."""
+    return _server is not None or get_config().get_metrics_endpoint_enabled()
+
+
+def metrics_model(model: Any, agent_name: str) -> Any:
+    """
+    Wrap an agent's model so each model call is recorded (if metrics are on).
+
+    Agents wrap their model once when they are built; metrics_hooks() records
+    the invocations and tool calls.
+    """
+    if not metrics_enabled() or isinstance(model, _TimedModel):
+        return model
+    return _TimedModel(model, _registry, agent_name)
+
+
+def metrics_hooks(agent_name: str) -> List['HookProvider']:
+    """
+    Get the hooks that record an agent's invocations for the metrics endpoint.
+
+    Starts the endpoint when metrics.endpoint.enabled is set. Returns an empty
+    list when the endpoint is off.
+    """
+    if not metrics_enabled():
+        return []
+    try:
+        start_metrics_server()
+    except OSError as e:
+        logger.warning(f"Could not start the metrics endpoint: {e}")
+    return [MetricsRecorder(agent_name, _registry)]
+
+
+def track_session(agent: Any) -> None:
+    """Count a chat agent in analyst_active_sessions while it is alive (if metrics are on)."""
+    if metrics_enabled():
+        _registry.track_session(agent)
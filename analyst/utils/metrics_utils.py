@@ -5,12 +5,17 @@ This module provides reusable metrics display and analysis utilities for agents.
 Based on Strands documentation best practices for metrics handling.
 """
 
+from __future__ import annotations
+
 import functools
-from typing import Dict, Any, Optional, Callable
-from strands import Agent
-from strands.agent.agent_result import AgentResult
+from typing import TYPE_CHECKING, Dict, Any, Optional, Callable
 from ..config import get_config
 
+if TYPE_CHECKING:
+    # Only for annotations, so printing metrics does not import strands
+    from strands import Agent
+    from strands.agent.agent_result import AgentResult
+
 
 def print_metrics(result: AgentResult, agent: Agent, verbose: bool = False) -> bool:
     """
@@ -76,6 +81,12 @@ def print_metrics(result: AgentResult, agent: Agent, verbose: bool = False) -> b
                 print(f"{colors['title']}Tokens:{colors['reset']} {colors['value']}{int(total_tokens):,}{colors['reset']}")
             else:
                 print(f"{colors['title']}Tokens:{colors['reset']} {colors['value']}{int(total_tokens):,}{colors['reset']} {colors['detail']}({int(input_tokens):,} in, {int(output_tokens):,} out){colors['reset']}")
+            
+            # Prompt cache usage (only reported when the provider used cache points)
+            cache_read = usage.get("cacheReadInputTokens", 0)
+            cache_write = usage.get("cacheWriteInputTokens", 0)
+            if cache_read or cache_write:
+                print(f"{colors['title']}Cache:{colors['reset']} {colors['value']}{int(cache_read):,}{colors['reset']} {colors['detail']}read, {int(cache_write):,} written{colors['reset']}")
         
         # Performance metrics
         if config.get_metrics_include_duration():
@@ -132,7 +143,9 @@ def format_metrics_dict(result: AgentResult, agent: Agent) -> Dict[str, Any]:
             "tokens": {
                 "total": int(summary.get("accumulated_usage", {}).get("totalTokens", 0)),
                 "input": int(summary.get("accumulated_usage", {}).get("inputTokens", 0)),
-                "output": int(summary.get("accumulated_usage", {}).get("outputTokens", 0))
+                "output": int(summary.get("accumulated_usage", {}).get("outputTokens", 0)),
+                "cache_read": int(summary.get("accumulated_usage", {}).get("cacheReadInputTokens", 0)),
+                "cache_write": int(summary.get("accumulated_usage", {}).get("cacheWriteInputTokens", 0))
             },
             "performance": {
                 "duration_seconds": float(summary.get("average_cycle_time", 0)),
@@ -186,6 +199,7 @@ def with_metrics_display(
                         agent = create_news_agent()
             
             # Display metrics if we have both result and agent
+            from strands.agent.agent_result import AgentResult
             if result and agent and isinstance(result, AgentResult):
                 if display_function:
                     display_function(result, agent, verbose)
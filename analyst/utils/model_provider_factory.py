@@ -7,8 +7,103 @@ This module provides a factory pattern for creating model instances from differe
 
 import os
 import logging
-from typing import Optional, Dict, Any, Union
-from ..config import get_config
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Union, Callable, Hashable, Tuple
+from ..config import get_config, get_bedrock_cache_options
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a value to a stable hashable form (lists to tuples, dicts to sorted item tuples)."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = tuple(_freeze(item) for item in value)
+        return tuple(sorted(items, key=repr)) if isinstance(value, (set, frozenset)) else items
+    return value
+
+
+class ModelCache:
+    """
+    Bounded, thread-safe LRU cache of model instances.
+    
+    A model is built once per key: concurrent callers asking for a key that is
+    being built wait for that build instead of creating their own client. Builds
+    run outside the cache lock, so building one model does not block lookups of
+    others. When the cache is full, the least recently used model is evicted.
+    """
+    
+    def __init__(self, max_size: int = 16):
+        self.max_size = max(1, max_size)
+        self._models: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._building: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get_or_create(self, key: Hashable, create: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Get the model for key, building it with create() if it is not cached.
+        
+        Returns:
+            Tuple of (model, cached) where cached is False if this call built the model
+        """
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key], True
+            
+            pending = self._building.get(key)
+            if pending is None:
+                self.misses += 1
+                future = self._building[key] = Future()
+            else:
+                # Another caller is building this model - wait for it below
+                self.hits += 1
+        
+        if pending is not None:
+            return pending.result(), True
+        
+        try:
+            model = create()
+        except BaseException as e:
+            with self._lock:
+                del self._building[key]
+            future.set_exception(e)
+            raise
+        
+        with self._lock:
+            del self._building[key]
+            self._models[key] = model
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+                self.evictions += 1
+        future.set_result(model)
+        return model, False
+    
+    def clear(self) -> None:
+        """Remove all cached models (builds in progress still complete)."""
+        with self._lock:
+            self._models.clear()
+    
+    def __len__(self) -> int:
+        return len(self._models)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss/eviction counts."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._models),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
 
 
 class ModelProviderFactory:
@@ -17,7 +112,7 @@ class ModelProviderFactory:
     def __init__(self):
         """Initialize the factory with configuration."""
         self.config = get_config()
-        self._provider_cache = {}
+        self._provider_cache = ModelCache(self.config.get('providers.model_cache_size', 16))
         self._last_env_provider = None
         self._last_config_provider = None
         self.logger = logging.getLogger(__name__)
@@ -63,17 +158,32 @@ class ModelProviderFactory:
     
     def _invalidate_cache(self):
         """Invalidate the provider cache when configuration changes."""
-        if self._provider_cache:
+        if len(self._provider_cache):
             self.logger.debug("Invalidating model provider cache due to configuration change")
             self._provider_cache.clear()
     
+    def _refresh_active_provider(self) -> str:
+        """
+        Get the active provider, re-evaluating it only if STRANDS_PROVIDER changed.
+        
+        The config file setting only changes through reload_config(), which
+        re-evaluates the provider itself.
+        """
+        if os.environ.get('STRANDS_PROVIDER', '').lower() != self._last_env_provider:
+            self._determine_active_provider()
+        return self.active_provider
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get model cache size and hit/miss/eviction statistics."""
+        return self._provider_cache.stats()
+    
     def reload_config(self):
         """Reload configuration and invalidate cache if needed."""
-        from ..config import Config
-        # Force config reload
-        Config._instance = None
-        Config._config = None
         self.config = get_config()
+        self.config.reload()
+        self._provider_cache.max_size = max(1, self.config.get('providers.model_cache_size', 16))
+        from .bedrock_client import reset_bedrock_clients
+        reset_bedrock_clients()
         self._determine_active_provider()
     
     def get_provider_info(self) -> Dict[str, str]:
@@ -82,8 +192,7 @@ class ModelProviderFactory:
         Returns dict with provider name and active model.
         """
         # Refresh provider detection to handle dynamic changes
-        self._determine_active_provider()
-        provider = self.active_provider
+        provider = self._refresh_active_provider()
         show_full_ids = self.config.get('providers.show_full_model_ids', True)
         
         if provider == 'bedrock':
@@ -156,31 +265,101 @@ class ModelProviderFactory:
             Model instance (BedrockModel or AnthropicModel)
         """
         # Refresh provider detection to handle dynamic changes
-        self._determine_active_provider()
-        provider = self.active_provider
+        provider = self._refresh_active_provider()
+        
+        # Stable cache key - kwargs may hold lists such as stop_sequences
+        cache_key = (provider, agent_name, model_type, _freeze(kwargs))
         
-        # Check cache key
-        cache_key = f"{provider}:{agent_name}:{model_type}:{hash(frozenset(kwargs.items()))}"
+        def build():
+            from .rate_limiter import rate_limited
+            model = self._create_provider_model(provider, agent_name, model_type, **kwargs)
+            model = self.apply_execution_policy(model, agent_name, model_type, **kwargs)
+            # Every model call shares the client-side rate limiter
+            return rate_limited(model)
         
-        if cache_key in self._provider_cache:
-            self.logger.debug(f"Using cached model for {cache_key}")
-            return self._provider_cache[cache_key]
+        model, cached = self._provider_cache.get_or_create(cache_key, build)
+        if cached:
+            self.logger.debug(f"Using cached {provider} model for {agent_name}")
+        else:
+            self.logger.debug(f"Created and cached new {provider} model for {agent_name}")
         
-        # Create new model
+        return model
+    
+    def _create_provider_model(
+        self,
+        provider: str,
+        agent_name: str,
+        model_type: Optional[str] = None,
+        **kwargs
+    ):
+        """Create a model instance for a specific provider."""
         if provider == 'bedrock':
-            model = self._create_bedrock_model(agent_name, model_type, **kwargs)
+            return self._create_bedrock_model(agent_name, model_type, **kwargs)
         elif provider == 'anthropic':
-            model = self._create_anthropic_model(agent_name, model_type, **kwargs)
+            return self._create_anthropic_model(agent_name, model_type, **kwargs)
         elif provider == 'openai':
-            model = self._create_openai_model(agent_name, model_type, **kwargs)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+            return self._create_openai_model(agent_name, model_type, **kwargs)
+        raise ValueError(f"Unknown provider: {provider}")
+    
+    def apply_execution_policy(
+        self,
+        model,
+        agent_name: str = 'default',
+        model_type: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Apply providers.execution.policy to a model.
         
-        # Cache the model
-        self._provider_cache[cache_key] = model
-        self.logger.debug(f"Created and cached new {provider} model for {agent_name}")
+        With the "hedged" policy the model becomes the primary of a HedgedModel
+        backed by the configured secondaries; otherwise it is returned unchanged.
         
-        return model
+        Args:
+            model: Model built for the agent
+            agent_name: Name of the agent the secondaries are configured for
+            model_type: Optional model type ('fast', 'reasoning', 'chat')
+            **kwargs: Model parameters the secondaries should share with the model
+        """
+        if self.config.get('providers.execution.policy', 'single') != 'hedged':
+            return model
+        return self._create_hedged_model(model, agent_name, model_type, **kwargs)
+    
+    def _create_hedged_model(
+        self,
+        primary,
+        agent_name: str,
+        model_type: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Wrap a model with the secondaries from providers.execution.secondaries.
+        
+        Each secondary names a provider and optional model parameters, such as
+        region_name for a Bedrock secondary in another region. Secondaries that
+        cannot be created (for example a missing API key) are skipped.
+        """
+        from .hedged_model import HedgedModel
+        
+        secondaries = []
+        for spec in self.config.get('providers.execution.secondaries', []) or []:
+            spec = dict(spec)
+            provider = spec.pop('provider', self.active_provider)
+            try:
+                secondaries.append(self._create_provider_model(provider, agent_name, model_type, **{**kwargs, **spec}))
+            except Exception as e:
+                self.logger.warning(f"Skipping secondary {provider} model for {agent_name}: {e}")
+        
+        if not secondaries:
+            return primary
+        
+        return HedgedModel(
+            primary,
+            secondaries,
+            hedge_after_ms=self.config.get('providers.execution.hedge_after_ms', 4000),
+            adaptive=self.config.get('providers.execution.adaptive_hedge', True),
+            min_hedge_ms=self.config.get('providers.execution.min_hedge_ms', 500),
+            failover_on_throttling=self.config.get('providers.execution.failover_on_throttling', True)
+        )
     
     def _create_bedrock_model(
         self, 
@@ -190,14 +369,16 @@ class ModelProviderFactory:
     ):
         """Create a BedrockModel instance."""
         from strands.models.bedrock import BedrockModel
+        from .bedrock_client import get_bedrock_client_options
         
         # Get configuration for the agent
         config_path = f'bedrock'
         
-        # Determine model ID
-        if model_type:
+        # Determine model ID (an explicit Bedrock model ID comes first)
+        model_id = kwargs.get('model_id')
+        if not model_id and model_type:
             model_id = self.config.get(f'{config_path}.model.models.{model_type}')
-        else:
+        elif not model_id:
             # Check agent-specific model first
             model_id = self.config.get(f'{config_path}.agents.{agent_name}.model_id')
             if not model_id:
@@ -236,7 +417,8 @@ class ModelProviderFactory:
             max_tokens=max_tokens,
             stop_sequences=stop_sequences,
             streaming=streaming,
-            region_name=region_name
+            **get_bedrock_client_options(region_name),
+            **get_bedrock_cache_options(model_id)
         )
         
         # Add optional Bedrock-specific features
@@ -244,12 +426,6 @@ class ModelProviderFactory:
         if guardrail_id:
             model.guardrail_id = guardrail_id
         
-        # Add caching options if available
-        if hasattr(model, 'cache_prompt'):
-            model.cache_prompt = self.config.get(f'{config_path}.advanced.caching.cache_prompt', True)
-        if hasattr(model, 'cache_tools'):
-            model.cache_tools = self.config.get(f'{config_path}.advanced.caching.cache_tools', True)
-        
         # Add reasoning mode if specified
         reasoning_mode = self.config.get(f'{config_path}.agents.{agent_name}.reasoning_mode', False)
         if reasoning_mode and hasattr(model, 'reasoning_mode'):
@@ -565,6 +741,15 @@ def get_model_factory() -> ModelProviderFactory:
         _factory = ModelProviderFactory()
     return _factory
 
+def apply_execution_policy(model, agent_name: str = 'default', model_type: Optional[str] = None, **kwargs):
+    """
+    Apply providers.execution.policy to a model created outside the factory.
+    
+    Agents that build their BedrockModel directly pass it through here, so the
+    hedged policy covers every agent rather than only factory-created models.
+    """
+    return get_model_factory().apply_execution_policy(model, agent_name, model_type, **kwargs)
+
 def invalidate_factory_cache():
     """Invalidate the global factory cache (useful for config changes)."""
     global _factory
@@ -0,0 +1,353 @@
+"""
+Profiling mode for the console scripts.
+
+`--profile [DIR]` runs a command under a profiler and writes a report when the
+command exits:
+- profile.txt: call tree with the time spent in each function
+- profile.collapsed: collapsed stacks ("frame;frame;frame count"), which
+  speedscope (https://www.speedscope.app) and flamegraph.pl open directly
+- memory.txt: top allocations from tracemalloc, with --profile-memory
+
+The default "sampling" mode samples the stacks of all threads, which includes
+the threads strands runs agents and tools on, at a fixed interval with little
+overhead. The "deterministic" mode runs cProfile in every thread, merges the
+statistics and also writes profile.pstats for pstats and snakeviz.
+"""
+
+import atexit
+import collections
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Counter, Dict, List, Optional, Tuple
+
+from ..config import get_config
+
+Stack = Tuple[str, ...]
+
+
+def _frame_label(code) -> str:
+    """Label of a frame: function (file:first line)."""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all threads from a background thread.
+
+    Times are derived from the measured wall time per sampling round, so they
+    stay accurate when sampling runs slower than the interval.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.samples: Counter[Stack] = collections.Counter()
+        self.rounds = 0
+        self.elapsed = 0.0
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread = threading.Thread(target=self._run, name="analyst-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @property
+    def seconds_per_sample(self) -> float:
+        """Wall time each sample stands for."""
+        return self.elapsed / self.rounds if self.rounds else self.interval
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        labels = self._labels
+        started = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = _frame_label(code)
+                    stack.append(label)
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.samples[tuple(reversed(stack))] += 1
+            self.rounds += 1
+        self.elapsed = time.perf_counter() - started
+
+    def collapsed(self) -> List[str]:
+        """Samples as collapsed stack lines."""
+        return [f"{';'.join(stack)} {count}" for stack, count in self.samples.most_common()]
+
+    def call_tree(self, min_percent: float = 0.5) -> List[str]:
+        """
+        Samples as an indented call tree.
+
+        Args:
+            min_percent: Hide calls with less than this share of their thread's samples
+        """
+        tree: Dict[str, dict] = {}
+        for stack, count in self.samples.items():
+            level = tree
+            for label in stack:
+                node = level.setdefault(label, {'count': 0, 'children': {}})
+                node['count'] += count
+                level = node['children']
+
+        seconds_per_sample = self.seconds_per_sample
+        lines = [f"Sampling profile: {self.rounds} rounds of samples, one every {seconds_per_sample * 1000:.1f}ms",
+                 "Columns: seconds, share of the thread's samples, function", ""]
+
+        def show(node: dict, label: str, depth: int, thread_total: int) -> None:
+            percent = node['count'] / thread_total * 100
+            if percent < min_percent:
+                return
+            lines.append(f"{node['count'] * seconds_per_sample:>9.3f}s {percent:>6.1f}%  {'  ' * depth}{label}")
+            for child_label, child in sorted(node['children'].items(), key=lambda item: -item[1]['count']):
+                show(child, child_label, depth + 1, thread_total)
+
+        for thread_name, node in sorted(tree.items(), key=lambda item: -item[1]['count']):
+            show(node, f"[{thread_name}]", 0, node['count'])
+            lines.append("")
+        return lines
+
+
+class DeterministicProfiler:
+    """
+    Runs cProfile in every thread and merges the statistics.
+
+    cProfile only sees the thread that enabled it, so each thread started after
+    start() enables a profiler of its own. From Python 3.12 cProfile is built on
+    sys.monitoring, which already covers all threads, and one profiler is used.
+    """
+
+    def __init__(self):
+        """Initialize the profiler."""
+        self._profiles: list = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Profile this thread and every thread started from now on."""
+        self._enable()
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._thread_started)
+
+    def stop(self) -> None:
+        """Stop profiling all threads."""
+        threading.setprofile(None)
+        with self._lock:
+            for profile in self._profiles:
+                profile.disable()
+
+    def _enable(self) -> None:
+        import cProfile
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def _thread_started(self, frame, event, arg) -> None:
+        # First profile event of a new thread: replace this hook with a cProfile of its own
+        self._enable()
+
+    def stats(self, stream=None):
+        """Statistics of all threads merged into one pstats.Stats."""
+        import pstats
+
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = pstats.Stats(profiles[0], stream=stream)
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    @property
+    def threads(self) -> int:
+        """Number of threads profiled."""
+        return len(self._profiles)
+
+
+class ProfileSession:
+    """Profiles the rest of the process and writes the report at exit."""
+
+    def __init__(self, output_dir: Path, mode: str = 'sampling', interval: float = 0.005,
+                 memory: bool = False, memory_top: int = 25):
+        """
+        Initialize the session.
+
+        Args:
+            output_dir: Directory the report is written to
+            mode: "sampling" or "deterministic"
+            interval: Seconds between samples in sampling mode
+            memory: Also trace allocations with tracemalloc
+            memory_top: Number of allocation sites in memory.txt
+        """
+        self.output_dir = Path(output_dir)
+        self.mode = mode if mode in ('sampling', 'deterministic') else 'sampling'
+        self.memory = memory
+        self.memory_top = memory_top
+        self.started = time.perf_counter()
+        self._sampler = SamplingProfiler(interval) if self.mode == 'sampling' else None
+        self._cprofile = DeterministicProfiler() if self.mode == 'deterministic' else None
+        self._finished = False
+
+    def start(self) -> None:
+        """Start profiling."""
+        if self.memory:
+            import tracemalloc
+            tracemalloc.start()
+        if self._sampler is not None:
+            self._sampler.start()
+        else:
+            self._cprofile.start()
+
+    def finish(self) -> None:
+        """Stop profiling and write the report (once)."""
+        if self._finished:
+            return
+        self._finished = True
+        elapsed = time.perf_counter() - self.started
+        if self._sampler is not None:
+            self._sampler.stop()
+        if self._cprofile is not None:
+            self._cprofile.stop()
+
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            if self._sampler is not None:
+                self._write_lines('profile.txt', [f"Wall time: {elapsed:.2f}s"] + self._sampler.call_tree())
+                self._write_lines('profile.collapsed', self._sampler.collapsed())
+            else:
+                self._write_deterministic(elapsed)
+            if self.memory:
+                self._write_memory()
+        except OSError as e:
+            print(f"Could not write profile to {self.output_dir}: {e}", file=sys.stderr)
+            return
+        print(f"Profile written to {self.output_dir}", file=sys.stderr)
+
+    def _write_lines(self, filename: str, lines: List[str]) -> None:
+        (self.output_dir / filename).write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    def _write_deterministic(self, elapsed: float) -> None:
+        """Write the cProfile statistics, call tree and collapsed caller edges."""
+        import io
+
+        text = io.StringIO()
+        stats = self._cprofile.stats(text)
+        stats.dump_stats(str(self.output_dir / 'profile.pstats'))
+        stats.sort_stats('cumulative').print_stats(60)
+        stats.print_callees(30)
+        self._write_lines('profile.txt', [f"Wall time: {elapsed:.2f}s, {self._cprofile.threads} threads profiled",
+                                          text.getvalue()])
+
+        # cProfile keeps caller -> callee edges, not whole stacks: each line is one
+        # edge weighted by the callee's time in microseconds
+        lines = []
+        for (filename, line, name), (_, _, _, _, callers) in stats.stats.items():
+            callee = f"{name} ({os.path.basename(filename)}:{line})"
+            for (caller_file, caller_line, caller_name), edge in callers.items():
+                caller = f"{caller_name} ({os.path.basename(caller_file)}:{caller_line})"
+                micros = int(edge[3] * 1e6)
+                if micros:
+                    lines.append(f"{caller};{callee} {micros}")
+        self._write_lines('profile.collapsed', lines)
+
+    def _write_memory(self) -> None:
+        """Write the top allocation sites from tracemalloc."""
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ])
+
+        lines = [f"Traced memory: {current / 1024 / 1024:.1f} MiB at exit, {peak / 1024 / 1024:.1f} MiB peak",
+                 "", f"Top {self.memory_top} allocation sites:"]
+        for index, stat in enumerate(snapshot.statistics('lineno')[:self.memory_top], 1):
+            frame = stat.traceback[0]
+            lines.append(f"{index:>3}. {stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  "
+                         f"{frame.filename}:{frame.lineno}")
+        self._write_lines('memory.txt', lines)
+
+
+_session: Optional[ProfileSession] = None
+
+
+def start_profiling(command: str, output_dir: Optional[str] = None, mode: Optional[str] = None,
+                    memory: bool = False) -> ProfileSession:
+    """
+    Profile the rest of this process; the report is written when it exits.
+
+    Args:
+        command: Command name, used in the report directory name
+        output_dir: Report directory (defaults to metrics.profiling.output_dir/<command>-<time>)
+        mode: "sampling" or "deterministic" (defaults to metrics.profiling.mode)
+        memory: Also write the top allocations from tracemalloc
+    """
+    global _session
+    if _session is None:
+        config = get_config()
+        if not output_dir:
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            output_dir = Path(config.get_profiling_output_dir()) / f"{command}-{stamp}"
+        _session = ProfileSession(output_dir, mode or config.get_profiling_mode(),
+                                  config.get_profiling_sample_interval(), memory,
+                                  config.get_profiling_memory_top())
+        _session.start()
+        atexit.register(_session.finish)
+    return _session
+
+
+def add_profile_arguments(parser) -> None:
+    """Add the --profile [DIR], --profile-mode and --profile-memory options to a CLI argument parser."""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="DIR",
+        help="Profile the command and write a call tree and speedscope-compatible collapsed stacks "
+             "to DIR (default: metrics.profiling.output_dir)"
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=["sampling", "deterministic"],
+        default=None,
+        help="Profiler for --profile: sampling (all threads, low overhead) or deterministic (cProfile, all threads)"
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="With --profile, also report the top memory allocations (tracemalloc)"
+    )
+
+
+def profile_from_args(args, command: str) -> None:
+    """Start profiling if the --profile option was given."""
+    if getattr(args, 'profile', None) is not None:
+        start_profiling(command, args.profile or None, args.profile_mode, args.profile_memory)
@@ -1,11 +1,12 @@
 """
 Utilities for loading and rotating try prompts for the chat interface.
 """
-import yaml
 import random
 from pathlib import Path
 from typing import List, Dict, Any
 
+from ..startup_cache import load_yaml
+
 
 def load_try_prompts(prompts_file: str = "try-prompts.yml") -> Dict[str, Any]:
     """
@@ -30,8 +31,7 @@ def load_try_prompts(prompts_file: str = "try-prompts.yml") -> Dict[str, Any]:
             # Return default prompts if file not found
             return get_default_prompts()
             
-        with open(prompts_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_yaml(prompts_path)
             
     except Exception as e:
         # Return default prompts on error
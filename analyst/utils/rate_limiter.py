@@ -0,0 +1,397 @@
+"""
+Client-side adaptive rate limiting for Strands Analyst.
+
+All model calls go through one shared AdaptiveRateLimiter. It enforces the
+configured hourly token and cost limits over a rolling one-hour window, an
+optional requests-per-minute token bucket, and an adaptive concurrency limit:
+the number of calls in flight is halved when the provider throttles and grows
+back by about one per round of successful calls (AIMD). Calls that cannot
+start yet wait in line instead of failing. A throttle also starts a jittered,
+exponentially growing cool-down during which no call starts, so every waiter
+backs off together instead of retrying into the same limit.
+
+The limiter does not retry calls itself: a throttled call is raised to the
+Strands event loop, which owns model call retries, and its retry waits in line
+behind the cool-down like any other call.
+
+Models are wrapped with rate_limited(), which returns a RateLimitedModel that
+implements the Strands Model interface around the original model.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from strands.models import Model
+from strands.types.content import Messages
+from strands.types.exceptions import ModelThrottledException
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# USD per million input and output tokens, matched by model ID substring (longest match wins)
+DEFAULT_PRICING = {
+    'claude-3-haiku': (0.25, 1.25),
+    'claude-3-5-haiku': (0.80, 4.00),
+    'claude-3-5-sonnet': (3.00, 15.00),
+    'claude-3-7-sonnet': (3.00, 15.00),
+    'claude-sonnet-4': (3.00, 15.00),
+    'claude-3-opus': (15.00, 75.00),
+    'claude-opus-4': (15.00, 75.00),
+    'nova-micro': (0.035, 0.14),
+    'nova-lite': (0.06, 0.24),
+    'nova-pro': (0.80, 3.20),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00)
+}
+
+# Prompt cache reads and writes relative to the input token price
+_CACHE_READ_FACTOR = 0.1
+_CACHE_WRITE_FACTOR = 1.25
+
+_WINDOW_SECONDS = 3600
+_POLL_SECONDS = 0.05
+_WARN_FRACTION = 0.8
+
+
+def estimate_cost(model_id: str, usage: Dict[str, int], pricing: Optional[Dict[str, Tuple[float, float]]] = None) -> float:
+    """
+    Estimate the USD cost of a model call from its token usage.
+
+    Args:
+        model_id: Model ID of the call
+        usage: Strands usage dict (inputTokens, outputTokens, cacheReadInputTokens, cacheWriteInputTokens)
+        pricing: Prices per million tokens by model ID substring (defaults to DEFAULT_PRICING)
+
+    Returns:
+        Estimated cost in USD, 0.0 for models without a known price
+    """
+    pricing = pricing or DEFAULT_PRICING
+    matches = [key for key in pricing if key in (model_id or '')]
+    if not matches:
+        return 0.0
+    input_price, output_price = pricing[max(matches, key=len)]
+    input_tokens = (usage.get('inputTokens', 0)
+                    + usage.get('cacheReadInputTokens', 0) * _CACHE_READ_FACTOR
+                    + usage.get('cacheWriteInputTokens', 0) * _CACHE_WRITE_FACTOR)
+    return (input_tokens * input_price + usage.get('outputTokens', 0) * output_price) / 1_000_000
+
+
+class AdaptiveRateLimiter:
+    """
+    Shared limiter for model calls: hourly budgets, request rate and AIMD concurrency.
+
+    The limiter is thread-safe and does not depend on a particular event loop,
+    so agents running in different threads (each with its own loop) share it.
+    """
+
+    def __init__(self, hourly_token_limit: int = 0, hourly_cost_limit: float = 0.0,
+                 requests_per_minute: float = 0, initial_concurrency: int = 4, max_concurrency: int = 16,
+                 min_concurrency: int = 1, cost_warnings: bool = True,
+                 pricing: Optional[Dict[str, Tuple[float, float]]] = None,
+                 throttle_cooldown: float = 1.0, max_throttle_cooldown: float = 30.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            hourly_token_limit: Maximum tokens per rolling hour (0 = no limit)
+            hourly_cost_limit: Maximum estimated USD cost per rolling hour (0.0 = no limit)
+            requests_per_minute: Maximum request rate (0 = no limit)
+            initial_concurrency: Calls allowed in flight at start
+            max_concurrency: Upper bound for the adaptive concurrency limit
+            min_concurrency: Lower bound for the adaptive concurrency limit
+            cost_warnings: Log a warning when 80% of an hourly budget is used
+            pricing: Prices per million tokens by model ID substring
+            throttle_cooldown: Cool-down after the first throttle in a row, in seconds (0 = none)
+            max_throttle_cooldown: Upper bound of the cool-down, which doubles with each throttle in a row
+        """
+        self.hourly_token_limit = hourly_token_limit
+        self.hourly_cost_limit = hourly_cost_limit
+        self.requests_per_minute = requests_per_minute
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.cost_warnings = cost_warnings
+        self.pricing = pricing or DEFAULT_PRICING
+        self.throttle_cooldown = throttle_cooldown
+        self.max_throttle_cooldown = max(throttle_cooldown, max_throttle_cooldown)
+
+        self._concurrency = float(min(max(initial_concurrency, self.min_concurrency), self.max_concurrency))
+        self._in_flight = 0
+        self._usage: Deque[Tuple[float, int, float]] = deque()
+        self._window_tokens = 0
+        self._window_cost = 0.0
+        self._bucket = float(requests_per_minute) if requests_per_minute else 0.0
+        self._bucket_time = time.monotonic()
+        self._warned = False
+        self._throttle_streak = 0
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'throttled': 0, 'queued': 0, 'wait_seconds': 0.0}
+
+    def _expire(self, now: float) -> None:
+        """Drop usage records older than the rolling window."""
+        while self._usage and self._usage[0][0] <= now - _WINDOW_SECONDS:
+            _, tokens, cost = self._usage.popleft()
+            self._window_tokens -= tokens
+            self._window_cost -= cost
+
+    def _budget_wait(self, now: float) -> float:
+        """Seconds until the hourly budgets allow another call (0 if they allow it now)."""
+        wait = 0.0
+        if self.hourly_token_limit and self._window_tokens >= self.hourly_token_limit:
+            excess, freed = self._window_tokens - self.hourly_token_limit, 0
+            for timestamp, tokens, _ in self._usage:
+                freed += tokens
+                if freed > excess:
+                    wait = max(wait, timestamp + _WINDOW_SECONDS - now)
+                    break
+        if self.hourly_cost_limit and self._window_cost >= self.hourly_cost_limit:
+            excess, freed = self._window_cost - self.hourly_cost_limit, 0.0
+            for timestamp, _, cost in self._usage:
+                freed += cost
+                if freed > excess:
+                    wait = max(wait, timestamp + _WINDOW_SECONDS - now)
+                    break
+        return wait
+
+    def _try_acquire(self) -> float:
+        """Start a call if allowed; return 0.0 on success or the seconds to wait before retrying."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+
+            budget_wait = self._budget_wait(now)
+            if budget_wait > 0:
+                return budget_wait
+
+            if now < self._cooldown_until:
+                return self._cooldown_until - now
+
+            if self.requests_per_minute:
+                self._bucket = min(float(self.requests_per_minute),
+                                   self._bucket + (now - self._bucket_time) * self.requests_per_minute / 60)
+                self._bucket_time = now
+                if self._bucket < 1:
+                    return (1 - self._bucket) * 60 / self.requests_per_minute
+
+            if self._in_flight >= int(self._concurrency):
+                return _POLL_SECONDS
+
+            if self.requests_per_minute:
+                self._bucket -= 1
+            self._in_flight += 1
+            self._stats['calls'] += 1
+            return 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a call may start, then reserve a slot for it."""
+        start = time.monotonic()
+        wait = self._try_acquire()
+        if wait:
+            with self._lock:
+                self._stats['queued'] += 1
+            if wait > 1:
+                logger.info(f"Model call queued for {wait:.0f}s by the hourly token/cost budget or request rate")
+        while wait:
+            await asyncio.sleep(min(wait, 1.0))
+            wait = self._try_acquire()
+        with self._lock:
+            self._stats['wait_seconds'] += time.monotonic() - start
+
+    def release(self, model_id: str = '', usage: Optional[Dict[str, int]] = None, throttled: bool = False) -> None:
+        """
+        Finish a call: record its usage and adapt the concurrency limit.
+
+        Args:
+            model_id: Model ID, used to price the usage
+            usage: Token usage of the call (None if unknown)
+            throttled: Whether the provider throttled the call
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+            if throttled:
+                # Multiplicative decrease, and a cool-down shared by every waiting call
+                self._stats['throttled'] += 1
+                self._concurrency = max(float(self.min_concurrency), self._concurrency / 2)
+                cooldown = self._next_cooldown()
+                self._cooldown_until = max(self._cooldown_until, now + cooldown)
+                logger.info(f"Model call throttled, reducing concurrency to {int(self._concurrency)} "
+                            f"and pausing new calls for {cooldown:.1f}s")
+            else:
+                # Additive increase: about +1 per round of successful calls
+                self._concurrency = min(float(self.max_concurrency), self._concurrency + 1 / self._concurrency)
+                self._throttle_streak = 0
+
+            if usage:
+                tokens = usage.get('totalTokens') or usage.get('inputTokens', 0) + usage.get('outputTokens', 0)
+                cost = estimate_cost(model_id, usage, self.pricing)
+                self._usage.append((now, tokens, cost))
+                self._window_tokens += tokens
+                self._window_cost += cost
+                self._check_warning()
+
+    def _next_cooldown(self) -> float:
+        """Cool-down for the next throttle in a row: exponential backoff with equal jitter."""
+        self._throttle_streak += 1
+        if not self.throttle_cooldown:
+            return 0.0
+        backoff = min(self.max_throttle_cooldown, self.throttle_cooldown * 2 ** (self._throttle_streak - 1))
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+    def _check_warning(self) -> None:
+        """Warn once per window when usage passes 80% of an hourly budget."""
+        if not self.cost_warnings:
+            return
+        near_tokens = self.hourly_token_limit and self._window_tokens >= self.hourly_token_limit * _WARN_FRACTION
+        near_cost = self.hourly_cost_limit and self._window_cost >= self.hourly_cost_limit * _WARN_FRACTION
+        if (near_tokens or near_cost) and not self._warned:
+            self._warned = True
+            logger.warning(f"Hourly model usage at {self._window_tokens:,} tokens / ${self._window_cost:.2f}; "
+                           f"calls will wait once the limit is reached")
+        elif not (near_tokens or near_cost):
+            self._warned = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get current limits, rolling-hour usage and call counters."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return {
+                **self._stats,
+                'wait_seconds': round(self._stats['wait_seconds'], 2),
+                'cooldown_seconds': round(max(0.0, self._cooldown_until - time.monotonic()), 2),
+                'concurrency_limit': int(self._concurrency),
+                'in_flight': self._in_flight,
+                'hour_tokens': self._window_tokens,
+                'hour_cost': round(self._window_cost, 4)
+            }
+
+
+class RateLimitedModel(Model):
+    """
+    Model wrapper that runs every call through an AdaptiveRateLimiter.
+
+    A call waits for a slot before it starts. If the provider throttles it, the
+    slot is released with a throttle signal, which starts the limiter's shared
+    cool-down, and the ModelThrottledException is raised for the Strands event
+    loop to retry.
+    """
+
+    def __init__(self, model: Model, limiter: AdaptiveRateLimiter):
+        self.model = model
+        self.limiter = limiter
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration of the wrapped model."""
+        return getattr(self.model, 'config', None) or self.model.get_config()
+
+    def update_config(self, **model_config: Any) -> None:
+        """Update the wrapped model's configuration."""
+        self.model.update_config(**model_config)
+
+    def get_config(self) -> Any:
+        """Return the wrapped model's configuration."""
+        return self.model.get_config()
+
+    def _model_id(self) -> str:
+        config = self.config
+        return config.get('model_id', '') if isinstance(config, dict) else ''
+
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[List[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Stream a response once the limiter allows the call."""
+        await self.limiter.acquire()
+        usage = None
+        try:
+            async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+                if 'metadata' in event:
+                    usage = event['metadata'].get('usage')
+                yield event
+        except ModelThrottledException:
+            self.limiter.release(self._model_id(), usage, throttled=True)
+            raise
+        except BaseException:
+            self.limiter.release(self._model_id(), usage)
+            raise
+        self.limiter.release(self._model_id(), usage)
+
+    async def structured_output(
+        self, output_model: Type[T], prompt: Messages, system_prompt: Optional[str] = None, **kwargs: Any
+    ) -> AsyncGenerator[Dict[str, Union[T, Any]], None]:
+        """Get structured output once the limiter allows the call."""
+        await self.limiter.acquire()
+        try:
+            async for event in self.model.structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs):
+                yield event
+        except ModelThrottledException:
+            self.limiter.release(self._model_id(), throttled=True)
+            raise
+        except BaseException:
+            self.limiter.release(self._model_id())
+            raise
+        self.limiter.release(self._model_id())
+
+
+# Global limiter shared by all model calls
+_rate_limiter: Optional[AdaptiveRateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_pricing() -> Dict[str, Tuple[float, float]]:
+    """Get the model price table with the configured overrides applied."""
+    overrides = get_config().get_rate_limiter_pricing()
+    return {**DEFAULT_PRICING, **{key: tuple(value) for key, value in overrides.items()}}
+
+
+def get_rate_limiter() -> Optional[AdaptiveRateLimiter]:
+    """Get the shared rate limiter, or None if rate limiting is disabled."""
+    global _rate_limiter
+    config = get_config()
+    if not config.get_rate_limiter_enabled():
+        return None
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = AdaptiveRateLimiter(
+                hourly_token_limit=config.get_bedrock_hourly_token_limit(),
+                hourly_cost_limit=config.get_bedrock_hourly_cost_limit(),
+                requests_per_minute=config.get_rate_limiter_requests_per_minute(),
+                initial_concurrency=config.get_rate_limiter_initial_concurrency(),
+                max_concurrency=config.get_rate_limiter_max_concurrency(),
+                cost_warnings=config.get_bedrock_cost_warnings(),
+                pricing=get_pricing(),
+                throttle_cooldown=config.get_rate_limiter_throttle_cooldown(),
+                max_throttle_cooldown=config.get_rate_limiter_max_throttle_cooldown()
+            )
+    return _rate_limiter
+
+
+def rate_limited(model: Model) -> Model:
+    """
+    Put a model behind the shared rate limiter.
+
+    Returns the model unchanged when rate limiting is disabled or the model is
+    already rate limited.
+    """
+    if isinstance(model, RateLimitedModel):
+        return model
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return model
+    return RateLimitedModel(model, limiter)
@@ -0,0 +1,367 @@
+"""
+Multi-region latency-aware routing for Bedrock.
+
+RegionRouter keeps the time to first token and health of an ordered list of
+candidate regions. A background probe sends a one-token request to every
+region at a fixed interval. Requests go to the fastest healthy region, and
+regions earlier in the list win near-ties. Chat sessions are sticky: a session
+keeps its region until that region becomes unhealthy.
+
+Bedrock models reach the router through RegionRoutedClient, which stands in
+for their bedrock-runtime client: it picks the region for every request, not
+once when the model is built, and reports each request's outcome back to the
+router, so a failing region is skipped without waiting for the next probe.
+
+Probe results are saved to a small JSON file, so short-lived commands can use
+what earlier runs measured without probing first. The probe is a plain
+function of the region name, so the router can be exercised with stand-in
+endpoints (see bench_region_router.py).
+"""
+
+import atexit
+import concurrent.futures
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Probe function: region name -> time to first token in milliseconds (raises on failure)
+ProbeFunction = Callable[[str], float]
+
+# Bedrock error codes that count against a region's health (compared in lower case,
+# as errors raised inside a response stream use camelCase codes)
+_REGION_FAILURE_CODES = {
+    'throttlingexception', 'serviceunavailableexception', 'internalserverexception',
+    'modelnotreadyexception', 'modeltimeoutexception', 'modelstreamerrorexception'
+}
+
+
+@dataclass
+class RegionStats:
+    """Exponentially weighted probe results and request health of one region."""
+    ttft_ms: Optional[float] = None
+    samples: int = 0
+    consecutive_failures: int = 0
+    updated_at: float = 0.0
+
+
+class RegionRouter:
+    """
+    Choose Bedrock regions from probed time to first token and health.
+
+    A region is unhealthy after max_failures consecutive failed probes or
+    requests, and healthy again after its next successful one. Regions that
+    have not been measured yet rank after measured healthy regions, in list
+    order.
+    """
+
+    def __init__(self, regions: List[str], probe: Optional[ProbeFunction] = None, probe_interval: float = 300,
+                 ewma_alpha: float = 0.3, max_failures: int = 2, tolerance_ms: float = 50,
+                 stats_file: Optional[str] = None):
+        """
+        Initialize the region router.
+
+        Args:
+            regions: Candidate regions in order of preference
+            probe: Function measuring a region's time to first token in milliseconds
+            probe_interval: Seconds between background probes
+            ewma_alpha: Weight of new measurements in the moving average (0-1)
+            max_failures: Consecutive failures after which a region is unhealthy
+            tolerance_ms: Prefer an earlier region unless a later one is faster by more than this
+            stats_file: JSON file the results are loaded from and saved to (None = memory only)
+        """
+        self.regions = list(regions)
+        self.probe = probe
+        self.probe_interval = probe_interval
+        self.ewma_alpha = ewma_alpha
+        self.max_failures = max_failures
+        self.tolerance_ms = tolerance_ms
+        self.stats_file = Path(stats_file) if stats_file else None
+
+        self._stats: Dict[str, RegionStats] = {region: RegionStats() for region in self.regions}
+        self._sessions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._load()
+
+    def _load(self) -> None:
+        """Load earlier results from the stats file."""
+        if not self.stats_file or not self.stats_file.is_file():
+            return
+        try:
+            data = json.loads(self.stats_file.read_text(encoding='utf-8'))
+            for region, values in data.items():
+                if region in self._stats:
+                    self._stats[region] = RegionStats(**values)
+        except Exception as e:
+            logger.warning(f"Could not load region latency statistics from {self.stats_file}: {e}")
+
+    def save(self) -> None:
+        """Write the results to the stats file."""
+        if not self.stats_file:
+            return
+        with self._lock:
+            data = {region: asdict(stats) for region, stats in self._stats.items()}
+        try:
+            self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+            self.stats_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not save region latency statistics to {self.stats_file}: {e}")
+
+    def record(self, region: str, ttft_ms: Optional[float] = None, error: bool = False) -> None:
+        """Record a probe or request result for a region."""
+        with self._lock:
+            stats = self._stats.setdefault(region, RegionStats())
+            if error:
+                stats.consecutive_failures += 1
+            else:
+                stats.consecutive_failures = 0
+                if ttft_ms is not None:
+                    if stats.ttft_ms is None or stats.samples == 0:
+                        stats.ttft_ms = ttft_ms
+                    else:
+                        stats.ttft_ms += self.ewma_alpha * (ttft_ms - stats.ttft_ms)
+                    stats.samples += 1
+            stats.updated_at = time.time()
+
+    def is_healthy(self, region: str) -> bool:
+        """Return whether a region is currently considered healthy."""
+        with self._lock:
+            stats = self._stats.get(region)
+            return stats is None or stats.consecutive_failures < self.max_failures
+
+    def best_region(self) -> str:
+        """Get the region for a new request."""
+        with self._lock:
+            healthy = [r for r in self.regions if self._stats[r].consecutive_failures < self.max_failures]
+            if not healthy:
+                # Everything is failing; stay with the preferred region
+                return self.regions[0]
+            measured = [r for r in healthy if self._stats[r].ttft_ms is not None]
+            if not measured:
+                return healthy[0]
+            fastest = min(self._stats[r].ttft_ms for r in measured)
+            return next(r for r in measured if self._stats[r].ttft_ms <= fastest + self.tolerance_ms)
+
+    def region_for_session(self, session_id: str) -> str:
+        """Get the region of a chat session, assigning one on first use or when its region fails."""
+        with self._lock:
+            region = self._sessions.get(session_id)
+        if region is not None and self.is_healthy(region):
+            return region
+        region = self.best_region()
+        with self._lock:
+            self._sessions[session_id] = region
+        return region
+
+    def probe_once(self) -> Dict[str, Optional[float]]:
+        """Probe all regions concurrently and record the results."""
+        if self.probe is None:
+            return {}
+
+        def measure(region: str) -> Optional[float]:
+            try:
+                ttft_ms = self.probe(region)
+            except Exception as e:
+                logger.debug(f"Probe of region {region} failed: {e}")
+                self.record(region, error=True)
+                return None
+            self.record(region, ttft_ms)
+            return ttft_ms
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.regions),
+                                                   thread_name_prefix="region-probe") as executor:
+            results = dict(zip(self.regions, executor.map(measure, self.regions)))
+        self.save()
+        logger.debug(f"Region probe results (ms): {results}")
+        return results
+
+    def _stale(self) -> bool:
+        """Return whether the results are older than the probe interval."""
+        with self._lock:
+            newest = max((stats.updated_at for stats in self._stats.values()), default=0.0)
+        return time.time() - newest >= self.probe_interval
+
+    def start(self) -> None:
+        """Start probing in a background thread (first probe now if the results are stale)."""
+        if self.probe is None or self._thread is not None:
+            return
+
+        def run() -> None:
+            wait = 0.0 if self._stale() else self.probe_interval
+            while not self._stop.wait(wait):
+                self.probe_once()
+                wait = self.probe_interval
+
+        self._thread = threading.Thread(target=run, name="region-probe", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background probe."""
+        self._stop.set()
+
+    def get_stats(self) -> Dict[str, RegionStats]:
+        """Get a copy of the results per region."""
+        with self._lock:
+            return {region: RegionStats(**asdict(stats)) for region, stats in self._stats.items()}
+
+
+def _is_region_failure(error: BaseException) -> bool:
+    """Return whether a request error says something about the region (not about the request)."""
+    if isinstance(error, ClientError):
+        return error.response.get('Error', {}).get('Code', '').lower() in _REGION_FAILURE_CODES
+    # Connection errors and timeouts
+    return isinstance(error, BotoCoreError)
+
+
+class RegionRoutedClient:
+    """
+    bedrock-runtime client that sends each request to the router's region.
+
+    Holds one client per region, created on first use. converse and
+    converse_stream go to the session's region for chat sessions and to the
+    best region otherwise, and their outcome is recorded with the router:
+    successes reset the region's failure count, and errors that point at the
+    region (throttling, unavailability, timeouts) add to it. The time to first
+    token average is left to the probe, whose requests are all the same size;
+    real requests vary too much in prompt length to compare regions by.
+    """
+
+    def __init__(self, router: RegionRouter, client_factory: Callable[[str], Any],
+                 session_id: Optional[str] = None):
+        """
+        Initialize the routed client.
+
+        Args:
+            router: Router choosing the region of each request
+            client_factory: Creates the bedrock-runtime client of a region
+            session_id: Chat session that should stay in one region
+        """
+        self.router = router
+        self.session_id = session_id
+        self._client_factory = client_factory
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _region(self) -> str:
+        if self.session_id:
+            return self.router.region_for_session(self.session_id)
+        return self.router.best_region()
+
+    def client_for(self, region: str) -> Any:
+        """Get the client of a region."""
+        with self._lock:
+            client = self._clients.get(region)
+            if client is None:
+                client = self._clients[region] = self._client_factory(region)
+            return client
+
+    @property
+    def meta(self) -> Any:
+        """Client metadata of the region the next request goes to."""
+        return self.client_for(self._region()).meta
+
+    def __getattr__(self, name: str) -> Any:
+        # Other operations go to the current region without being recorded
+        return getattr(self.client_for(self._region()), name)
+
+    def _record_error(self, region: str, error: BaseException) -> None:
+        if _is_region_failure(error):
+            self.router.record(region, error=True)
+
+    def converse(self, **request: Any) -> Dict[str, Any]:
+        """Send a Converse request to the current region."""
+        region = self._region()
+        try:
+            response = self.client_for(region).converse(**request)
+        except Exception as e:
+            self._record_error(region, e)
+            raise
+        self.router.record(region)
+        return response
+
+    def converse_stream(self, **request: Any) -> Dict[str, Any]:
+        """Send a ConverseStream request to the current region."""
+        region = self._region()
+        try:
+            response = self.client_for(region).converse_stream(**request)
+        except Exception as e:
+            self._record_error(region, e)
+            raise
+        return {**response, 'stream': self._watch(region, response['stream'])}
+
+    def _watch(self, region: str, stream: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Pass a response stream through, recording its outcome once it ends."""
+        try:
+            yield from stream
+        except Exception as e:
+            self._record_error(region, e)
+            raise
+        self.router.record(region)
+
+
+def bedrock_probe(model_id: str) -> ProbeFunction:
+    """
+    Create a probe that measures time to first token of a one-token Bedrock request.
+
+    Args:
+        model_id: Model to probe; it must be available in every candidate region
+    """
+    from .bedrock_client import get_bedrock_session, get_bedrock_client_config
+
+    clients = {}
+
+    def probe(region: str) -> float:
+        client = clients.get(region)
+        if client is None:
+            client = clients[region] = get_bedrock_session(region).client(
+                'bedrock-runtime', config=get_bedrock_client_config())
+        start = time.perf_counter()
+        response = client.converse_stream(
+            modelId=model_id,
+            messages=[{'role': 'user', 'content': [{'text': 'hi'}]}],
+            inferenceConfig={'maxTokens': 1}
+        )
+        for _ in response['stream']:
+            return (time.perf_counter() - start) * 1000
+        raise RuntimeError(f"Empty response from {region}")
+
+    return probe
+
+
+# Global region router
+_region_router: Optional[RegionRouter] = None
+_region_router_lock = threading.Lock()
+
+
+def get_region_router() -> Optional[RegionRouter]:
+    """Get the shared region router, or None if multi-region routing is disabled."""
+    global _region_router
+    routing_config = get_config().get_bedrock_region_routing_config()
+    if not routing_config['enabled'] or len(routing_config['regions']) < 2:
+        return None
+    with _region_router_lock:
+        if _region_router is None:
+            probe_model = routing_config['probe_model_id'] or get_config().get_bedrock_fast_model()
+            _region_router = RegionRouter(
+                routing_config['regions'],
+                probe=bedrock_probe(probe_model),
+                probe_interval=routing_config['probe_interval'],
+                ewma_alpha=routing_config['ewma_alpha'],
+                max_failures=routing_config['max_failures'],
+                tolerance_ms=routing_config['tolerance_ms'],
+                stats_file=routing_config['stats_file']
+            )
+            _region_router.start()
+            atexit.register(_region_router.stop)
+    return _region_router
@@ -99,8 +99,4 @@ def setup_shell_environment():
     os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
     
     # Disable Python warnings in subprocess if needed
-    os.environ.setdefault('PYTHONWARNINGS', 'ignore::DeprecationWarning')
-
-
-# Auto-setup on import
-setup_shell_environment()
\ No newline at end of file
+    os.environ.setdefault('PYTHONWARNINGS', 'ignore::DeprecationWarning')
\ No newline at end of file
@@ -0,0 +1,341 @@
+"""
+Map-reduce summarization utilities for Strands Analyst.
+
+This module summarizes documents that are too long for a single model call.
+Documents are split into chunks at headings, the chunks are summarized
+concurrently with a bounded number of requests in flight (map), and the chunk
+summaries are combined into one summary (reduce), hierarchically when they do
+not fit in a single reduce call.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from strands import Agent
+from strands.models.bedrock import BedrockModel
+
+from ..config import (
+    get_config, get_bedrock_config_for_agent, get_bedrock_cache_options,
+    get_summarize_chunk_tokens, get_summarize_max_in_flight, get_summarize_reduce_tokens,
+    get_summarize_chunk_summary_words, get_summarize_summary_words
+)
+from ..prompts import format_prompt_cached
+from .bedrock_client import get_bedrock_client_options
+from .rate_limiter import rate_limited
+from .model_provider_factory import apply_execution_policy
+from .usage_ledger import usage_hooks
+from .tracing import trace_hooks, trace_model
+from .token_budget import estimate_tokens, split_sections
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SummaryResult:
+    """Result of a map-reduce summarization run."""
+    summary: str
+    chunk_count: int
+    reduce_rounds: int
+    model_calls: int
+    input_tokens: int = 0
+    output_tokens: int = 0
+    document_tokens: int = 0
+    elapsed_seconds: float = 0.0
+    summary_file: Optional[str] = None
+    chunk_summaries: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a dict suitable for a tool response."""
+        result = {
+            'summary': self.summary,
+            'chunk_count': self.chunk_count,
+            'reduce_rounds': self.reduce_rounds,
+            'model_calls': self.model_calls,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'document_tokens': self.document_tokens,
+            'elapsed_seconds': round(self.elapsed_seconds, 2)
+        }
+        if self.summary_file:
+            result['summary_file'] = self.summary_file
+        return result
+
+
+def _split_oversized(text: str, max_tokens: int) -> List[str]:
+    """Split text larger than max_tokens at paragraph, then line, then word boundaries."""
+    pieces = []
+    current: List[str] = []
+    used = 0
+
+    for separator in ('\n\n', '\n', ' '):
+        parts = text.split(separator)
+        if len(parts) > 1:
+            break
+    else:
+        # Single unbreakable run of characters - cut on characters
+        size = max_tokens * 4
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    for part in parts:
+        cost = estimate_tokens(part) + 1
+        if cost > max_tokens:
+            if current:
+                pieces.append(separator.join(current))
+                current, used = [], 0
+            pieces.extend(_split_oversized(part, max_tokens))
+            continue
+        if used + cost > max_tokens and current:
+            pieces.append(separator.join(current))
+            current, used = [], 0
+        current.append(part)
+        used += cost
+
+    if current:
+        pieces.append(separator.join(current))
+    return [piece for piece in pieces if piece.strip()]
+
+
+def chunk_document(markdown: str, chunk_tokens: int) -> List[str]:
+    """
+    Split a markdown document into chunks of at most chunk_tokens.
+
+    Chunk boundaries follow headings where possible: consecutive small sections
+    are merged into one chunk and sections larger than the budget are split at
+    paragraph boundaries.
+
+    Args:
+        markdown: Markdown content to split
+        chunk_tokens: Maximum estimated tokens per chunk
+
+    Returns:
+        List of chunk texts in document order
+    """
+    chunks = []
+    current: List[str] = []
+    used = 0
+
+    for section in split_sections(markdown):
+        cost = section['tokens'] + 1
+        if cost > chunk_tokens:
+            if current:
+                chunks.append('\n\n'.join(current))
+                current, used = [], 0
+            chunks.extend(_split_oversized(section['text'], chunk_tokens))
+            continue
+        if used + cost > chunk_tokens and current:
+            chunks.append('\n\n'.join(current))
+            current, used = [], 0
+        current.append(section['text'])
+        used += cost
+
+    if current:
+        chunks.append('\n\n'.join(current))
+    return chunks
+
+
+def _group_by_budget(texts: List[str], max_tokens: int) -> List[List[str]]:
+    """Group consecutive texts so that each group fits within max_tokens."""
+    groups: List[List[str]] = []
+    used = 0
+
+    for text in texts:
+        cost = estimate_tokens(text) + 2
+        if not groups or used + cost > max_tokens:
+            groups.append([])
+            used = 0
+        groups[-1].append(text)
+        used += cost
+
+    return groups
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut a text to roughly max_tokens, at a paragraph or line break where possible."""
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    cut = text[:max(1, len(text) * max_tokens // tokens)]
+    for separator in ('\n\n', '\n'):
+        position = cut.rfind(separator)
+        if position > len(cut) // 2:
+            return cut[:position]
+    return cut
+
+
+def _reduce_groups(summaries: List[str], max_tokens: int) -> List[List[str]]:
+    """
+    Group summaries for one reduce round, always making progress.
+
+    When summaries are too large to share a group, grouping by budget would
+    leave the count unchanged; merge them in pairs instead, truncated so each
+    pair fits the budget.
+    """
+    groups = _group_by_budget(summaries, max_tokens)
+    if len(groups) < len(summaries):
+        return groups
+    half = max(1, max_tokens // 2 - 2)
+    truncated = [_truncate_to_tokens(summary, half) for summary in summaries]
+    return [truncated[index:index + 2] for index in range(0, len(truncated), 2)]
+
+
+def _document_title(markdown: str) -> str:
+    """Return the first heading of the document, or a generic title."""
+    match = re.search(r'^#{1,6}\s+(.+?)\s*#*\s*$', markdown, re.MULTILINE)
+    return match.group(1).strip() if match else 'Untitled'
+
+
+def create_summarize_model() -> BedrockModel:
+    """Create the Bedrock model used for map and reduce calls."""
+    bedrock_config = get_bedrock_config_for_agent('summarize')
+    config = get_config()
+
+    model_id = config.get_bedrock_model_for_agent('summarize') or config.get_bedrock_fast_model()
+
+    bedrock_model = BedrockModel(
+        model_id=model_id,
+        temperature=bedrock_config['temperature'],
+        top_p=bedrock_config['top_p'],
+        max_tokens=bedrock_config['max_tokens'],
+        stop_sequences=bedrock_config['stop_sequences'],
+        streaming=bedrock_config['streaming'],
+        **get_bedrock_client_options(bedrock_config['region_name']),
+        **get_bedrock_cache_options(model_id, cache_prompt=False)
+    )
+
+    if bedrock_config['guardrail_id']:
+        bedrock_model.guardrail_id = bedrock_config['guardrail_id']
+
+    return rate_limited(apply_execution_policy(bedrock_model, 'summarize', model_id=model_id))
+
+
+class MapReduceSummarizer:
+    """
+    Summarize long documents with concurrent map calls and a hierarchical reduce.
+
+    A single model instance is shared by all calls; each call runs on its own
+    tool-less Agent so that concurrent requests do not share conversation state.
+    """
+
+    def __init__(self, model=None, chunk_tokens: Optional[int] = None,
+                 max_in_flight: Optional[int] = None, reduce_tokens: Optional[int] = None,
+                 chunk_summary_words: Optional[int] = None, summary_words: Optional[int] = None):
+        self.model = trace_model(model or create_summarize_model())
+        self.chunk_tokens = chunk_tokens or get_summarize_chunk_tokens()
+        self.max_in_flight = max(1, max_in_flight or get_summarize_max_in_flight())
+        self.reduce_tokens = reduce_tokens or get_summarize_reduce_tokens()
+        self.chunk_summary_words = chunk_summary_words or get_summarize_chunk_summary_words()
+        self.summary_words = summary_words or get_summarize_summary_words()
+
+    async def _invoke(self, prompt: str, semaphore: asyncio.Semaphore, stats: Dict[str, int]) -> str:
+        """Run one model call, bounded by the in-flight semaphore."""
+        async with semaphore:
+            agent = Agent(model=self.model, callback_handler=None,
+                          hooks=usage_hooks('summarize') + trace_hooks('summarize'))
+            result = await agent.invoke_async(prompt)
+
+        usage = result.metrics.accumulated_usage
+        stats['model_calls'] += 1
+        stats['input_tokens'] += usage.get('inputTokens', 0)
+        stats['output_tokens'] += usage.get('outputTokens', 0)
+        return str(result).strip()
+
+    async def summarize_async(self, markdown: str, title: Optional[str] = None,
+                              focus: Optional[str] = None) -> SummaryResult:
+        """
+        Summarize a markdown document.
+
+        Args:
+            markdown: Document content
+            title: Document title used in prompts (defaults to the first heading)
+            focus: Optional topic or question the summary should focus on
+
+        Returns:
+            SummaryResult with the final summary and run statistics
+        """
+        start_time = time.time()
+        title = title or _document_title(markdown)
+        focus_line = f"- Focuses on: {focus}\n" if focus else ''
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        stats = {'model_calls': 0, 'input_tokens': 0, 'output_tokens': 0}
+
+        chunks = chunk_document(markdown, self.chunk_tokens)
+        logger.info(f"Summarizing {len(chunks)} chunks with up to {self.max_in_flight} requests in flight")
+
+        # Map: summarize all chunks concurrently
+        chunk_summaries = await asyncio.gather(*[
+            self._invoke(format_prompt_cached("summarize_chunk",
+                                              index=index + 1,
+                                              total=len(chunks),
+                                              title=title,
+                                              words=self.chunk_summary_words,
+                                              focus=focus_line,
+                                              content=chunk),
+                         semaphore, stats)
+            for index, chunk in enumerate(chunks)
+        ])
+
+        # Reduce: combine summaries, in several rounds when they do not fit in one call
+        summaries = list(chunk_summaries)
+        reduce_rounds = 0
+        while len(summaries) > 1:
+            groups = _reduce_groups(summaries, self.reduce_tokens)
+            final_round = len(groups) == 1
+            reduce_rounds += 1
+            logger.info(f"Reduce round {reduce_rounds}: {len(summaries)} summaries in {len(groups)} groups")
+
+            summaries = await asyncio.gather(*[
+                self._invoke(format_prompt_cached("summarize_reduce",
+                                                  title=title,
+                                                  words=self.summary_words if final_round else self.chunk_summary_words * 2,
+                                                  focus=focus_line,
+                                                  content='\n\n---\n\n'.join(group)),
+                             semaphore, stats)
+                for group in groups
+            ])
+
+        return SummaryResult(
+            summary=summaries[0] if summaries else '',
+            chunk_count=len(chunks),
+            reduce_rounds=reduce_rounds,
+            model_calls=stats['model_calls'],
+            input_tokens=stats['input_tokens'],
+            output_tokens=stats['output_tokens'],
+            document_tokens=estimate_tokens(markdown),
+            elapsed_seconds=time.time() - start_time,
+            chunk_summaries=list(chunk_summaries)
+        )
+
+    def summarize(self, markdown: str, title: Optional[str] = None,
+                  focus: Optional[str] = None) -> SummaryResult:
+        """Synchronous wrapper around summarize_async."""
+        coroutine = self.summarize_async(markdown, title=title, focus=focus)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # Called from inside a running event loop - run on a separate thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+
+def summarize_text(markdown: str, title: Optional[str] = None, focus: Optional[str] = None,
+                   **kwargs) -> SummaryResult:
+    """
+    Summarize a markdown document with map-reduce summarization.
+
+    Args:
+        markdown: Document content
+        title: Document title used in prompts (defaults to the first heading)
+        focus: Optional topic or question the summary should focus on
+        **kwargs: Overrides for MapReduceSummarizer settings
+
+    Returns:
+        SummaryResult with the final summary and run statistics
+    """
+    return MapReduceSummarizer(**kwargs).summarize(markdown, title=title, focus=focus)
@@ -0,0 +1,222 @@
+"""
+Token budgeting utilities for Strands Analyst.
+
+This module provides fast token estimation and section-aware compaction of
+markdown content so that tool results returned to the model stay within a
+configurable token budget.
+"""
+
+import re
+from typing import Dict, Any, List
+
+
+# One token per word or punctuation mark is a close, cheap approximation of BPE tokenizers
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK_PATTERN = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+
+# Sections that are trimmed first when the content exceeds the budget
+_LOW_PRIORITY_SECTION_PATTERN = re.compile(
+    r"\b(references|bibliography|footnotes?|notes|comments?|related|share|subscribe|newsletter|"
+    r"about the author|further reading|see also|acknowledg\w*|sponsored|advertisement|"
+    r"read more|more from|tags|categories|navigation|sign up)\b",
+    re.IGNORECASE
+)
+
+# Smallest remaining budget worth spending on a partially included section
+_MIN_PARTIAL_TOKENS = 50
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a piece of text.
+
+    Uses the larger of a character based estimate (~4 characters per token) and a
+    word/punctuation count, which keeps the estimate conservative for code,
+    URLs and punctuation-heavy text without loading a tokenizer.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+    return max((len(text) + 3) // 4, len(_TOKEN_PATTERN.findall(text)))
+
+
+def strip_links_and_images(markdown: str) -> str:
+    """
+    Remove image references and collapse links to their text.
+
+    Args:
+        markdown: Markdown content
+
+    Returns:
+        Markdown without image markup or link targets
+    """
+    markdown = _IMAGE_PATTERN.sub('', markdown)
+    markdown = _LINK_PATTERN.sub(r'\1', markdown)
+    # Clean up blank lines left behind by removed images
+    return re.sub(r'\n{3,}', '\n\n', markdown).strip()
+
+
+def markdown_to_text(markdown: str) -> str:
+    """
+    Convert markdown to plain text by removing heading, emphasis and code markup.
+
+    Args:
+        markdown: Markdown content
+
+    Returns:
+        Plain text content
+    """
+    text = strip_links_and_images(markdown)
+    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'(\*\*|__|\*|`{1,3})', '', text)
+    text = re.sub(r'^\s*>\s?', '', text, flags=re.MULTILINE)
+    return re.sub(r'\n{3,}', '\n\n', text).strip()
+
+
+def split_sections(markdown: str) -> List[Dict[str, Any]]:
+    """
+    Split markdown content into sections at headings.
+
+    Content before the first heading becomes a lead section with an empty title.
+
+    Args:
+        markdown: Markdown content
+
+    Returns:
+        List of section dicts with title, level, text and tokens
+    """
+    sections = []
+    current = {'title': '', 'level': 0, 'lines': []}
+    in_code_block = False
+
+    for line in markdown.split('\n'):
+        if line.lstrip().startswith('```'):
+            in_code_block = not in_code_block
+
+        heading = None if in_code_block else _HEADING_PATTERN.match(line)
+        if heading:
+            if current['lines'] and '\n'.join(current['lines']).strip():
+                sections.append(current)
+            current = {'title': heading.group(2).strip(), 'level': len(heading.group(1)), 'lines': []}
+        current['lines'].append(line)
+
+    if current['lines'] and '\n'.join(current['lines']).strip():
+        sections.append(current)
+
+    for section in sections:
+        section['text'] = '\n'.join(section.pop('lines')).strip()
+        section['tokens'] = estimate_tokens(section['text'])
+
+    return sections
+
+
+def _section_priority(section: Dict[str, Any], index: int) -> int:
+    """Return the trim priority of a section (lower values are kept first)."""
+    if index == 0:
+        return 0
+    if section['title'] and _LOW_PRIORITY_SECTION_PATTERN.search(section['title']):
+        return 2
+    return 1
+
+
+def _truncate_text(text: str, max_tokens: int) -> str:
+    """Truncate text to a token budget at paragraph, then word, boundaries."""
+    kept = []
+    used = 0
+
+    for paragraph in text.split('\n\n'):
+        cost = estimate_tokens(paragraph)
+        if used + cost > max_tokens:
+            available = max_tokens - used
+            if not kept or available >= _MIN_PARTIAL_TOKENS:
+                # Paragraph does not fit - cut it at a word boundary
+                cut = paragraph[:available * 4]
+                if ' ' in cut:
+                    cut = cut.rsplit(' ', 1)[0]
+                while cut and estimate_tokens(cut) > available - 1:
+                    cut = cut[:len(cut) * 3 // 4].rsplit(' ', 1)[0]
+                if cut:
+                    kept.append(cut + ' …')
+            break
+        kept.append(paragraph)
+        used += cost
+
+    return '\n\n'.join(kept)
+
+
+def _first_sentence(text: str) -> str:
+    """Return the first line of text, cut after its first sentence."""
+    line = next((line.strip() for line in text.split('\n') if line.strip()), '')
+    match = re.match(r'(.+?[.!?])(\s|$)', line)
+    return match.group(1) if match else line
+
+
+def compact_to_budget(markdown: str, max_tokens: int) -> Dict[str, Any]:
+    """
+    Compact markdown content to fit within a token budget.
+
+    Sections are kept by priority: the lead section first, then body sections in
+    document order, and boilerplate sections such as references, comments or
+    related links last. Kept sections are re-assembled in their original order.
+    The lead section is cut down to fit any budget, and at least its title or
+    first sentence is kept, even if that exceeds a very small budget.
+
+    Args:
+        markdown: Markdown content to compact
+        max_tokens: Token budget (0 or negative disables compaction)
+
+    Returns:
+        Dict with compacted content, token counts, truncation flag and omitted section titles
+    """
+    original_tokens = estimate_tokens(markdown)
+
+    if max_tokens <= 0 or original_tokens <= max_tokens:
+        return {
+            'content': markdown,
+            'tokens': original_tokens,
+            'original_tokens': original_tokens,
+            'truncated': False,
+            'omitted_sections': []
+        }
+
+    sections = split_sections(markdown)
+    order = sorted(range(len(sections)), key=lambda i: (_section_priority(sections[i], i), i))
+
+    kept: Dict[int, str] = {}
+    omitted: Dict[int, str] = {}
+    remaining = max_tokens
+
+    for index in order:
+        section = sections[index]
+        # Account for the blank line joining sections
+        cost = section['tokens'] + 1
+
+        if cost <= remaining:
+            kept[index] = section['text']
+            remaining -= cost
+        elif (remaining >= _MIN_PARTIAL_TOKENS or index == 0) and _section_priority(section, index) < 2:
+            kept[index] = _truncate_text(section['text'], remaining - 1)
+            remaining = 0
+            omitted[index] = f"{section['title'] or 'Introduction'} (partial)"
+        else:
+            omitted[index] = section['title'] or 'Introduction'
+
+    content = '\n\n'.join(kept[index] for index in sorted(kept) if kept[index])
+    if not content and sections:
+        # Budgets too small for any paragraph still keep the title or first sentence
+        content = _first_sentence(sections[0]['text'])
+
+    return {
+        'content': content,
+        'tokens': estimate_tokens(content),
+        'original_tokens': original_tokens,
+        'truncated': True,
+        'omitted_sections': [omitted[index] for index in sorted(omitted)]
+    }
@@ -2,6 +2,7 @@
 
 import sys
 import re
+import threading
 import time
 from typing import Any, Dict, Optional, Tuple
 from functools import wraps
@@ -34,12 +35,23 @@ COLORS = {
 
 
 
+# Tool output configuration of the last (snapshot, environment overrides)
+_tool_output_config_cache: Tuple[Any, Optional[Dict[str, Any]]] = (None, None)
+
+
 def get_tool_output_config() -> Dict[str, Any]:
     """Get the tool output configuration from config.yml with environment variable overrides."""
     import os
+    global _tool_output_config_cache
+    
+    # Computed once per configuration snapshot; this is called for every formatted line
+    snapshot = get_config().snapshot
+    overrides = (os.environ.get('ANALYST_TOOL_OUTPUT_ENABLED'), os.environ.get('ANALYST_TOOL_OUTPUT_TIMING'))
+    cache_key, cached = _tool_output_config_cache
+    if cached is not None and cache_key == (snapshot, overrides):
+        return cached
     
-    config = get_config()
-    tool_config = config.get('tool_output', {
+    tool_config = dict(snapshot.get('tool_output', {
         'enabled': True,
         'show_tool_names': True,
         'show_inputs': True,
@@ -66,119 +78,291 @@ def get_tool_output_config() -> Dict[str, Any]:
                 'connection': 'Connection error - Could not connect to the server'
             }
         }
-    })
+    }))
     
     # Apply environment variable overrides
-    if os.environ.get('ANALYST_TOOL_OUTPUT_ENABLED') == 'false':
+    if overrides[0] == 'false':
         tool_config['enabled'] = False
-    if os.environ.get('ANALYST_TOOL_OUTPUT_TIMING') == 'true':
+    if overrides[1] == 'true':
         tool_config['show_timing'] = True
     
+    _tool_output_config_cache = ((snapshot, overrides), tool_config)
     return tool_config
 
 
-def colorize(text: str, color: str, bold: bool = False) -> str:
-    """Apply color to text for terminal output."""
-    config = get_tool_output_config()
-    if not config.get('colors', {}).get('enabled', True):
-        return text
+# Icons of the tool input types
+INPUT_ICONS = {
+    'url': '🌐',
+    'file': '📄',
+    'path': '📁',
+    'data': '📊',
+    'text': '📝',
+    'query': '🔍'
+}
+
+
+def _isatty(stream) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+class TerminalRenderer:
+    """
+    Tool output formatting with the configuration resolved once.
+    
+    Colors, display flags, error explanations and whether the output stream
+    is a terminal are looked up when the renderer is built, so formatting a
+    line does no configuration or environment lookups. get_renderer() returns
+    a renderer that is rebuilt only when the configuration or sys.stdout
+    changes.
+    """
+    
+    def __init__(self, config: Dict[str, Any], stream=None):
+        """
+        Initialize the renderer.
+        
+        Args:
+            config: Tool output configuration (see get_tool_output_config)
+            stream: Output stream used to decide whether to color (defaults to sys.stdout)
+        """
+        self.config = config
+        self.stream = stream if stream is not None else sys.stdout
+        self.enabled = config.get('enabled', True)
+        self.show_tool_names = config.get('show_tool_names', True)
+        self.show_inputs = config.get('show_inputs', True)
+        self.show_errors = config.get('show_errors', True)
+        self.show_timing = config.get('show_timing', False)
+        
+        colors = config.get('colors', {})
+        self.use_colors = colors.get('enabled', True) and _isatty(self.stream)
+        self.colors = {
+            'tool_name': colors.get('tool_name', 'cyan'),
+            'input': colors.get('input', 'blue'),
+            'success': colors.get('success', 'green'),
+            'error': colors.get('error', 'red'),
+            'warning': colors.get('warning', 'yellow'),
+            'info': colors.get('info', 'white')
+        }
+        
+        error_display = config.get('error_display', {})
+        self.show_status_codes = error_display.get('show_status_codes', True)
+        self.show_explanations = error_display.get('show_explanations', True)
+        # YAML reads unquoted status codes as integers
+        self.explanations = {str(key): value for key, value in error_display.get('explanations', {}).items()}
     
-    # Check if output supports colors (not redirected to file)
-    if not sys.stdout.isatty():
-        return text
+    def colorize(self, text: str, color: str, bold: bool = False, dim: bool = False) -> str:
+        """Apply color to text if the output is a terminal and colors are enabled."""
+        if not self.use_colors:
+            return text
+        bold_code = COLORS['bold'] if bold else ''
+        dim_code = COLORS['dim'] if dim else ''
+        return f"{bold_code}{dim_code}{COLORS.get(color, '')}{text}{COLORS['reset']}"
     
-    color_code = COLORS.get(color, '')
-    bold_code = COLORS['bold'] if bold else ''
-    reset_code = COLORS['reset']
+    def tool_name(self, tool_name: str) -> str:
+        """Format tool name for display."""
+        return self.colorize(f"⚙️ Tool: {tool_name}", self.colors['tool_name'], bold=True)
     
-    return f"{bold_code}{color_code}{text}{reset_code}"
+    def input(self, input_type: str, input_value: str) -> str:
+        """Format tool input for display."""
+        icon = INPUT_ICONS.get(input_type, '▶️')
+        
+        # Truncate long inputs
+        if len(input_value) > 100:
+            input_value = input_value[:97] + "..."
+        
+        return self.colorize(f"  ∟{icon} {input_type.capitalize()}: {input_value}", self.colors['input'])
+    
+    def error(self, error: Exception, context: Optional[Dict[str, Any]] = None) -> str:
+        """Format error message with explanation."""
+        error_color = self.colors['error']
+        explanations = self.explanations
+        error_str = str(error)
+        
+        # Add main error message
+        error_lines = [self.colorize(f"  ❌ Error: {error_str}", error_color, bold=True)]
+        
+        # Try to extract status code from error
+        status_code_match = re.search(r'\b(\d{3})\b', error_str)
+        if status_code_match and self.show_status_codes:
+            status_code = status_code_match.group(1)
+            error_lines.append(self.colorize(f"     Status Code: {status_code}", error_color))
+            
+            # Add explanation if available
+            if self.show_explanations and status_code in explanations:
+                error_lines.append(self.colorize(f"     Explanation: {explanations[status_code]}", 'yellow'))
+        
+        # Check for specific error types
+        if self.show_explanations:
+            error_lower = error_str.lower()
+            
+            if 'timeout' in error_lower and 'timeout' in explanations:
+                error_lines.append(self.colorize(f"     Explanation: {explanations['timeout']}", 'yellow'))
+            elif 'dns' in error_lower and 'dns' in explanations:
+                error_lines.append(self.colorize(f"     Explanation: {explanations['dns']}", 'yellow'))
+            elif 'connection' in error_lower and 'connection' in explanations:
+                error_lines.append(self.colorize(f"     Explanation: {explanations['connection']}", 'yellow'))
+            elif 'robots' in error_lower:
+                error_lines.append(self.colorize(
+                    f"     Explanation: {explanations.get('403', 'Access forbidden by robots.txt')}", 'yellow'))
+        
+        return "\n".join(error_lines)
+    
+    def success(self, message: str) -> str:
+        """Format success message."""
+        return self.colorize(f"  ✅ {message}", self.colors['success'])
+    
+    def timing(self, start_time: float, end_time: float) -> str:
+        """Format timing information."""
+        duration = end_time - start_time
+        return self.colorize(f"  ⏱️  Duration: {duration:.2f}s", self.colors['info'], dim=True)
 
 
-def format_tool_name(tool_name: str) -> str:
-    """Format tool name for display."""
-    config = get_tool_output_config()
-    color = config.get('colors', {}).get('tool_name', 'cyan')
-    return colorize(f"⚙️ Tool: {tool_name}", color, bold=True)
+_renderer: Optional[TerminalRenderer] = None
 
 
-def format_input(input_type: str, input_value: str) -> str:
-    """Format tool input for display."""
+def get_renderer() -> TerminalRenderer:
+    """Get the renderer for the current tool output configuration and sys.stdout."""
+    global _renderer
     config = get_tool_output_config()
-    color = config.get('colors', {}).get('input', 'blue')
+    renderer = _renderer
+    if renderer is None or renderer.config is not config or renderer.stream is not sys.stdout:
+        renderer = _renderer = TerminalRenderer(config)
+    return renderer
+
+
+class _StreamFlusher:
+    """One background thread that writes out the buffers of all stream writers when they are due."""
+    
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._due: Dict['BufferedStreamWriter', float] = {}
+        self._thread: Optional[threading.Thread] = None
     
-    # Determine icon based on input type
-    icons = {
-        'url': '🌐',
-        'file': '📄',
-        'path': '📁',
-        'data': '📊',
-        'text': '📝',
-        'query': '🔍'
-    }
-    icon = icons.get(input_type, '▶️')
+    def schedule(self, writer: 'BufferedStreamWriter', delay: float) -> None:
+        """Flush a writer after delay seconds, unless it flushes itself first."""
+        with self._condition:
+            self._due.setdefault(writer, time.monotonic() + delay)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="stream-flush", daemon=True)
+                self._thread.start()
+            self._condition.notify()
     
-    # Truncate long inputs
-    if len(input_value) > 100:
-        input_value = input_value[:97] + "..."
+    def cancel(self, writer: 'BufferedStreamWriter') -> None:
+        """Drop a writer's pending flush."""
+        with self._condition:
+            self._due.pop(writer, None)
     
-    return colorize(f"  ∟{icon} {input_type.capitalize()}: {input_value}", color)
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._due:
+                    self._condition.wait()
+                now = time.monotonic()
+                due = [writer for writer, at in self._due.items() if at <= now]
+                if not due:
+                    self._condition.wait(min(self._due.values()) - now)
+                    continue
+                for writer in due:
+                    del self._due[writer]
+            # Flushed outside the condition: writers take their own lock first
+            for writer in due:
+                writer.flush()
 
 
-def format_error(error: Exception, context: Optional[Dict[str, Any]] = None) -> str:
-    """Format error message with explanation."""
-    config = get_tool_output_config()
-    error_color = config.get('colors', {}).get('error', 'red')
-    error_display = config.get('error_display', {})
-    
-    error_str = str(error)
-    error_lines = []
+_stream_flusher = _StreamFlusher()
+
+
+class BufferedStreamWriter:
+    """
+    Writer for streamed model text that batches small chunks.
     
-    # Add main error message
-    error_lines.append(colorize(f"  ❌ Error: {error_str}", error_color, bold=True))
+    Printing and flushing every token costs more than fast models take to
+    produce one. Chunks are buffered and written on a newline, when the
+    buffer grows large, or flush_interval seconds after the first buffered
+    chunk, whichever comes first. The timed flushes of all writers are done
+    by one shared background thread.
+    """
     
-    # Try to extract status code from error
-    status_code_match = re.search(r'\b(\d{3})\b', error_str)
-    if status_code_match and error_display.get('show_status_codes', True):
-        status_code = status_code_match.group(1)
-        error_lines.append(colorize(f"     Status Code: {status_code}", error_color))
-        
-        # Add explanation if available
-        if error_display.get('show_explanations', True):
-            explanations = error_display.get('explanations', {})
-            if status_code in explanations:
-                explanation = explanations[status_code]
-                error_lines.append(colorize(f"     Explanation: {explanation}", 'yellow'))
-    
-    # Check for specific error types
-    if error_display.get('show_explanations', True):
-        explanations = error_display.get('explanations', {})
-        error_lower = error_str.lower()
+    def __init__(self, stream=None, flush_interval: float = 0.05, max_buffer: int = 4096,
+                 lock: Optional[threading.RLock] = None):
+        """
+        Initialize the writer.
         
-        if 'timeout' in error_lower and 'timeout' in explanations:
-            error_lines.append(colorize(f"     Explanation: {explanations['timeout']}", 'yellow'))
-        elif 'dns' in error_lower and 'dns' in explanations:
-            error_lines.append(colorize(f"     Explanation: {explanations['dns']}", 'yellow'))
-        elif 'connection' in error_lower and 'connection' in explanations:
-            error_lines.append(colorize(f"     Explanation: {explanations['connection']}", 'yellow'))
-        elif 'robots' in error_lower:
-            error_lines.append(colorize(f"     Explanation: {explanations.get('403', 'Access forbidden by robots.txt')}", 'yellow'))
+        Args:
+            stream: Output stream (defaults to sys.stdout at the time of writing)
+            flush_interval: Longest time text stays in the buffer, in seconds (0 = no buffering)
+            max_buffer: Buffer size in characters that forces a write
+            lock: Lock held while writing, shared by writers of the same stream
+        """
+        self._stream = stream
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer = []
+        self._size = 0
+        self._lock = lock if lock is not None else threading.Lock()
     
-    return "\n".join(error_lines)
+    def write(self, text: str) -> None:
+        """Buffer text, writing it out if a flush condition is met."""
+        with self._lock:
+            self._buffer.append(text)
+            self._size += len(text)
+            if '\n' in text or self._size >= self.max_buffer or self.flush_interval <= 0:
+                self._flush_locked()
+            elif len(self._buffer) == 1:
+                # First chunk of a batch: have the shared flusher write it out after the interval
+                _stream_flusher.schedule(self, self.flush_interval)
+    
+    def flush(self) -> None:
+        """Write out buffered text."""
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        if self.flush_interval > 0:
+            _stream_flusher.cancel(self)
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(''.join(self._buffer))
+        stream.flush()
+        self._buffer.clear()
+        self._size = 0
+    
+    def close(self) -> None:
+        """Write out buffered text."""
+        self.flush()
+
+
+def colorize(text: str, color: str, bold: bool = False, dim: bool = False) -> str:
+    """Apply color to text for terminal output."""
+    return get_renderer().colorize(text, color, bold=bold, dim=dim)
+
+
+def format_tool_name(tool_name: str) -> str:
+    """Format tool name for display."""
+    return get_renderer().tool_name(tool_name)
+
+
+def format_input(input_type: str, input_value: str) -> str:
+    """Format tool input for display."""
+    return get_renderer().input(input_type, input_value)
+
+
+def format_error(error: Exception, context: Optional[Dict[str, Any]] = None) -> str:
+    """Format error message with explanation."""
+    return get_renderer().error(error, context)
 
 
 def format_success(message: str) -> str:
     """Format success message."""
-    config = get_tool_output_config()
-    color = config.get('colors', {}).get('success', 'green')
-    return colorize(f"  ✅ {message}", color)
+    return get_renderer().success(message)
 
 
 def format_timing(start_time: float, end_time: float) -> str:
     """Format timing information."""
-    config = get_tool_output_config()
-    color = config.get('colors', {}).get('info', 'white')
-    duration = end_time - start_time
-    return colorize(f"  ⏱️  Duration: {duration:.2f}s", color, dim=True)
+    return get_renderer().timing(start_time, end_time)
 
 
 def extract_tool_inputs(tool_name: str, args: tuple, kwargs: dict) -> list:
@@ -220,22 +404,22 @@ def extract_tool_inputs(tool_name: str, args: tuple, kwargs: dict) -> list:
 
 def display_tool_execution(tool_name: str, args: tuple = (), kwargs: dict = None) -> None:
     """Display tool execution information."""
-    config = get_tool_output_config()
+    renderer = get_renderer()
     
-    if not config.get('enabled', True):
+    if not renderer.enabled:
         return
     
     kwargs = kwargs or {}
     
     # Display tool name
-    if config.get('show_tool_names', True):
-        print(format_tool_name(tool_name))
+    if renderer.show_tool_names:
+        print(renderer.tool_name(tool_name))
     
     # Display inputs
-    if config.get('show_inputs', True):
+    if renderer.show_inputs:
         inputs = extract_tool_inputs(tool_name, args, kwargs)
         for input_type, input_value in inputs:
-            print(format_input(input_type, input_value))
+            print(renderer.input(input_type, input_value))
 
 
 def display_tool_result(
@@ -246,27 +430,27 @@ def display_tool_result(
     end_time: Optional[float] = None
 ) -> None:
     """Display tool execution result."""
-    config = get_tool_output_config()
+    renderer = get_renderer()
     
-    if not config.get('enabled', True):
+    if not renderer.enabled:
         return
     
     # Display error if present
-    if error and config.get('show_errors', True):
-        print(format_error(error))
+    if error and renderer.show_errors:
+        print(renderer.error(error))
     # Display success for successful execution
     elif result is not None:
         # Check if result indicates success
         if isinstance(result, str):
             if 'success' in result.lower() or '✅' in result:
-                print(format_success("Operation completed successfully"))
+                print(renderer.success("Operation completed successfully"))
             elif 'error' in result.lower() or '❌' in result:
                 # Parse error from result string
-                print(format_error(Exception(result)))
+                print(renderer.error(Exception(result)))
     
     # Display timing if enabled and available
-    if config.get('show_timing', False) and start_time and end_time:
-        print(format_timing(start_time, end_time))
+    if renderer.show_timing and start_time and end_time:
+        print(renderer.timing(start_time, end_time))
 
 
 def enhanced_tool_wrapper(original_tool):
@@ -320,8 +504,8 @@ def wrap_tools_with_enhanced_output(tools: list) -> list:
     
     wrapped_tools = []
     for tool in tools:
-        # Check if tool is already wrapped
-        if hasattr(tool, '__wrapped__'):
+        # Check if tool is already wrapped; tool objects (e.g. community tool proxies) are kept as they are
+        if hasattr(tool, '__wrapped__') or not callable(tool):
             wrapped_tools.append(tool)
         else:
             wrapped_tools.append(enhanced_tool_wrapper(tool))
@@ -0,0 +1,442 @@
+"""
+Phase-level tracing for the CLIs, tools and model calls.
+
+print_metrics() only reports totals, which does not tell whether a slow run
+spent its time on the network, in HTML parsing or in the model. With tracing
+enabled (the --trace flag of the CLIs), span() records timed spans around the
+phases of the tools (HTTP fetch, parsing, readability, image download,
+markdown conversion, file writes), trace_hooks() adds spans for each agent
+invocation and tool call, and trace_model() adds spans for each model call,
+split into time to first token and generation.
+
+Spans are written to a local file, one JSON object per line, using the OTLP
+span field names (traceId, spanId, parentSpanId, startTimeUnixNano, ...). The
+"otlp" format writes one OTLP/JSON ExportTraceServiceRequest per run instead,
+which OpenTelemetry tools can import. `analyst trace` prints a waterfall of
+the recorded traces.
+
+When tracing is off, span() returns a shared no-op span, trace_hooks()
+returns no hooks and trace_model() returns the model unchanged, so the
+instrumentation costs a function call.
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Type, TypeVar, Union
+
+from ..config import get_config
+
+if TYPE_CHECKING:
+    from strands.hooks import HookProvider, HookRegistry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Span currently active in this context (thread or asyncio task)
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('analyst_current_span', default=None)
+
+
+class Span:
+    """A timed operation; use it as a context manager to make it the parent of nested spans."""
+
+    __slots__ = ('tracer', 'name', 'trace_id', 'span_id', 'parent_id', 'attributes',
+                 'start_ns', 'end_ns', 'error', '_token')
+
+    def __init__(self, tracer: 'Tracer', name: str, parent: Optional['Span'],
+                 attributes: Optional[Dict[str, Any]] = None, start_ns: Optional[int] = None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = dict(attributes) if attributes else {}
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    def set_error(self, error: Union[BaseException, str]) -> None:
+        """Mark the span as failed."""
+        self.error = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """End the span and export it (once)."""
+        if self.end_ns is None:
+            self.end_ns = end_ns or time.time_ns()
+            self.tracer.export(self)
+
+    def __enter__(self) -> 'Span':
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.set_error(exc)
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Exited in another context than it was entered in
+            _current_span.set(None)
+        self.end()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Span as a JSON line (OTLP field names, attributes as a plain object)."""
+        return {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentSpanId': self.parent_id or '',
+            'name': self.name,
+            'startTimeUnixNano': self.start_ns,
+            'endTimeUnixNano': self.end_ns,
+            'attributes': self.attributes,
+            'status': {'code': 2, 'message': self.error} if self.error else {'code': 1}
+        }
+
+
+class _NoopSpan:
+    """Span returned while tracing is off."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, error: Union[BaseException, str]) -> None:
+        pass
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        pass
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Convert an attribute value to an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _otlp_span(span: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a span dict to an OTLP/JSON span."""
+    otlp = dict(span)
+    otlp['kind'] = 1
+    otlp['startTimeUnixNano'] = str(span['startTimeUnixNano'])
+    otlp['endTimeUnixNano'] = str(span['endTimeUnixNano'])
+    otlp['attributes'] = [{'key': key, 'value': _otlp_value(value)} for key, value in span['attributes'].items()]
+    return otlp
+
+
+class Tracer:
+    """
+    Records spans of one process and writes them to a trace file.
+
+    Spans started without an active parent, for example in the threads
+    strands runs agents on, become children of the root span, so a run is
+    always one trace.
+    """
+
+    def __init__(self, path: str, output_format: str = 'jsonl', root_name: str = 'analyst',
+                 **attributes: Any):
+        """
+        Initialize the tracer and start the root span.
+
+        Args:
+            path: Trace file; spans are appended
+            output_format: "jsonl" (one span per line) or "otlp" (one OTLP/JSON request per run)
+            root_name: Name of the root span, usually the command
+            **attributes: Attributes of the root span
+        """
+        self.path = Path(path)
+        self.output_format = output_format if output_format in ('jsonl', 'otlp') else 'jsonl'
+        self._lock = threading.Lock()
+        self._spans: List[Dict[str, Any]] = []
+        self._closed = False
+        self.root = Span(self, root_name, None, dict(attributes, pid=os.getpid()))
+
+    def start_span(self, name: str, parent: Optional[Span] = None, start_ns: Optional[int] = None,
+                   **attributes: Any) -> Span:
+        """Start a span without making it the active one; the caller ends it."""
+        return Span(self, name, parent or _current_span.get() or self.root, attributes, start_ns)
+
+    def export(self, span: Span) -> None:
+        """Queue an ended span for writing."""
+        with self._lock:
+            if not self._closed:
+                self._spans.append(span.to_dict())
+
+    def close(self) -> None:
+        """End the root span and write all spans to the trace file."""
+        self.root.end()
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            spans, self._spans = self._spans, []
+
+        if self.output_format == 'otlp':
+            lines = [json.dumps({'resourceSpans': [{
+                'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': 'strands-analyst'}}]},
+                'scopeSpans': [{'scope': {'name': __name__}, 'spans': [_otlp_span(span) for span in spans]}]
+            }]}, default=str)]
+        else:
+            lines = [json.dumps(span, default=str) for span in spans]
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+        except OSError as e:
+            logger.warning(f"Could not write trace to {self.path}: {e}")
+
+
+# Tracer of this process, None while tracing is off
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def enable_tracing(path: Optional[str] = None, root_name: str = 'analyst', **attributes: Any) -> Tracer:
+    """
+    Turn on tracing for this process.
+
+    The trace is written when the process exits.
+
+    Args:
+        path: Trace file (defaults to metrics.tracing.file)
+        root_name: Name of the root span, usually the command
+        **attributes: Attributes of the root span, e.g. the URL
+    """
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            config = get_config()
+            _tracer = Tracer(path or config.get_tracing_file(), config.get_tracing_format(),
+                             root_name, **attributes)
+            atexit.register(_tracer.close)
+    return _tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the tracer of this process, or None if tracing is off."""
+    return _tracer
+
+
+def span(name: str, **attributes: Any) -> Union[Span, _NoopSpan]:
+    """
+    Create a span for a phase; use it as a context manager.
+
+        with span("http.fetch", url=url) as fetch:
+            response = requests.get(url)
+            fetch.set_attribute("status", response.status_code)
+
+    Returns a no-op span when tracing is off.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.start_span(name, **attributes)
+
+
+def add_trace_argument(parser) -> None:
+    """Add the --trace [FILE] option to a CLI argument parser."""
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="FILE",
+        help="Record phase timings (fetch, parsing, tools, model) to a trace file "
+             "(default: metrics.tracing.file); view them with `analyst trace`"
+    )
+
+
+def trace_from_args(args, command: str, **attributes: Any) -> None:
+    """Enable tracing if the --trace option was given."""
+    if getattr(args, 'trace', None) is not None:
+        enable_tracing(args.trace or None, f"cli.{command}", **attributes)
+
+
+class TracedModel:
+    """
+    Model wrapper that records a span for each model call.
+
+    Each "model.stream" span has a "model.time_to_first_token" child covering
+    the wait for the first content delta and a "model.generation" child
+    covering the rest of the response.
+    """
+
+    def __init__(self, model: Any, tracer: Tracer):
+        self.model = model
+        self.tracer = tracer
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration of the wrapped model."""
+        return getattr(self.model, 'config', None) or self.model.get_config()
+
+    def update_config(self, **model_config: Any) -> None:
+        """Update the wrapped model's configuration."""
+        self.model.update_config(**model_config)
+
+    def get_config(self) -> Any:
+        """Return the wrapped model's configuration."""
+        return self.model.get_config()
+
+    def _model_id(self) -> str:
+        config = self.config
+        return config.get('model_id', '') if isinstance(config, dict) else ''
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs: Any) -> AsyncGenerator:
+        """Stream a response, recording time to first token and generation time."""
+        model_span = self.tracer.start_span('model.stream', model_id=self._model_id())
+        first_token_ns = None
+        try:
+            async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+                if first_token_ns is None and 'contentBlockDelta' in event:
+                    first_token_ns = time.time_ns()
+                if 'metadata' in event:
+                    usage = event['metadata'].get('usage', {})
+                    model_span.set_attribute('input_tokens', usage.get('inputTokens', 0))
+                    model_span.set_attribute('output_tokens', usage.get('outputTokens', 0))
+                elif 'messageStop' in event:
+                    model_span.set_attribute('stop_reason', event['messageStop'].get('stopReason', ''))
+                yield event
+        except BaseException as e:
+            model_span.set_error(e)
+            raise
+        finally:
+            end_ns = time.time_ns()
+            if first_token_ns is not None:
+                model_span.set_attribute('ttft_ms', round((first_token_ns - model_span.start_ns) / 1e6, 1))
+                self.tracer.start_span('model.time_to_first_token', model_span, model_span.start_ns).end(first_token_ns)
+                self.tracer.start_span('model.generation', model_span, first_token_ns).end(end_ns)
+            model_span.end(end_ns)
+
+    async def structured_output(self, output_model: Type[T], prompt, system_prompt=None,
+                                **kwargs: Any) -> AsyncGenerator[Dict[str, Union[T, Any]], None]:
+        """Get structured output, recording the call as one span."""
+        # Not made the active span: an async generator shares its caller's context
+        model_span = self.tracer.start_span('model.structured_output', model_id=self._model_id())
+        try:
+            async for event in self.model.structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs):
+                yield event
+        except BaseException as e:
+            model_span.set_error(e)
+            raise
+        finally:
+            model_span.end()
+
+
+class TraceRecorder:
+    """
+    Hook provider that records spans for agent invocations and tool calls.
+
+    Implements the strands HookProvider protocol without subclassing it, so
+    this module can be imported without strands. Model calls are traced by
+    the TracedModel from trace_model(), which agents wrap their model in when
+    they are built.
+    """
+
+    def __init__(self, agent_name: str, tracer: Tracer):
+        self.agent_name = agent_name
+        self.tracer = tracer
+        self._invocations: Dict[int, tuple] = {}
+        self._tools: Dict[str, tuple] = {}
+
+    def register_hooks(self, registry: 'HookRegistry', **kwargs: Any) -> None:
+        """Register the invocation and tool hooks."""
+        from strands.hooks import BeforeInvocationEvent, AfterInvocationEvent
+        from strands.experimental.hooks import BeforeToolInvocationEvent, AfterToolInvocationEvent
+        registry.add_callback(BeforeInvocationEvent, self.before_invocation)
+        registry.add_callback(AfterInvocationEvent, self.after_invocation)
+        registry.add_callback(BeforeToolInvocationEvent, self.before_tool)
+        registry.add_callback(AfterToolInvocationEvent, self.after_tool)
+
+    @staticmethod
+    def _activate(span: Span):
+        return span, _current_span.set(span)
+
+    @staticmethod
+    def _deactivate(span: Span, token) -> None:
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            pass
+        span.end()
+
+    def before_invocation(self, event) -> None:
+        """Start the invocation span; model and tool spans become its children."""
+        invocation_span = self.tracer.start_span(f"agent.{self.agent_name}")
+        self._invocations[id(event.agent)] = self._activate(invocation_span)
+
+    def after_invocation(self, event) -> None:
+        """End the invocation span."""
+        entry = self._invocations.pop(id(event.agent), None)
+        if entry is None:
+            return
+        self._deactivate(*entry)
+
+    def before_tool(self, event) -> None:
+        """Start the span of a tool call; spans in the tool become its children."""
+        name = event.tool_use.get('name', 'unknown')
+        tool_span = self.tracer.start_span(f"tool.{name}", tool=name)
+        self._tools[event.tool_use.get('toolUseId', '')] = self._activate(tool_span)
+
+    def after_tool(self, event) -> None:
+        """End the span of a tool call."""
+        entry = self._tools.pop(event.tool_use.get('toolUseId', ''), None)
+        if entry is None:
+            return
+        tool_span, token = entry
+        if event.exception is not None:
+            tool_span.set_error(event.exception)
+        elif isinstance(event.result, dict) and event.result.get('status') == 'error':
+            tool_span.set_error('tool returned an error')
+        self._deactivate(tool_span, token)
+
+
+def trace_model(model: Any) -> Any:
+    """
+    Wrap an agent's model so each model call is traced (if tracing is on).
+
+    Agents wrap their model once when they are built; trace_hooks() traces
+    the invocations and tool calls.
+    """
+    tracer = _tracer
+    if tracer is None or isinstance(model, TracedModel):
+        return model
+    return TracedModel(model, tracer)
+
+
+def trace_hooks(agent_name: str) -> List['HookProvider']:
+    """
+    Get the hooks that trace an agent's invocations, tool calls and model calls.
+
+    Returns an empty list when tracing is off.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return []
+    return [TraceRecorder(agent_name, tracer)]
@@ -0,0 +1,290 @@
+"""
+Persistent usage and latency ledger for Strands Analyst.
+
+Every agent invocation appends one compact record to a local SQLite database:
+agent, model, input/output/cache tokens, estimated cost, wall time, model
+latency, cycles and time per tool. Records are queued and written in batches
+by a background thread, so the request path only pays for a queue put.
+
+Agents opt in with hooks=usage_hooks('<agent name>'). Recording is controlled
+by bedrock.cost_optimization.track_usage. The `analyst usage` command reports
+on the ledger.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config import get_config
+
+if TYPE_CHECKING:
+    # The ledger itself does not need strands, so `analyst usage` starts fast
+    from strands.hooks import HookProvider, HookRegistry, BeforeInvocationEvent, AfterInvocationEvent
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    ts REAL NOT NULL,
+    day TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    model TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cache_read_tokens INTEGER NOT NULL,
+    cache_write_tokens INTEGER NOT NULL,
+    cost REAL NOT NULL,
+    wall_ms REAL NOT NULL,
+    model_latency_ms REAL NOT NULL,
+    cycles INTEGER NOT NULL,
+    error INTEGER NOT NULL,
+    tools TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS usage_ts ON usage (ts);
+"""
+
+_COLUMNS = ('ts', 'day', 'agent', 'model', 'input_tokens', 'output_tokens', 'cache_read_tokens',
+            'cache_write_tokens', 'cost', 'wall_ms', 'model_latency_ms', 'cycles', 'error', 'tools')
+
+
+@dataclass
+class UsageRecord:
+    """One agent invocation in the ledger."""
+    agent: str
+    model: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost: float = 0.0
+    wall_ms: float = 0.0
+    model_latency_ms: float = 0.0
+    cycles: int = 0
+    error: bool = False
+    tools: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    ts: float = field(default_factory=time.time)
+
+    def to_row(self) -> Tuple:
+        """Convert to a row in _COLUMNS order."""
+        values = asdict(self)
+        values['day'] = time.strftime('%Y-%m-%d', time.localtime(self.ts))
+        values['error'] = int(self.error)
+        values['tools'] = json.dumps(self.tools, separators=(',', ':'))
+        return tuple(values[column] for column in _COLUMNS)
+
+
+class UsageLedger:
+    """
+    SQLite ledger written in batches by a background thread.
+
+    record() only puts the record on a queue. The writer thread commits
+    batches of up to batch_size records, or whatever has arrived after
+    flush_interval seconds, in a single transaction.
+    """
+
+    def __init__(self, path: str, batch_size: int = 50, flush_interval: float = 5.0):
+        """
+        Initialize the ledger.
+
+        Args:
+            path: SQLite database file
+            batch_size: Records written per transaction at most
+            flush_interval: Seconds a record may wait before it is written
+        """
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue[Optional[UsageRecord]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open the database, creating the table if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path))
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def record(self, record: UsageRecord) -> None:
+        """Queue a record for writing."""
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="usage-ledger", daemon=True)
+                self._writer.start()
+                atexit.register(self.close)
+        self._queue.put(record)
+
+    def _run(self) -> None:
+        """Writer thread: collect records into batches and commit them."""
+        try:
+            connection = self.connect()
+        except sqlite3.Error as e:
+            logger.warning(f"Usage ledger disabled, could not open {self.path}: {e}")
+            return
+
+        stop = False
+        while not stop:
+            batch: List[UsageRecord] = []
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch:
+                try:
+                    with connection:
+                        connection.executemany(
+                            f"INSERT INTO usage ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                            [record.to_row() for record in batch]
+                        )
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not write {len(batch)} usage records to {self.path}: {e}")
+        connection.close()
+
+    def close(self) -> None:
+        """Write the queued records and stop the writer thread."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join(timeout=10)
+
+    def query(self, since: Optional[float] = None) -> Iterable[sqlite3.Row]:
+        """Read records, optionally only those after the since timestamp."""
+        if not self.path.is_file():
+            return []
+        connection = self.connect()
+        connection.row_factory = sqlite3.Row
+        try:
+            return connection.execute("SELECT * FROM usage WHERE ts >= ? ORDER BY ts", (since or 0,)).fetchall()
+        finally:
+            connection.close()
+
+
+def _snapshot(agent) -> Dict[str, Any]:
+    """Copy the cumulative metrics of an agent."""
+    metrics = agent.event_loop_metrics
+    return {
+        'usage': dict(metrics.accumulated_usage),
+        'latency_ms': metrics.accumulated_metrics.get('latencyMs', 0),
+        'cycles': metrics.cycle_count,
+        'tools': {name: (tool.call_count, tool.total_time) for name, tool in metrics.tool_metrics.items()},
+        'started': time.perf_counter()
+    }
+
+
+class UsageRecorder:
+    """
+    Hook provider that turns each invocation of an agent into a UsageRecord.
+
+    Implements the strands HookProvider protocol without subclassing it, so
+    this module can be imported without strands.
+
+    Agent metrics are cumulative, so the recorder snapshots them before the
+    invocation and records the difference afterwards. Snapshots are kept per
+    agent object, which keeps concurrent per-request views of one agent apart.
+    """
+
+    def __init__(self, agent_name: str, ledger: UsageLedger, pricing: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.agent_name = agent_name
+        self.ledger = ledger
+        self.pricing = pricing
+        self._snapshots: Dict[int, Dict[str, Any]] = {}
+
+    def register_hooks(self, registry: 'HookRegistry', **kwargs: Any) -> None:
+        """Register the invocation hooks."""
+        from strands.hooks import BeforeInvocationEvent, AfterInvocationEvent
+        registry.add_callback(BeforeInvocationEvent, self.before_invocation)
+        registry.add_callback(AfterInvocationEvent, self.after_invocation)
+
+    def before_invocation(self, event: 'BeforeInvocationEvent') -> None:
+        """Snapshot the agent's metrics."""
+        self._snapshots[id(event.agent)] = _snapshot(event.agent)
+
+    def after_invocation(self, event: 'AfterInvocationEvent') -> None:
+        """Record the metrics of the invocation that just finished."""
+        before = self._snapshots.pop(id(event.agent), None)
+        if before is None:
+            return
+        try:
+            from .rate_limiter import estimate_cost
+            after = _snapshot(event.agent)
+            usage = {key: after['usage'].get(key, 0) - before['usage'].get(key, 0) for key in after['usage']}
+            model_config = getattr(event.agent.model, 'config', None) or {}
+            model_id = model_config.get('model_id', 'unknown') if isinstance(model_config, dict) else 'unknown'
+
+            tools = {}
+            for name, (calls, total_time) in after['tools'].items():
+                prev_calls, prev_time = before['tools'].get(name, (0, 0.0))
+                if calls > prev_calls:
+                    tools[name] = {'calls': calls - prev_calls, 'seconds': round(total_time - prev_time, 3)}
+
+            # The last message is the assistant's answer unless the invocation failed
+            messages = event.agent.messages
+            error = not messages or messages[-1].get('role') != 'assistant'
+
+            self.ledger.record(UsageRecord(
+                agent=self.agent_name,
+                model=model_id,
+                input_tokens=usage.get('inputTokens', 0),
+                output_tokens=usage.get('outputTokens', 0),
+                cache_read_tokens=usage.get('cacheReadInputTokens', 0),
+                cache_write_tokens=usage.get('cacheWriteInputTokens', 0),
+                cost=estimate_cost(model_id, usage, self.pricing),
+                wall_ms=round((after['started'] - before['started']) * 1000, 1),
+                model_latency_ms=after['latency_ms'] - before['latency_ms'],
+                cycles=after['cycles'] - before['cycles'],
+                error=error,
+                tools=tools
+            ))
+        except Exception as e:
+            logger.debug(f"Could not record usage for {self.agent_name}: {e}")
+
+
+# Global ledger shared by all agents
+_usage_ledger: Optional[UsageLedger] = None
+_usage_ledger_lock = threading.Lock()
+
+
+def get_usage_ledger() -> UsageLedger:
+    """Get the shared usage ledger."""
+    global _usage_ledger
+    with _usage_ledger_lock:
+        if _usage_ledger is None:
+            config = get_config()
+            _usage_ledger = UsageLedger(
+                config.get_usage_ledger_file(),
+                batch_size=config.get_usage_ledger_batch_size(),
+                flush_interval=config.get_usage_ledger_flush_interval()
+            )
+    return _usage_ledger
+
+
+def usage_hooks(agent_name: str) -> List['HookProvider']:
+    """
+    Get the hooks that record an agent's invocations in the usage ledger.
+
+    Returns an empty list when bedrock.cost_optimization.track_usage is off.
+    """
+    config = get_config()
+    if not config.get_bedrock_track_usage():
+        return []
+    from .rate_limiter import get_pricing
+    return [UsageRecorder(agent_name, get_usage_ledger(), get_pricing())]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Simulation of hedged and failover model requests.
+
+Runs requests against local stand-in models that simulate time to first
+token, tail latency and throttling, once with the primary alone and once
+through HedgedModel with a secondary, and compares latency percentiles and
+failures. No network access or credentials are needed.
+
+Usage:
+    python bench_hedging.py [--requests N] [--hedge-after-ms MS]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the analyst package to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from strands.models import Model
+from strands.types.exceptions import ModelThrottledException
+
+from analyst.utils.hedged_model import HedgedModel
+
+
+class SimulatedModel(Model):
+    """Stand-in model with configurable first-token latency, tail and throttling."""
+
+    def __init__(self, name: str, ttft_ms: float, tail_ms: float, tail_rate: float,
+                 throttle_rate: float, seed: int):
+        self.config = {"model_id": name}
+        self.ttft_ms = ttft_ms
+        self.tail_ms = tail_ms
+        self.tail_rate = tail_rate
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+
+    def update_config(self, **model_config):
+        self.config.update(model_config)
+
+    def get_config(self):
+        return self.config
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        raise NotImplementedError
+        yield
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        if self.random.random() < self.throttle_rate:
+            await asyncio.sleep(0.005)
+            raise ModelThrottledException("ThrottlingException: Too many requests")
+        delay = self.tail_ms if self.random.random() < self.tail_rate else self.ttft_ms
+        await asyncio.sleep(delay * self.random.uniform(0.8, 1.2) / 1000)
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockDelta": {"delta": {"text": self.config["model_id"]}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+
+async def first_token_ms(model: Model):
+    """Return the time to first event in milliseconds, or None if the request failed."""
+    start = time.perf_counter()
+    try:
+        async for _ in model.stream([{"role": "user", "content": [{"text": "hi"}]}]):
+            return (time.perf_counter() - start) * 1000
+    except ModelThrottledException:
+        return None
+
+
+async def run(model: Model, requests: int, concurrency: int = 20):
+    """Send requests with bounded concurrency and return the first-token latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            return await first_token_ms(model)
+
+    return await asyncio.gather(*[one() for _ in range(requests)])
+
+
+def report(label: str, results) -> None:
+    """Print percentiles and failure count."""
+    latencies = sorted(r for r in results if r is not None)
+    failures = len(results) - len(latencies)
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else float('nan')
+
+    print(f"{label:<22}{pct(0.5):>8.0f}{pct(0.95):>8.0f}{pct(0.99):>8.0f}{failures:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate hedged and failover model requests")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per run")
+    parser.add_argument("--hedge-after-ms", type=float, default=300, help="Hedge delay upper bound")
+    args = parser.parse_args()
+
+    def primary(seed):
+        # 150ms normally, 10% of requests stall for 1.5s, 5% are throttled
+        return SimulatedModel("primary", ttft_ms=150, tail_ms=1500, tail_rate=0.10, throttle_rate=0.05, seed=seed)
+
+    def secondary(seed):
+        return SimulatedModel("secondary", ttft_ms=250, tail_ms=1500, tail_rate=0.02, throttle_rate=0.0, seed=seed)
+
+    print(f"{'Policy':<22}{'p50':>8}{'p95':>8}{'p99':>8}{'failures':>10}   (ms to first token)")
+    report("primary only", asyncio.run(run(primary(1), args.requests)))
+
+    hedged = HedgedModel(primary(1), [secondary(2)], hedge_after_ms=args.hedge_after_ms)
+    report("hedged + failover", asyncio.run(run(hedged, args.requests)))
+    print(f"\nHedged model stats: {hedged.get_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
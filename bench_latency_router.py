@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Offline replay of the latency-aware model router.
+
+Replays recorded request observations (JSON lines with model_key, complexity,
+latency_ms, ttft_ms, output_tokens, error) through LatencyRouter and reports
+which model each complexity class was routed to. Without --trace, a synthetic
+day is generated in which the reasoning model's latency doubles during peak
+hours, to check that complex traffic moves to another model and comes back.
+
+Usage:
+    python bench_latency_router.py [--trace observations.jsonl]
+"""
+
+import argparse
+import json
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add the analyst package to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analyst.config import get_bedrock_latency_routing_config
+from analyst.utils.latency_router import LatencyRouter, LatencyObservation
+
+PREFERRED = {'simple': 'fast', 'moderate': 'chat', 'complex': 'reasoning', 'reasoning': 'reasoning'}
+
+# Typical time to first token per model key in milliseconds
+BASE_TTFT_MS = {'fast': 600, 'chat': 1500, 'reasoning': 4500}
+
+
+def synthetic_day(requests_per_phase: int = 300, seed: int = 7):
+    """Yield (phase, observation) for off-peak, peak (reasoning 2x slower) and off-peak again."""
+    rng = random.Random(seed)
+    for phase, slowdown in (("off-peak", 1.0), ("peak", 2.0), ("recovered", 1.0)):
+        for _ in range(requests_per_phase):
+            complexity = rng.choice(['simple', 'moderate', 'complex', 'reasoning'])
+            yield phase, complexity, slowdown, rng
+
+
+def run_synthetic(router: LatencyRouter) -> None:
+    """Route a synthetic day and print the model share per phase for complex work."""
+    shares = {}
+    for phase, complexity, slowdown, rng in synthetic_day():
+        key, reason = router.choose(complexity, PREFERRED[complexity], BASE_TTFT_MS)
+        ttft = BASE_TTFT_MS[key] * (slowdown if key == 'reasoning' else 1.0) * rng.uniform(0.8, 1.2)
+        router.record(LatencyObservation(model_key=key, complexity=complexity,
+                                         latency_ms=ttft * 4, ttft_ms=ttft, output_tokens=400))
+        if complexity in ('complex', 'reasoning'):
+            shares.setdefault(phase, Counter())[key] += 1
+
+    print("Complex/reasoning requests routed per model:")
+    for phase, counts in shares.items():
+        total = sum(counts.values())
+        summary = ", ".join(f"{key} {count / total:.0%}" for key, count in counts.most_common())
+        print(f"  {phase:<10} {summary}")
+
+
+def run_trace(router: LatencyRouter, trace_file: Path) -> None:
+    """Replay a recorded trace and print routing decisions per complexity class."""
+    observations = [json.loads(line) for line in trace_file.read_text().splitlines() if line.strip()]
+    decisions = router.replay(observations, lambda complexity: PREFERRED.get(complexity, 'chat'))
+
+    counts = Counter((complexity, key) for complexity, key, _ in decisions)
+    shifted = sum(1 for complexity, key, _ in decisions if key != PREFERRED.get(complexity, 'chat'))
+    print(f"Replayed {len(decisions)} observations, {shifted} routed away from the preferred model")
+    for (complexity, key), count in sorted(counts.items()):
+        print(f"  {complexity:<10} -> {key:<10} {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay the latency-aware model router offline")
+    parser.add_argument("--trace", type=Path, help="JSON lines file of recorded observations")
+    args = parser.parse_args()
+
+    routing_config = get_bedrock_latency_routing_config()
+    router = LatencyRouter(
+        slo_ms=routing_config['slo_ms'],
+        ewma_alpha=routing_config['ewma_alpha'],
+        min_samples=routing_config['min_samples'],
+        max_error_rate=routing_config['max_error_rate'],
+        probe_interval=routing_config['probe_interval']
+    )
+
+    if args.trace:
+        run_trace(router, args.trace)
+    else:
+        run_synthetic(router)
+
+    print("\nLearned statistics:")
+    for key, stats in sorted(router.get_stats().items()):
+        print(f"  {key:<10} ttft {stats.response_ms:7.0f}ms  {stats.output_tps:6.1f} tok/s  "
+              f"errors {stats.error_rate:.0%}  ({stats.samples} samples)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
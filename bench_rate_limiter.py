@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Simulation of batch throughput with and without the adaptive rate limiter.
+
+Runs a batch of requests against a local stand-in model that throttles any
+request beyond a fixed account concurrency, once with blind retries (fixed
+backoff) and once through RateLimitedModel, whose shared cool-down replaces
+the fixed backoff, and compares wall time, throttled attempts and failures. No network access or credentials are needed.
+
+Usage:
+    python bench_rate_limiter.py [--requests N] [--capacity N] [--workers N]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add the analyst package to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from strands.models import Model
+from strands.types.exceptions import ModelThrottledException
+
+from analyst.utils.rate_limiter import AdaptiveRateLimiter, RateLimitedModel
+
+
+class CapacityModel(Model):
+    """Stand-in model that throttles requests beyond a fixed number in flight."""
+
+    def __init__(self, capacity: int, latency_ms: float = 50):
+        self.config = {"model_id": "claude-3-5-haiku"}
+        self.capacity = capacity
+        self.latency_ms = latency_ms
+        self.in_flight = 0
+        self.throttled = 0
+
+    def update_config(self, **model_config):
+        self.config.update(model_config)
+
+    def get_config(self):
+        return self.config
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        raise NotImplementedError
+        yield
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        if self.in_flight >= self.capacity:
+            self.throttled += 1
+            await asyncio.sleep(0.005)
+            raise ModelThrottledException("ThrottlingException: Too many requests")
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.latency_ms / 1000)
+            yield {"messageStart": {"role": "assistant"}}
+            yield {"metadata": {"usage": {"inputTokens": 500, "outputTokens": 100, "totalTokens": 600},
+                                "metrics": {"latencyMs": self.latency_ms}}}
+        finally:
+            self.in_flight -= 1
+
+
+async def call(model: Model, retries: int, backoff_s: float) -> bool:
+    """Send one request, retrying throttled attempts after a fixed backoff."""
+    for _ in range(retries + 1):
+        try:
+            async for _ in model.stream([{"role": "user", "content": [{"text": "hi"}]}]):
+                pass
+            return True
+        except ModelThrottledException:
+            await asyncio.sleep(backoff_s)
+    return False
+
+
+async def run(model: Model, requests: int, workers: int, retries: int, backoff_s: float):
+    """Run the batch with a fixed number of workers and return (seconds, successes)."""
+    semaphore = asyncio.Semaphore(workers)
+
+    async def one():
+        async with semaphore:
+            return await call(model, retries, backoff_s)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[one() for _ in range(requests)])
+    return time.perf_counter() - start, sum(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate batch throughput with the adaptive rate limiter")
+    parser.add_argument("--requests", type=int, default=400, help="Requests in the batch")
+    parser.add_argument("--capacity", type=int, default=6, help="Concurrent requests the account allows")
+    parser.add_argument("--workers", type=int, default=32, help="Concurrent workers in the batch job")
+    args = parser.parse_args()
+
+    print(f"{'Policy':<22}{'seconds':>9}{'req/s':>8}{'throttled':>11}{'failed':>8}")
+
+    blind = CapacityModel(args.capacity)
+    seconds, ok = asyncio.run(run(blind, args.requests, args.workers, retries=3, backoff_s=0.1))
+    print(f"{'blind retries':<22}{seconds:>9.2f}{ok / seconds:>8.1f}{blind.throttled:>11}{args.requests - ok:>8}")
+
+    # Cool-down scaled to the stand-in's 50ms calls (the 1s default suits real model latency)
+    limiter = AdaptiveRateLimiter(initial_concurrency=4, max_concurrency=args.workers, throttle_cooldown=0.05)
+    model = CapacityModel(args.capacity)
+    limited = RateLimitedModel(model, limiter)
+    # Throttled calls are retried by the caller (the Strands event loop in an agent)
+    seconds, ok = asyncio.run(run(limited, args.requests, args.workers, retries=3, backoff_s=0))
+    print(f"{'adaptive limiter':<22}{seconds:>9.2f}{ok / seconds:>8.1f}{model.throttled:>11}{args.requests - ok:>8}")
+    print(f"\nLimiter stats: {limiter.get_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Simulation of multi-region Bedrock routing.
+
+Drives RegionRouter with stand-in regional endpoints instead of Bedrock: each
+region has a base time to first token, and during the run the fastest region
+first slows down and then fails. The output shows which region new requests
+are routed to in each phase, and that a sticky chat session only moves when
+its region fails. No network access or credentials are needed.
+
+Usage:
+    python bench_region_router.py [--probes N]
+"""
+
+import argparse
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add the analyst package to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analyst.utils.region_router import RegionRouter
+
+
+class StandInEndpoints:
+    """Regional endpoints with configurable time to first token and outages."""
+
+    def __init__(self, ttft_ms, seed: int = 3):
+        self.ttft_ms = dict(ttft_ms)
+        self.down = set()
+        self.random = random.Random(seed)
+
+    def probe(self, region: str) -> float:
+        if region in self.down:
+            raise ConnectionError(f"{region} unavailable")
+        return self.ttft_ms[region] * self.random.uniform(0.9, 1.1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate multi-region Bedrock routing with stand-in endpoints")
+    parser.add_argument("--probes", type=int, default=10, help="Probe rounds per phase")
+    args = parser.parse_args()
+
+    # A user in Europe: eu-central-1 is closest, us-east-1 is preferred by configuration order
+    endpoints = StandInEndpoints({"us-east-1": 420, "us-west-2": 510, "eu-central-1": 180})
+    router = RegionRouter(["us-east-1", "us-west-2", "eu-central-1"], probe=endpoints.probe)
+
+    phases = [
+        ("normal", lambda: None),
+        ("eu slow", lambda: endpoints.ttft_ms.update({"eu-central-1": 700})),
+        ("eu down", lambda: endpoints.down.add("eu-central-1")),
+        ("recovered", lambda: (endpoints.down.clear(), endpoints.ttft_ms.update({"eu-central-1": 180}))),
+    ]
+
+    session = "chat-session-1"
+    print(f"{'Phase':<12}{'new requests':<34}{'chat session':<16}")
+    for phase, change in phases:
+        change()
+        choices = Counter()
+        for _ in range(args.probes):
+            router.probe_once()
+            for _ in range(10):
+                choices[router.best_region()] += 1
+        routed = ", ".join(f"{region} {count}" for region, count in choices.most_common())
+        print(f"{phase:<12}{routed:<34}{router.region_for_session(session):<16}")
+
+    print("\nRegion statistics:")
+    for region, stats in router.get_stats().items():
+        print(f"  {region:<14} ttft {stats.ttft_ms:6.0f}ms  ({stats.samples} samples, "
+              f"{stats.consecutive_failures} consecutive failures)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
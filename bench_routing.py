@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for task complexity routing.
+
+Compares the per-pattern re.findall classifier that dynamic model selection
+used before with the compiled single-pass classifier and its LRU memo, and
+checks that both classifiers produce the same complexity and scores.
+
+Usage:
+    python bench_routing.py [--iterations N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add the analyst package to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analyst.utils.dynamic_model_config import DynamicModelConfigManager, TaskComplexity
+
+
+MESSAGES = [
+    "Hello, how are you?",
+    "What's 2+2?",
+    "Can you help me write a Python script to analyze sales data?",
+    "Summarize https://example.com/article and compare it with yesterday's news",
+    "I need a comprehensive architecture design for a scalable microservices system with advanced monitoring and security",
+    "Please analyze the philosophical implications of artificial intelligence and provide reasoning about ethical considerations",
+    "Why does my SQL query time out? Can you debug it? What indexes help? Is the plan wrong?",
+    " ".join(["Walk through the research plan step by step and explain why each multi-step workflow matters."] * 12),
+]
+
+
+def legacy_analyze(patterns, text):
+    """Classifier as it was before compilation: one re.findall per pattern."""
+    if not text:
+        return TaskComplexity.SIMPLE, {c.value: 0 for c in TaskComplexity}
+
+    text_lower = text.lower()
+    scores = {complexity: 0 for complexity in TaskComplexity}
+    for complexity, level_patterns in patterns.items():
+        for pattern in level_patterns:
+            scores[complexity] += len(re.findall(pattern, text_lower))
+
+    word_count = len(text.split())
+    if word_count > 100:
+        scores[TaskComplexity.COMPLEX] += 2
+    elif word_count > 50:
+        scores[TaskComplexity.MODERATE] += 1
+    if any(keyword in text_lower for keyword in ['code', 'python', 'javascript', 'sql', 'algorithm']):
+        scores[TaskComplexity.REASONING] += 1
+    if text.count('?') > 2:
+        scores[TaskComplexity.COMPLEX] += 1
+
+    best = max(scores, key=scores.get)
+    result = best if scores[best] else TaskComplexity.MODERATE
+    return result, {c.value: s for c, s in scores.items()}
+
+
+def per_message_us(statement, iterations):
+    """Return the best average time per message in microseconds."""
+    runs = timeit.repeat(statement, number=iterations, repeat=5)
+    return min(runs) / (iterations * len(MESSAGES)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark task complexity routing")
+    parser.add_argument("--iterations", type=int, default=2000, help="Passes over the sample messages per run")
+    args = parser.parse_args()
+
+    manager = DynamicModelConfigManager()
+    patterns = manager._complexity_patterns
+
+    # The compiled classifier must agree with the per-pattern one
+    for message in MESSAGES:
+        expected = legacy_analyze(patterns, message)
+        complexity, scores = manager._classify(message)
+        if (complexity, dict(scores)) != expected:
+            print(f"❌ Mismatch for {message[:50]!r}: {complexity}, {dict(scores)} != {expected}")
+            return 1
+    print(f"✅ Compiled classifier matches per-pattern results on {len(MESSAGES)} messages")
+
+    legacy = per_message_us(lambda: [legacy_analyze(patterns, m) for m in MESSAGES], args.iterations)
+    compiled = per_message_us(lambda: [manager._classify(m) for m in MESSAGES], args.iterations)
+    routed = per_message_us(lambda: [manager.route(m) for m in MESSAGES], args.iterations)
+
+    print(f"\n{'Classifier':<32}{'µs/message':>12}")
+    print(f"{'per-pattern re.findall':<32}{legacy:>12.2f}")
+    print(f"{'compiled single pass':<32}{compiled:>12.2f}  ({legacy / compiled:.1f}x)")
+    print(f"{'route() with LRU memo':<32}{routed:>12.2f}  ({legacy / routed:.1f}x)")
+    print(f"\nRouting cache: {manager.get_routing_cache_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,14 +18,14 @@ setup(
             "htmlmd=analyst.cli.html_to_markdown:main",
             "analystai=analyst.cli.chat:main",
             "provider-info=analyst.cli.provider_info:main",
+            "analyst=analyst.cli.main:main",
         ],
     },
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Start-up test for the chat agent.
+
+Builds the chat agent from the shipped config.yml, the way `analystai` does
+at start-up, and checks that every enabled tool is registered once. No model
+is called, so no AWS credentials are needed.
+
+Usage:
+    python -m pytest test_chat_agent.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analyst.agents import create_chat_agent
+from analyst.utils.community_tools import load_community_tools
+
+
+def test_chat_agent_from_shipped_config(tmp_path, monkeypatch):
+    """The shipped config builds a chat agent, even when it lists a tool more than once."""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    agent = create_chat_agent(session_dir=str(tmp_path), dynamic_model_selection=False,
+                              use_model_factory=False)
+
+    tool_names = agent.tool_names
+    assert len(tool_names) == len(set(tool_names))
+    assert "stop" in tool_names
+
+
+def test_community_tools_registered_once(tmp_path):
+    """A tool listed more than once in the config gets one proxy."""
+    tools = load_community_tools(["stop", "think", "stop"], str(tmp_path / "community-tools.json"))
+    assert [tool.tool_name for tool in tools].count("stop") == 1
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Import-time budget test for the console scripts.
+
+Runs `<command> --help` for every console script in a fresh interpreter and
+checks that it stays within the startup budget and does not import the model
+SDKs or the heavy tool libraries, which only the commands that run an agent
+should load.
+
+Usage:
+    python -m pytest test_import_budget.py
+    python test_import_budget.py
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Console script -> CLI module (see setup.py)
+CONSOLE_SCRIPTS = {
+    "sitemeta": "analyst.cli.sitemeta",
+    "news": "analyst.cli.news",
+    "article": "analyst.cli.get_article",
+    "htmlmd": "analyst.cli.html_to_markdown",
+    "analystai": "analyst.cli.chat",
+    "provider-info": "analyst.cli.provider_info",
+    "analyst": "analyst.cli.main",
+}
+
+# Seconds from interpreter start-up to the end of `--help`, excluding Python itself
+IMPORT_BUDGET_SECONDS = 0.5
+
+# Modules that `--help` must not import
+HEAVY_MODULES = ("strands", "boto3", "botocore", "bs4", "readability", "markdownify",
+                 "feedparser", "fitz", "pymupdf", "pymupdf4llm", "pydantic", "openai", "anthropic")
+
+_PROBE = """
+import contextlib, io, json, sys, time
+start = time.perf_counter()
+sys.argv = [{script!r}, "--help"]
+import {module} as cli
+try:
+    with contextlib.redirect_stdout(io.StringIO()):
+        cli.main()
+except SystemExit:
+    pass
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "heavy": sorted(name for name in {heavy!r} if name in sys.modules)
+}}))
+"""
+
+
+def measure(script: str, module: str) -> dict:
+    """Run `<script> --help` in a fresh interpreter and return its import time and heavy modules."""
+    code = _PROBE.format(script=script, module=module, heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=Path(__file__).parent, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("script", sorted(CONSOLE_SCRIPTS))
+def test_console_script_import_budget(script):
+    """`--help` stays fast and does not load the agent stack."""
+    # Warm the bytecode cache so the measurement does not include compilation
+    measure(script, CONSOLE_SCRIPTS[script])
+    result = measure(script, CONSOLE_SCRIPTS[script])
+
+    assert result["heavy"] == [], f"{script} --help imported {', '.join(result['heavy'])}"
+    assert result["seconds"] < IMPORT_BUDGET_SECONDS, (
+        f"{script} --help took {result['seconds']:.2f}s (budget {IMPORT_BUDGET_SECONDS}s)")
+
+
+if __name__ == "__main__":
+    for script, module in sorted(CONSOLE_SCRIPTS.items()):
+        result = measure(script, module)
+        heavy = ", ".join(result["heavy"]) or "-"
+        print(f"{script:<15}{result['seconds'] * 1000:>8.0f}ms   heavy imports: {heavy}")